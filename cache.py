@@ -0,0 +1,186 @@
+"""
+회사 용어 위키 - 캐시
+데이터 버전 카운터와 프로세스 내 조회 결과 캐시
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+# 데이터 종류별 버전 (쓰기 경로에서 bump, 캐시 항목은 만들 때의 버전을 기억)
+_versions: Dict[str, int] = {}
+_versions_lock = threading.Lock()
+
+
+def version(domain: str) -> int:
+    """데이터 종류의 현재 버전"""
+    with _versions_lock:
+        return _versions.get(domain, 0)
+
+
+def bump(*domains: str):
+    """데이터 변경 알림 (커밋 후 호출, 해당 종류의 캐시 항목이 모두 무효화됨)"""
+    with _versions_lock:
+        for domain in domains:
+            _versions[domain] = _versions.get(domain, 0) + 1
+
+
+def bump_all():
+    """모든 데이터 종류의 변경 알림 (다른 연결의 커밋처럼 무엇이 바뀌었는지 모를 때)"""
+    with _versions_lock:
+        for domain in set(_versions) | {instance.domain for instance in list(_caches)}:
+            _versions[domain] = _versions.get(domain, 0) + 1
+
+
+# 만들어진 캐시 (DB 연결을 모두 닫을 때 clear_all()로 함께 비움)
+_caches: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def clear_all():
+    """모든 캐시 비우기 (DB 파일이나 프로파일이 바뀌어 이전 항목을 믿을 수 없을 때)"""
+    for instance in list(_caches):
+        instance.clear()
+
+
+class VersionedCache:
+    """데이터 버전이 바뀌었을 때만 loader로 다시 읽는 값 캐시"""
+    
+    def __init__(self, domain: str, loader: Callable[[], Any]):
+        self.domain = domain
+        self.loader = loader
+        self._value = None
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+        _caches.add(self)
+    
+    def get(self) -> Any:
+        """현재 버전의 값 (바뀌었으면 다시 읽음)"""
+        with self._lock:
+            # 읽는 도중 bump되면 다음 호출에서 다시 읽도록 버전을 먼저 확인
+            current = version(self.domain)
+            if self._version != current:
+                self._value = self.loader()
+                self._version = current
+            return self._value
+    
+    def clear(self):
+        """다음 get()에서 다시 읽도록 비움"""
+        with self._lock:
+            self._value = None
+            self._version = None
+
+
+class LRUCache:
+    """최근 사용 순으로 max_entries개까지 보관하는 키-값 캐시
+    
+    항목마다 저장 시점의 데이터 버전을 기억하고, 버전이 바뀐 항목은 없는 것으로 본다.
+    """
+    
+    def __init__(self, domain: str, max_entries: int):
+        self.domain = domain
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+    
+    def get(self, key: Hashable) -> Any:
+        """현재 버전의 값 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != version(self.domain):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def put(self, key: Hashable, value: Any, version_at_read: int):
+        """값 저장 (version_at_read: 값을 읽기 직전에 확인한 버전)"""
+        with self._lock:
+            self._entries[key] = (version_at_read, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """전체 항목 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+
+class SearchCache:
+    """검색 결과 캐시
+    
+    (범위, 검색어)별 결과 ID 목록을 최근 사용 순으로 max_entries개까지 보관한다.
+    결과가 작으면 항목별 검색 대상 문자열(haystack)도 함께 보관해, 이전 검색어를
+    포함하는 새 검색어의 결과를 DB 조회 없이 메모리에서 걸러낸다.
+    """
+    
+    def __init__(self, domain: str, max_entries: int = 32):
+        self.domain = domain
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+    
+    def get(self, scope: Hashable, query: str) -> Optional[List[int]]:
+        """같은 검색어의 결과 (백스페이스로 이전 검색어로 돌아간 경우 포함)"""
+        with self._lock:
+            entry = self._current(scope, query)
+            return list(entry[1]) if entry else None
+    
+    def narrow(self, scope: Hashable, query: str) -> Optional[List[int]]:
+        """query에 포함되는 이전 검색어 결과를 메모리에서 걸러 반환 (불가능하면 None)
+        
+        query의 부분 문자열이면서 haystack이 있는 이전 검색어 중 가장 긴 것을 기준으로 한다.
+        """
+        with self._lock:
+            current = version(self.domain)
+            base = None
+            for (entry_scope, entry_query), entry in self._entries.items():
+                if (entry_scope != scope or entry[0] != current or entry[2] is None
+                        or entry_query not in query):
+                    continue
+                if base is None or len(entry_query) > len(base[0]):
+                    base = (entry_query, entry)
+            if base is None:
+                return None
+            
+            _, ids, haystacks = base[1]
+            narrowed = [term_id for term_id in ids if query in haystacks[term_id]]
+            self._put(scope, query, (current, narrowed,
+                                     {term_id: haystacks[term_id] for term_id in narrowed}))
+            return list(narrowed)
+    
+    def put(self, scope: Hashable, query: str, version_at_query: int, ids: List[int],
+            haystacks: Optional[Dict[int, str]] = None):
+        """조회 결과 저장 (version_at_query: 조회 직전에 읽은 버전)"""
+        with self._lock:
+            self._put(scope, query, (version_at_query, list(ids), haystacks))
+    
+    def clear(self):
+        """전체 항목 삭제"""
+        with self._lock:
+            self._entries.clear()
+    
+    def _current(self, scope: Hashable, query: str) -> Optional[Tuple[int, List[int], Optional[Dict[int, str]]]]:
+        """현재 버전의 항목 (최근 사용으로 갱신)"""
+        key = (scope, query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] != version(self.domain):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+    
+    def _put(self, scope: Hashable, query: str, entry: tuple):
+        """항목 저장 후 오래된 항목 제거"""
+        self._entries[(scope, query)] = entry
+        self._entries.move_to_end((scope, query))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
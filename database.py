@@ -1,11 +1,74 @@
 """
 회사 용어 위키 - 데이터베이스 모듈
-SQLite 연결 및 테이블 초기화
+SQLite 연결 풀, PRAGMA 설정 및 스키마 초기화
 """
 
 import sqlite3
 import os
+import queue
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import cache
+import search_index
+from migrations import (
+    SCHEMA_VERSION, ProgressCallback, print_progress, run_migrations,
+    insert_sample_data as _insert_sample_data,
+)
+
+
+# 동시에 열어 둘 수 있는 최대 연결 수
+POOL_SIZE = 8
+
+# 필요한 최소 SQLite 버전 (검색 인덱스의 FTS5 trigram 토크나이저는 3.34부터 지원)
+MIN_SQLITE_VERSION = (3, 34, 0)
+
+# PRAGMA 성능 프로파일
+# - default: 로컬 디스크용. WAL로 읽기가 쓰기에 막히지 않음
+# - network: 네트워크 공유 폴더용. WAL/mmap은 공유 메모리가 필요하므로 사용하지 않음
+# - compat: SQLite 기본값에 가까운 설정
+PRAGMA_PROFILES = {
+    'default': {
+        'journal_mode': 'wal',
+        'busy_timeout': 5000,
+        'synchronous': 'normal',
+        'cache_size': -16000,       # KiB 단위 (약 16MB)
+        'mmap_size': 64 * 1024 * 1024,
+        'temp_store': 'memory',
+    },
+    'network': {
+        'journal_mode': 'delete',
+        'busy_timeout': 15000,
+        'synchronous': 'full',
+        'cache_size': -16000,
+        'mmap_size': 0,
+        'temp_store': 'memory',
+    },
+    'compat': {
+        'journal_mode': 'delete',
+        'busy_timeout': 5000,
+        'synchronous': 'full',
+        'cache_size': -2000,
+        'mmap_size': 0,
+        'temp_store': 'default',
+    },
+}
+
+# 허용 값 (문자열 PRAGMA)
+_PRAGMA_CHOICES = {
+    'journal_mode': ('delete', 'truncate', 'persist', 'memory', 'wal', 'off'),
+    'synchronous': ('off', 'normal', 'full', 'extra'),
+    'temp_store': ('default', 'file', 'memory'),
+}
+
+# 정수 PRAGMA의 최솟값 (cache_size는 음수 = KiB 단위)
+_PRAGMA_MIN = {
+    'busy_timeout': 0,
+    'cache_size': None,
+    'mmap_size': 0,
+}
 
 
 def get_db_path() -> Path:
@@ -13,120 +76,366 @@ def get_db_path() -> Path:
     return Path(__file__).parent / "wiki.db"
 
 
+def validate_profile(settings: Dict[str, object]) -> Dict[str, object]:
+    """PRAGMA 설정 검증 후 정규화된 사본 반환 (잘못된 값은 ValueError)"""
+    result = {}
+    for key, value in settings.items():
+        if key in _PRAGMA_CHOICES:
+            value = str(value).lower()
+            if value not in _PRAGMA_CHOICES[key]:
+                raise ValueError(
+                    f"{key} 값이 올바르지 않습니다: {value} "
+                    f"(허용: {', '.join(_PRAGMA_CHOICES[key])})"
+                )
+        elif key in _PRAGMA_MIN:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{key} 값은 정수여야 합니다: {value}") from None
+            minimum = _PRAGMA_MIN[key]
+            if minimum is not None and value < minimum:
+                raise ValueError(f"{key} 값은 {minimum} 이상이어야 합니다: {value}")
+        else:
+            raise ValueError(f"지원하지 않는 PRAGMA 설정입니다: {key}")
+        result[key] = value
+    return result
+
+
+def _load_profile(name: str) -> Dict[str, object]:
+    """이름으로 프로파일을 찾아 검증"""
+    if name not in PRAGMA_PROFILES:
+        raise ValueError(
+            f"알 수 없는 DB 프로파일입니다: {name} "
+            f"(사용 가능: {', '.join(PRAGMA_PROFILES)})"
+        )
+    return validate_profile(PRAGMA_PROFILES[name])
+
+
+# 현재 프로파일 (환경 변수 WIKI_DB_PROFILE로 선택 가능)
+_profile_name = os.environ.get("WIKI_DB_PROFILE", "default")
+_profile = _load_profile(_profile_name)
+
+
+def configure_profile(name: str = "default", **overrides):
+    """PRAGMA 프로파일 선택 (개별 값은 키워드 인자로 덮어쓰기)
+    
+    예: configure_profile('network', busy_timeout=30000)
+    이미 열린 연결은 닫히고, 이후 새 연결부터 적용된다.
+    """
+    global _profile_name, _profile
+    profile = _load_profile(name)
+    profile.update(validate_profile(overrides))
+    _profile_name, _profile = name, profile
+    close_connections()
+
+
 def get_connection() -> sqlite3.Connection:
-    """SQLite 연결 객체 반환"""
-    conn = sqlite3.connect(get_db_path())
+    """새 SQLite 연결 객체 반환
+    
+    일반적인 조회/저장은 풀을 사용하는 connection()/transaction()을 사용한다.
+    """
+    conn = sqlite3.connect(get_db_path(), check_same_thread=False)
     conn.row_factory = sqlite3.Row  # 딕셔너리 스타일 접근 가능
     conn.execute("PRAGMA foreign_keys = ON")  # 외래키 제약 활성화
+    # 1글자 검색용 (LIKE는 ASCII만 대소문자를 무시하므로 색인 검색과 같은 규칙으로 비교)
+    conn.create_function("fold_case", 1, search_index.fold_case, deterministic=True)
+    
+    # 연결 단위 PRAGMA (journal_mode는 DB 파일 단위이므로 apply_profile에서 설정)
+    for key, value in _profile.items():
+        if key != 'journal_mode':
+            conn.execute(f"PRAGMA {key} = {value}")
     return conn
 
 
-def init_database():
-    """데이터베이스 테이블 초기화"""
-    conn = get_connection()
-    cursor = conn.cursor()
+def apply_profile() -> Dict[str, object]:
+    """저널 모드를 설정하고 실제 적용된 PRAGMA 값을 반환
     
-    # 사용자 테이블
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            role TEXT DEFAULT 'user',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # 카테고리 테이블
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS categories (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL,
-            description TEXT,
-            color TEXT DEFAULT '#3498db'
-        )
-    """)
-    
-    # 용어 테이블
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS terms (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            definition TEXT NOT NULL,
-            example TEXT,
-            created_by INTEGER REFERENCES users(id),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # 동의어 테이블
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS synonyms (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
-            synonym_name TEXT NOT NULL
-        )
-    """)
-    
-    # 용어-카테고리 연결 (다대다)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS term_categories (
-            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
-            category_id INTEGER REFERENCES categories(id) ON DELETE CASCADE,
-            PRIMARY KEY (term_id, category_id)
-        )
-    """)
-    
-    # 변경 이력 테이블
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS term_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
-            action_type TEXT NOT NULL,
-            field_name TEXT,
-            old_value TEXT,
-            new_value TEXT,
-            changed_by INTEGER REFERENCES users(id),
-            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    WAL을 쓸 수 없는 파일 시스템이면 SQLite가 기존 모드를 유지하므로,
+    이 경우 'delete' 모드로 전환한다.
+    """
+    with connection() as conn:
+        requested = _profile.get('journal_mode')
+        if requested:
+            mode = conn.execute(f"PRAGMA journal_mode = {requested}").fetchone()[0]
+            if mode.lower() != requested:
+                conn.execute("PRAGMA journal_mode = delete")
+        
+        active = {'profile': _profile_name}
+        for key in ('journal_mode', 'busy_timeout', 'synchronous',
+                    'cache_size', 'mmap_size', 'temp_store'):
+            active[key] = conn.execute(f"PRAGMA {key}").fetchone()[0]
+        return active
+
+
+def describe_profile(active: Dict[str, object]) -> str:
+    """적용된 PRAGMA 값을 한 줄 문자열로 표현"""
+    synchronous = ('off', 'normal', 'full', 'extra')
+    temp_store = ('default', 'file', 'memory')
+    values = dict(active)
+    if isinstance(values.get('synchronous'), int):
+        values['synchronous'] = synchronous[values['synchronous']]
+    if isinstance(values.get('temp_store'), int):
+        values['temp_store'] = temp_store[values['temp_store']]
+    return ", ".join(f"{key}={value}" for key, value in values.items())
+
+
+class ConnectionPool:
+    """스레드별 SQLite 연결 풀
+    
+    연결은 한 번 열어 PRAGMA를 적용한 뒤 계속 재사용한다. 스레드가 연결 범위에
+    들어가면 풀에서 연결 하나를 빌려 스레드에 묶고, 같은 스레드의 중첩된 범위는
+    그 연결(과 진행 중인 트랜잭션)을 그대로 공유한다. 가장 바깥 범위를 벗어나면
+    연결은 풀로 돌아간다. 동시에 사용되는 연결 수는 max_size로 제한된다.
+    """
+    
+    def __init__(self, max_size: int = POOL_SIZE):
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all = []
+        self._data_versions: Dict[int, int] = {}  # 연결별 마지막으로 확인한 PRAGMA data_version
+    
+    def _acquire(self) -> sqlite3.Connection:
+        """풀에서 연결 하나를 빌림 (없으면 새로 생성)"""
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            conn = get_connection()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._all.append(conn)
+        return conn
+    
+    def _release(self, conn: sqlite3.Connection):
+        """연결을 풀로 반환"""
+        if conn.in_transaction:
+            conn.rollback()  # 끝나지 않은 트랜잭션 정리
+        self._idle.put(conn)
+        self._slots.release()
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """현재 스레드의 연결 범위"""
+        local = self._local
+        if getattr(local, 'conn', None) is not None:
+            local.depth += 1
+            try:
+                yield local.conn
+            finally:
+                local.depth -= 1
+            return
+        
+        conn = self._acquire()
+        local.conn = conn
+        local.depth = 1
+        local.in_transaction = False
+        try:
+            yield conn
+        finally:
+            local.conn = None
+            local.depth = 0
+            self._release(conn)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 트랜잭션 범위
+        
+        가장 바깥 범위에서 BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡고, 정상 종료 시
+        커밋, 예외 시 롤백한다. 중첩된 범위는 바깥 트랜잭션에 합류한다.
+        """
+        with self.connection() as conn:
+            local = self._local
+            if local.in_transaction:
+                yield conn
+                return
+            
+            if conn.in_transaction:
+                conn.commit()  # 앞선 조회에서 암묵적으로 시작된 트랜잭션 정리
+            conn.execute("BEGIN IMMEDIATE")
+            local.in_transaction = True
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                local.in_transaction = False
+    
+    def data_version_changed(self, conn: sqlite3.Connection) -> bool:
+        """conn에서 마지막으로 확인한 뒤 다른 연결이 커밋했는지 (처음 확인하는 연결이면 True)
+        
+        PRAGMA data_version은 연결마다 따로 세는 값이라 같은 연결의 이전 값과만 비교한다.
+        """
+        current = conn.execute("PRAGMA data_version").fetchone()[0]
+        previous = self._data_versions.get(id(conn))
+        self._data_versions[id(conn)] = current
+        return previous != current
+    
+    def close_all(self):
+        """열린 연결을 모두 닫음 (풀은 이후 다시 사용할 수 있음)"""
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            conns, self._all = self._all, []
+            self._data_versions.clear()
+        for conn in conns:
+            conn.close()
+
+
+class QueryCancelled(Exception):
+    """진행 중인 조회가 취소됨"""
+
+
+@contextmanager
+def cancellable(conn: sqlite3.Connection, cancel: Optional[threading.Event],
+                interval: int = 1000) -> Iterator[sqlite3.Connection]:
+    """cancel 이벤트가 설정되면 실행 중인 SQL을 중단하는 범위
+    
+    SQLite progress handler가 interval개의 VM 명령마다 이벤트를 확인하고,
+    설정되어 있으면 쿼리를 중단한다. 중단되면 QueryCancelled가 발생한다.
+    """
+    if cancel is None:
+        yield conn
+        return
+    if cancel.is_set():
+        raise QueryCancelled()
+    
+    conn.set_progress_handler(cancel.is_set, interval)
+    try:
+        yield conn
+    except sqlite3.OperationalError as e:
+        if cancel.is_set():
+            raise QueryCancelled() from e
+        raise
+    finally:
+        conn.set_progress_handler(None, 0)
+    
+    if cancel.is_set():
+        raise QueryCancelled()
+
+
+_pool = ConnectionPool()
+
+
+def connection():
+    """풀에서 현재 스레드의 연결을 빌려 쓰는 컨텍스트 매니저"""
+    return _pool.connection()
+
+
+def transaction():
+    """풀 연결에서 쓰기 트랜잭션을 여는 컨텍스트 매니저"""
+    return _pool.transaction()
+
+
+def check_external_changes():
+    """다른 연결이 커밋했으면 (같은 DB 파일을 쓰는 다른 사용자 포함) 모든 캐시 무효화
+    
+    캐시는 이 프로세스의 쓰기 경로에서만 bump되므로, 캐시된 값을 쓰기 전에 호출한다.
+    이 프로세스의 다른 풀 연결이 커밋한 경우에도 무효화되지만 다시 읽을 뿐이다.
+    """
+    with connection() as conn:
+        changed = _pool.data_version_changed(conn)
+    if changed:
+        cache.bump_all()
+
+
+def close_connections():
+    """풀의 모든 연결 닫기 (앱 종료, 프로파일 변경 시)
+    
+    연결을 새로 열면 다른 DB 파일을 볼 수 있으므로 조회 결과 캐시도 함께 비운다.
+    """
+    _pool.close_all()
+    cache.clear_all()
+
+
+def init_database(progress: Optional[ProgressCallback] = print_progress) -> bool:
+    """데이터베이스를 최신 스키마로 맞춤
+    
+    스키마 버전과 저널 모드가 이미 최신이면 헤더만 한 번 읽고 바로 반환한다.
+    (파일 시스템이 요청한 저널 모드를 거부해 대신 쓰는 모드도 최신으로 본다.)
+    그렇지 않으면 대기 중인 마이그레이션을 순서대로 적용한다 (migrations 모듈).
+    변경이 있었으면 True를 반환한다.
+    """
+    if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+        raise RuntimeError(
+            f"SQLite {'.'.join(map(str, MIN_SQLITE_VERSION))} 이상이 필요합니다 "
+            f"(현재 {sqlite3.sqlite_version}). Python을 최신 버전으로 설치해주세요."
         )
-    """)
     
-    # 검색 성능을 위한 인덱스
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_terms_name ON terms(name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_synonyms_name ON synonyms(synonym_name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_term ON term_history(term_id)")
+    with connection() as conn:
+        version, journal_mode = conn.execute("""
+            SELECT (SELECT user_version FROM pragma_user_version),
+                   (SELECT journal_mode FROM pragma_journal_mode)
+        """).fetchone()
+        
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(
+                f"DB 스키마 버전({version})이 앱이 지원하는 버전({SCHEMA_VERSION})보다 높습니다."
+            )
+        
+        wanted_journal = _profile.get('journal_mode')
+        if version == SCHEMA_VERSION and (
+                not wanted_journal or journal_mode == wanted_journal
+                or _journal_fallback(conn, wanted_journal) == journal_mode):
+            print(f"DB 설정: {describe_profile({'profile': _profile_name, 'journal_mode': journal_mode})}")
+            return False
+    
+    active = apply_profile()
     
-    conn.commit()
-    conn.close()
+    if version < SCHEMA_VERSION:
+        with connection() as conn:
+            run_migrations(conn, progress)
+        print(f"데이터베이스 초기화 완료: {get_db_path()}")
     
-    print(f"데이터베이스 초기화 완료: {get_db_path()}")
+    _record_journal_fallback(active)
+    print(f"DB 설정: {describe_profile(active)}")
+    return True
+
+
+# db_settings 키: 요청한 저널 모드를 쓸 수 없어 대신 쓰는 모드 ("요청 모드:대체 모드")
+_JOURNAL_FALLBACK_KEY = 'journal_mode_fallback'
+
+
+def _journal_fallback(conn: sqlite3.Connection, requested: str) -> Optional[str]:
+    """requested 저널 모드 대신 쓰고 있다고 기록된 모드 (없으면 None)"""
+    row = conn.execute(
+        "SELECT value FROM db_settings WHERE key = ?", (_JOURNAL_FALLBACK_KEY,)
+    ).fetchone()
+    if row is None:
+        return None
+    recorded, _, fallback = row[0].partition(':')
+    return fallback if recorded == requested else None
+
+
+def _record_journal_fallback(active: Dict[str, object]):
+    """apply_profile() 결과의 저널 모드가 요청과 다르면 기록 (같으면 기록 삭제)"""
+    requested = _profile.get('journal_mode')
+    if not requested:
+        return
+    with transaction() as conn:
+        if active['journal_mode'] != requested:
+            conn.execute(
+                "INSERT OR REPLACE INTO db_settings (key, value) VALUES (?, ?)",
+                (_JOURNAL_FALLBACK_KEY, f"{requested}:{active['journal_mode']}")
+            )
+        else:
+            conn.execute("DELETE FROM db_settings WHERE key = ?", (_JOURNAL_FALLBACK_KEY,))
 
 
 def insert_sample_data():
     """테스트용 샘플 데이터 삽입"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # 기본 관리자 사용자
-    cursor.execute("""
-        INSERT OR IGNORE INTO users (username, role) VALUES ('admin', 'admin')
-    """)
-    
-    # 샘플 카테고리
-    categories = [
-        ('개발', '개발팀에서 사용하는 기술 용어', '#e74c3c'),
-        ('마케팅', '마케팅/영업 관련 용어', '#2ecc71'),
-        ('재무', '재무/회계 관련 용어', '#f39c12'),
-        ('일반', '공통으로 사용하는 용어', '#3498db'),
-    ]
-    cursor.executemany("""
-        INSERT OR IGNORE INTO categories (name, description, color) VALUES (?, ?, ?)
-    """, categories)
-    
-    conn.commit()
-    conn.close()
-    
-    print("샘플 데이터 삽입 완료")
+    with transaction() as conn:
+        _insert_sample_data(conn.cursor())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+"""
+회사 용어 위키 - 한글 처리
+초성 추출 등 한글 음절 분해 유틸리티
+"""
+
+# 한글 음절 범위 (가 ~ 힣)
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_LAST = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+# 초성 (호환용 자모)
+CHOSUNG = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+]
+
+# 중성 / 종성 (호환용 자모, 종성 첫 항목은 받침 없음)
+JUNGSEONG = [
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ',
+    'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ',
+]
+JONGSEONG = [
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ',
+    'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+]
+
+# 호환용 자음 범위 (ㄱ ~ ㅎ)
+CONSONANT_FIRST = 0x3131
+CONSONANT_LAST = 0x314E
+
+
+def is_syllable(ch: str) -> bool:
+    """완성형 한글 음절 여부"""
+    return SYLLABLE_BASE <= ord(ch) <= SYLLABLE_LAST
+
+
+def chosung(text: str) -> str:
+    """초성 키 생성
+    
+    한글 음절은 초성으로 바꾸고, 그 외 문자는 소문자로 유지한다.
+    공백은 제거한다. 예: '매출 원가' -> 'ㅁㅊㅇㄱ'
+    """
+    result = []
+    for ch in (text or "").lower():
+        if ch.isspace():
+            continue
+        if is_syllable(ch):
+            index = (ord(ch) - SYLLABLE_BASE) // (JUNGSEONG_COUNT * JONGSEONG_COUNT)
+            result.append(CHOSUNG[index])
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def is_chosung_query(text: str) -> bool:
+    """검색어가 초성(자음)으로만 이루어졌는지 여부 (공백 무시)"""
+    chars = [ch for ch in text if not ch.isspace()]
+    return bool(chars) and all(CONSONANT_FIRST <= ord(ch) <= CONSONANT_LAST for ch in chars)
+
+
+def decompose(text: str) -> str:
+    """자모 분해 문자열 생성
+    
+    한글 음절은 초성/중성/종성 자모로 풀고, 그 외 문자는 소문자로 유지한다.
+    공백은 제거한다. 예: '매출' -> 'ㅁㅐㅊㅜㄹ'
+    """
+    result = []
+    for ch in (text or "").lower():
+        if ch.isspace():
+            continue
+        if is_syllable(ch):
+            offset = ord(ch) - SYLLABLE_BASE
+            result.append(CHOSUNG[offset // (JUNGSEONG_COUNT * JONGSEONG_COUNT)])
+            result.append(JUNGSEONG[offset % (JUNGSEONG_COUNT * JONGSEONG_COUNT) // JONGSEONG_COUNT])
+            result.append(JONGSEONG[offset % JONGSEONG_COUNT])
+        else:
+            result.append(ch)
+    return "".join(result)
@@ -0,0 +1,404 @@
+"""
+회사 용어 위키 - 변경 이력 저장
+수정 이력 값을 주기적 원문(스냅샷)과 그 사이의 압축 델타로 저장하고 복원,
+용어 체크포인트와 이력으로 과거 시점의 용어 재구성
+"""
+
+import json
+import sqlite3
+import zlib
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# 같은 (용어, 필드)의 수정 이력 연쇄에서 원문을 저장하는 주기
+# 원문 행 뒤로 최대 SNAPSHOT_INTERVAL - 1개 행까지 델타로 저장한다 (1이면 델타를 쓰지 않음)
+SNAPSHOT_INTERVAL = 10
+
+# 델타 압축 수준 (zlib)
+COMPRESS_LEVEL = 9
+
+# 용어 상태 체크포인트 주기 (마지막 체크포인트 이후 이력 행 수)
+CHECKPOINT_INTERVAL = 50
+
+# 체크포인트/재구성 대상 필드 (동의어는 이력과 같이 ', '로 이어 붙인 문자열)
+TERM_FIELDS = ('name', 'definition', 'example', 'synonyms')
+
+# 연쇄 조회: 기준 행부터 거슬러 올라가며 원문 행이 나올 때까지 읽음
+_CHAIN_SQL = """
+    SELECT id, old_value, new_value, value_delta FROM term_history
+    WHERE term_id = ? AND field_name = ? AND action_type = 'update' AND id <= ?
+    ORDER BY id DESC
+"""
+
+# 여러 용어를 묶어 조회할 때 한 쿼리에 넣을 용어 수 (VALUES 행마다 바인드 변수 3개)
+_CHUNK_SIZE = 300
+
+# 연쇄 끝까지 조회할 때의 기준 ID
+_LAST_ID = 2 ** 63 - 1
+
+# 이력 행 값: (old_value, new_value, value_delta)
+StoredValues = Tuple[Optional[str], Optional[str], Optional[bytes]]
+
+
+def _common_affixes(old: str, new: str) -> Tuple[int, int]:
+    """공통 접두어/접미어 길이 (겹치지 않게)"""
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def make_delta(old: str, new: str) -> bytes:
+    """old -> new 변환 델타
+    
+    difflib opcodes 중 복사 구간은 [시작, 끝], 새 문자열은 그대로 나열한 JSON을
+    zlib으로 압축한다. 삭제 구간은 기록하지 않는다. 편집은 보통 한 곳에 몰려
+    있으므로 공통 접두어/접미어를 먼저 떼고 가운데만 비교한다.
+    """
+    prefix, suffix = _common_affixes(old, new)
+    old_middle = old[prefix:len(old) - suffix]
+    new_middle = new[prefix:len(new) - suffix]
+    
+    ops = [[0, prefix]] if prefix else []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old_middle, new_middle).get_opcodes():
+        if tag == 'equal':
+            ops.append([prefix + i1, prefix + i2])
+        elif tag in ('replace', 'insert'):
+            ops.append(new_middle[j1:j2])
+    if suffix:
+        ops.append([len(old) - suffix, len(old)])
+    
+    payload = json.dumps(ops, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return zlib.compress(payload, COMPRESS_LEVEL)
+
+
+def apply_delta(old: str, delta: bytes) -> str:
+    """make_delta로 만든 델타를 old에 적용"""
+    ops = json.loads(zlib.decompress(delta).decode('utf-8'))
+    return ''.join(old[op[0]:op[1]] if isinstance(op, list) else op for op in ops)
+
+
+def encode(previous_new: Optional[str], chain_length: int,
+           old: Optional[str], new: Optional[str]) -> StoredValues:
+    """수정 이력 한 행의 저장 형태 결정
+    
+    previous_new: 같은 연쇄의 직전 행 새 값, chain_length: 마지막 원문 행부터 직전 행까지의 행 수.
+    직전 새 값이 이번 이전 값과 같고 연쇄가 주기보다 짧으며 델타가 원문보다 작을 때만
+    델타로 저장한다 (이전 값은 직전 행에서, 새 값은 델타로 복원). 나머지는 원문으로 저장한다.
+    """
+    if (0 < chain_length < SNAPSHOT_INTERVAL and old is not None and new is not None
+            and previous_new == old):
+        delta = make_delta(old, new)
+        if len(delta) < len(new.encode('utf-8')):
+            return None, None, delta
+    return old, new, None
+
+
+def _replay(chain: Sequence[tuple]) -> List[Tuple[int, Optional[str], Optional[str]]]:
+    """원문 행부터 오래된 순으로 나열한 연쇄를 풀어 [(id, 이전 값, 새 값), ...] 반환"""
+    values = []
+    new = None
+    for history_id, old_value, new_value, delta in chain:
+        if delta is None:
+            old, new = old_value, new_value
+        else:
+            old, new = new, apply_delta(new or "", delta)
+        values.append((history_id, old, new))
+    return values
+
+
+def _load_chain(cursor: sqlite3.Cursor, term_id: int, field_name: str,
+                upto_id: int = _LAST_ID) -> List[tuple]:
+    """upto_id 이하의 마지막 원문 행부터 upto_id까지의 연쇄 (오래된 순)"""
+    chain = []
+    cursor.execute(_CHAIN_SQL, (term_id, field_name, upto_id))
+    for row in cursor:
+        chain.append(tuple(row))
+        if row[3] is None:
+            break
+    chain.reverse()
+    return chain
+
+
+def resolve_values(cursor: sqlite3.Cursor,
+                   rows: Iterable[Tuple[int, int, str]]) -> Dict[int, Tuple[Optional[str], Optional[str]]]:
+    """델타로 저장된 이력 행의 값 복원
+    
+    rows: [(이력 ID, 용어 ID, 필드명), ...]
+    반환: {이력 ID: (이전 값, 새 값)}. 연쇄 하나를 풀면 그 안의 행이 모두 채워지므로
+    같은 연쇄에 속한 행은 한 번만 조회한다.
+    """
+    resolved: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+    for history_id, term_id, field_name in sorted(rows, reverse=True):
+        if history_id in resolved:
+            continue
+        for chain_id, old, new in _replay(_load_chain(cursor, term_id, field_name, history_id)):
+            resolved[chain_id] = (old, new)
+    return resolved
+
+
+def _load_chain_tails(cursor: sqlite3.Cursor, pairs: Sequence[Tuple[int, str]]
+                      ) -> Dict[Tuple[int, str], List[tuple]]:
+    """(용어, 필드)별 마지막 원문 행부터 끝까지의 연쇄 {(용어 ID, 필드명): 연쇄} (오래된 순)
+    
+    여러 (용어, 필드)를 VALUES 목록과 조인해 한 번에 읽는다. 이력이 없는 쌍은 결과에 없다.
+    """
+    chains: Dict[Tuple[int, str], List[tuple]] = {}
+    for i in range(0, len(pairs), _CHUNK_SIZE):
+        chunk = pairs[i:i + _CHUNK_SIZE]
+        values = ",".join("(?, ?)" for _ in chunk)
+        cursor.execute(f"""
+            WITH p(term_id, field_name) AS (VALUES {values})
+            SELECT p.term_id, p.field_name, h.id, h.old_value, h.new_value, h.value_delta
+            FROM p JOIN term_history h
+              ON h.term_id = p.term_id AND h.field_name = p.field_name
+             AND h.action_type = 'update'
+             AND h.id >= (SELECT s.id FROM term_history s
+                          WHERE s.term_id = p.term_id AND s.field_name = p.field_name
+                            AND s.action_type = 'update' AND s.value_delta IS NULL
+                          ORDER BY s.id DESC LIMIT 1)
+            ORDER BY p.term_id, p.field_name, h.id
+        """, [value for pair in chunk for value in pair])
+        for term_id, field_name, *row in cursor.fetchall():
+            chains.setdefault((term_id, field_name), []).append(tuple(row))
+    return chains
+
+
+def insert_updates_many(cursor: sqlite3.Cursor,
+                        updates: Dict[int, Sequence[Tuple[str, Optional[str], Optional[str]]]],
+                        user_id: int):
+    """여러 용어의 수정 이력 기록 (updates: {용어 ID: [(필드명, 이전 값, 새 값), ...]})
+    
+    저장 형태를 정하는 데 필요한 연쇄 끝부분은 모든 (용어, 필드)를 묶어 한 번에 읽고,
+    이력 행도 한 번에 넣는다.
+    """
+    pairs = [(term_id, field_name) for term_id, changes in updates.items()
+             for field_name, _, _ in changes]
+    chains = _load_chain_tails(cursor, pairs)
+    
+    rows = []
+    for term_id, changes in updates.items():
+        for field_name, old, new in changes:
+            chain = chains.get((term_id, field_name), [])
+            previous_new = _replay(chain)[-1][2] if chain else None
+            rows.append((term_id, field_name, *encode(previous_new, len(chain), old, new), user_id))
+    
+    cursor.executemany(
+        """INSERT INTO term_history
+           (term_id, action_type, field_name, old_value, new_value, value_delta, changed_by)
+           VALUES (?, 'update', ?, ?, ?, ?, ?)""",
+        rows
+    )
+
+
+def insert_updates(cursor: sqlite3.Cursor, term_id: int,
+                   changes: Sequence[Tuple[str, Optional[str], Optional[str]]], user_id: int):
+    """용어 수정 이력 기록 (changes: [(필드명, 이전 값, 새 값), ...], insert_updates_many 참고)"""
+    insert_updates_many(cursor, {term_id: changes}, user_id)
+
+
+def join_synonyms(synonyms: Iterable[str]) -> str:
+    """동의어 목록을 이력/체크포인트 저장 형태(정렬한 JSON 배열)로 변환
+    
+    동의어 안에 ', '가 있어도 그대로 복원되도록 구분자로 이어 붙이지 않는다.
+    """
+    return json.dumps(sorted(synonyms), ensure_ascii=False)
+
+
+def split_synonyms(value: Optional[str]) -> List[str]:
+    """join_synonyms의 역변환
+    
+    JSON 배열이 아닌 값은 이전 형식(', '로 이어 붙인 문자열)으로 본다.
+    """
+    if not value:
+        return []
+    if value.startswith('['):
+        try:
+            synonyms = json.loads(value)
+        except ValueError:
+            pass
+        else:
+            if isinstance(synonyms, list):
+                return synonyms
+    return value.split(', ')
+
+
+def format_synonyms(value: Optional[str]) -> str:
+    """저장 형태의 동의어 목록을 화면 표시용 문자열로 변환"""
+    return ', '.join(split_synonyms(value))
+
+
+def checkpoint_many_if_due(cursor: sqlite3.Cursor, term_ids: Sequence[int]):
+    """용어마다 마지막 체크포인트 이후 이력이 CHECKPOINT_INTERVAL개 이상이면 현재 상태 저장
+    
+    체크포인트가 없는 용어(새 용어)는 바로 저장한다. 이력 기록 후 같은 트랜잭션에서 호출한다.
+    이력 수 확인과 저장은 용어 수와 관계없이 묶음으로 처리한다.
+    """
+    term_ids = list(term_ids)
+    due: Dict[int, int] = {}
+    for i in range(0, len(term_ids), _CHUNK_SIZE):
+        chunk = term_ids[i:i + _CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(f"""
+            SELECT k.term_id, k.last, COUNT(h.id), MAX(h.id)
+            FROM (SELECT t.id AS term_id,
+                         (SELECT MAX(c.history_id) FROM term_checkpoints c
+                          WHERE c.term_id = t.id) AS last
+                  FROM terms t WHERE t.id IN ({placeholders})) k
+            LEFT JOIN term_history h ON h.term_id = k.term_id AND h.id > COALESCE(k.last, 0)
+            GROUP BY k.term_id
+        """, chunk)
+        for term_id, last, count, latest in cursor.fetchall():
+            if last is None or count >= CHECKPOINT_INTERVAL:
+                due[term_id] = latest or last or 0
+    if not due:
+        return
+    
+    synonyms: Dict[int, List[str]] = {term_id: [] for term_id in due}
+    due_ids = list(due)
+    for i in range(0, len(due_ids), _CHUNK_SIZE):
+        chunk = due_ids[i:i + _CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(
+            f"SELECT term_id, synonym_name FROM synonyms WHERE term_id IN ({placeholders})", chunk
+        )
+        for term_id, synonym_name in cursor.fetchall():
+            synonyms[term_id].append(synonym_name)
+    
+    cursor.executemany("""
+        INSERT OR REPLACE INTO term_checkpoints
+            (term_id, history_id, name, definition, example, synonyms)
+        SELECT t.id, ?, t.name, t.definition, COALESCE(t.example, ''), ?
+        FROM terms t WHERE t.id = ?
+    """, [(history_id, join_synonyms(synonyms[term_id]), term_id)
+          for term_id, history_id in due.items()])
+
+
+def checkpoint_if_due(cursor: sqlite3.Cursor, term_id: int):
+    """용어 하나의 체크포인트 저장 (checkpoint_many_if_due 참고)"""
+    checkpoint_many_if_due(cursor, [term_id])
+
+
+def seed_checkpoints(cursor: sqlite3.Cursor, start: int, end: int):
+    """ID가 [start, end)인 기존 용어의 현재 상태를 마지막 이력 행 기준 체크포인트로 저장 (마이그레이션용)"""
+    cursor.execute(
+        "SELECT term_id, synonym_name FROM synonyms WHERE term_id >= ? AND term_id < ?",
+        (start, end)
+    )
+    synonyms = {}
+    for term_id, synonym_name in cursor.fetchall():
+        synonyms.setdefault(term_id, []).append(synonym_name)
+    
+    cursor.execute("""
+        SELECT t.id,
+               (SELECT COALESCE(MAX(h.id), 0) FROM term_history h WHERE h.term_id = t.id),
+               t.name, t.definition, COALESCE(t.example, '')
+        FROM terms t
+        WHERE t.id >= ? AND t.id < ?
+    """, (start, end))
+    rows = [(*row, join_synonyms(synonyms.get(row[0], [])))
+            for row in cursor.fetchall()]
+    cursor.executemany("""
+        INSERT OR IGNORE INTO term_checkpoints
+            (term_id, history_id, name, definition, example, synonyms)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, rows)
+
+
+def _load_checkpoints(cursor: sqlite3.Cursor, term_ids: Sequence[int]) -> Dict[int, List[tuple]]:
+    """용어별 체크포인트 {용어 ID: [(history_id, *TERM_FIELDS), ...]} (오래된 순)"""
+    checkpoints: Dict[int, List[tuple]] = {}
+    for i in range(0, len(term_ids), _CHUNK_SIZE):
+        chunk = term_ids[i:i + _CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(f"""
+            SELECT term_id, history_id, {', '.join(TERM_FIELDS)} FROM term_checkpoints
+            WHERE term_id IN ({placeholders})
+            ORDER BY term_id, history_id
+        """, chunk)
+        for row in cursor.fetchall():
+            checkpoints.setdefault(row[0], []).append(tuple(row[1:]))
+    return checkpoints
+
+
+def _load_events(cursor: sqlite3.Cursor, windows: Dict[int, Tuple[int, int]]
+                 ) -> Dict[int, List[Tuple[int, str, str, Optional[str], Optional[str]]]]:
+    """용어별 (after_id, upto_id] 구간의 이력 {용어 ID: [(id, 작업, 필드명, 이전 값, 새 값), ...]} (오래된 순)
+    
+    windows: {용어 ID: (after_id, upto_id)}. 여러 용어의 구간을 VALUES 목록과 조인해 한 번에 읽는다.
+    """
+    items = list(windows.items())
+    rows = []
+    for i in range(0, len(items), _CHUNK_SIZE):
+        chunk = items[i:i + _CHUNK_SIZE]
+        values = ",".join("(?, ?, ?)" for _ in chunk)
+        cursor.execute(f"""
+            WITH w(term_id, after_id, upto_id) AS (VALUES {values})
+            SELECT h.id, h.term_id, h.action_type, h.field_name, h.old_value, h.new_value,
+                   h.value_delta IS NOT NULL
+            FROM w JOIN term_history h
+              ON h.term_id = w.term_id AND h.id > w.after_id AND h.id <= w.upto_id
+            ORDER BY h.term_id, h.id
+        """, [value for term_id, (after_id, upto_id) in chunk for value in (term_id, after_id, upto_id)])
+        rows.extend(tuple(row) for row in cursor.fetchall())
+    
+    values = resolve_values(cursor, [(row[0], row[1], row[3]) for row in rows if row[6]])
+    events: Dict[int, list] = {term_id: [] for term_id in windows}
+    for row in rows:
+        events[row[1]].append((row[0], row[2], row[3], *values.get(row[0], (row[4], row[5]))))
+    return events
+
+
+def reconstruct_many(cursor: sqlite3.Cursor,
+                     targets: Dict[int, int]) -> Dict[int, Optional[Dict[str, Optional[str]]]]:
+    """용어마다 지정한 이력 행까지 반영된 필드 {용어 ID: {TERM_FIELDS: 값} 또는 None}
+    
+    targets: {용어 ID: history_id}. 그 시점에 없던 용어는 None.
+    history_id 이하의 가장 가까운 체크포인트에서 이후 이력의 새 값을 순서대로 적용한다.
+    그런 체크포인트가 없으면 (체크포인트 도입 전 이력) 이후의 가장 가까운 체크포인트에서
+    이력의 이전 값을 거꾸로 적용한다. 어느 쪽이든 체크포인트 사이의 이력만 읽으며,
+    체크포인트와 이력은 용어 수와 관계없이 묶음으로 조회한다.
+    """
+    checkpoints = _load_checkpoints(cursor, list(targets))
+    starts: Dict[int, Tuple[tuple, bool]] = {}
+    windows: Dict[int, Tuple[int, int]] = {}
+    for term_id, history_id in targets.items():
+        candidates = checkpoints.get(term_id, [])
+        before = [checkpoint for checkpoint in candidates if checkpoint[0] <= history_id]
+        if before:
+            starts[term_id] = (before[-1], True)
+            windows[term_id] = (before[-1][0], history_id)
+        elif candidates:
+            starts[term_id] = (candidates[0], False)
+            windows[term_id] = (history_id, candidates[0][0])
+    
+    events = _load_events(cursor, windows)
+    result: Dict[int, Optional[Dict[str, Optional[str]]]] = dict.fromkeys(targets)
+    for term_id, (checkpoint, forward) in starts.items():
+        state = dict(zip(TERM_FIELDS, checkpoint[1:]))
+        exists = True
+        if forward:
+            for _, action, field_name, old, new in events[term_id]:
+                if action == 'update' and field_name in state:
+                    state[field_name] = new
+                elif action in ('create', 'restore', 'delete'):
+                    exists = action != 'delete'
+        else:
+            for _, action, field_name, old, new in reversed(events[term_id]):
+                if action == 'update' and field_name in state:
+                    state[field_name] = old
+                elif action in ('create', 'restore', 'delete'):
+                    exists = action == 'delete'
+        result[term_id] = state if exists else None
+    return result
+
+
+def reconstruct(cursor: sqlite3.Cursor, term_id: int,
+                history_id: int) -> Optional[Dict[str, Optional[str]]]:
+    """history_id 이력 행까지 반영된 용어 필드 (그 시점에 없던 용어면 None, reconstruct_many 참고)"""
+    return reconstruct_many(cursor, {term_id: history_id})[term_id]
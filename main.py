@@ -10,7 +10,7 @@ import os
 # 모듈 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from database import init_database, insert_sample_data
+from database import init_database, close_connections
 from repository import UserRepository
 from ui.main_window import MainWindow
 from ui.styles import COLORS, FONTS
@@ -122,9 +122,8 @@ class LoginDialog(tk.Tk):
 
 def main():
     """메인 함수"""
-    # 데이터베이스 초기화
+    # 데이터베이스 초기화 (스키마가 최신이면 바로 통과)
     init_database()
-    insert_sample_data()
     
     # 로그인
     login = LoginDialog()
@@ -134,6 +133,9 @@ def main():
         # 메인 윈도우 실행
         app = MainWindow(login.result_user)
         app.mainloop()
+    
+    # 풀에 남은 DB 연결 정리
+    close_connections()
 
 
 if __name__ == "__main__":
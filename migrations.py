@@ -0,0 +1,669 @@
+"""
+회사 용어 위키 - 스키마 마이그레이션
+PRAGMA user_version 기반의 순차 마이그레이션 엔진
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import history_store
+import search_index
+
+
+# 일괄 처리 단위 (행 수)
+BATCH_SIZE = 5000
+
+# 진행 상황 콜백: (마이그레이션 버전, 작업 이름, 처리한 행 수, 전체 행 수)
+ProgressCallback = Callable[[int, str, int, int], None]
+
+
+def print_progress(version: int, label: str, done: int, total: int):
+    """기본 진행 상황 출력"""
+    percent = done * 100 // total if total else 100
+    print(f"  [{version}] {label}: {done}/{total} ({percent}%)")
+
+
+class MigrationContext:
+    """마이그레이션 단계에 전달되는 실행 환경
+    
+    한 단계는 하나의 쓰기 트랜잭션 안에서 실행된다. 대용량 테이블 작업은
+    for_each_batch / rebuild_table로 나누어 처리하며 진행 상황을 보고한다.
+    """
+    
+    def __init__(self, conn: sqlite3.Connection, version: int,
+                 progress: Optional[ProgressCallback] = None):
+        self.conn = conn
+        self.cursor = conn.cursor()
+        self.version = version
+        self.progress = progress
+        self.created_indexes: List[str] = []
+        # True면 커밋 후 VACUUM으로 빈 페이지를 정리해 파일 크기를 줄임
+        self.vacuum = False
+    
+    def table_exists(self, name: str) -> bool:
+        """테이블(가상 테이블 포함) 존재 여부"""
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        )
+        return self.cursor.fetchone() is not None
+    
+    def column_exists(self, table: str, column: str) -> bool:
+        """컬럼 존재 여부"""
+        self.cursor.execute(f"PRAGMA table_info({table})")
+        return any(row[1] == column for row in self.cursor.fetchall())
+    
+    def add_column(self, table: str, column: str, definition: str):
+        """컬럼이 없으면 추가"""
+        if not self.column_exists(table, column):
+            self.cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    
+    def create_index(self, name: str, target: str, where: str = "", unique: bool = False):
+        """인덱스가 없으면 생성 (새로 만든 인덱스는 마이그레이션 후 ANALYZE)
+        
+        target: '테이블(컬럼, ...)', where: 부분 인덱스 조건
+        """
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+        )
+        if self.cursor.fetchone():
+            return
+        unique_sql = "UNIQUE " if unique else ""
+        where_sql = f" WHERE {where}" if where else ""
+        self.cursor.execute(f"CREATE {unique_sql}INDEX {name} ON {target}{where_sql}")
+        self.created_indexes.append(name)
+    
+    def report(self, label: str, done: int, total: int):
+        """진행 상황 보고"""
+        if self.progress:
+            self.progress(self.version, label, done, total)
+    
+    def for_each_batch(self, table: str, handler: Callable[[int, int], None],
+                       label: str = "", batch_size: int = BATCH_SIZE, commit: bool = False):
+        """rowid 범위 [start, end)로 나누어 handler 호출
+        
+        commit=True이면 배치마다 커밋해 다른 사용자의 쓰기가 끼어들 수 있게 한다.
+        이 경우 handler는 중단 후 다시 실행되어도 안전해야 한다
+        (예: 'WHERE 컬럼 IS NULL' 조건의 채우기 작업).
+        """
+        self.cursor.execute(f"SELECT MIN(rowid), MAX(rowid), COUNT(*) FROM {table}")
+        first, last, total = self.cursor.fetchone()
+        if not total:
+            return
+        
+        label = label or table
+        done = 0
+        for start in range(first, last + 1, batch_size):
+            end = start + batch_size
+            handler(start, end)
+            self.cursor.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE rowid >= ? AND rowid < ?", (start, end)
+            )
+            done += self.cursor.fetchone()[0]
+            self.report(label, done, total)
+            if commit:
+                self.conn.commit()
+                self.conn.execute("BEGIN IMMEDIATE")
+    
+    def rebuild_table(self, table: str, create_sql: str, columns: List[str],
+                      select_exprs: Optional[List[str]] = None, batch_size: int = BATCH_SIZE):
+        """테이블 정의 변경을 위해 새 테이블로 옮겨 담기
+        
+        create_sql은 '{table}' 자리에 임시 테이블 이름이 들어갈 CREATE TABLE 문이다.
+        데이터는 배치 단위로 복사하지만, 복사 도중 쓰기가 유실되지 않도록 전체를
+        하나의 트랜잭션에서 처리한다. 기존 테이블의 인덱스와 트리거는 함께
+        삭제되므로 호출한 쪽에서 다시 만들어야 한다. 다른 테이블이 외래키로
+        참조하는 테이블에는 사용하지 않는다.
+        
+        AUTOINCREMENT 테이블이면 sqlite_sequence 값도 옮긴다. 기존 테이블을 삭제하면
+        그 값도 사라져, 마지막 행들이 영구 삭제된 뒤라면 그 ID가 다시 쓰이기 때문이다.
+        """
+        new_table = f"{table}__rebuild"
+        select_exprs = select_exprs or columns
+        sequence = self._sequence(table)
+        
+        self.cursor.execute(f"DROP TABLE IF EXISTS {new_table}")
+        self.cursor.execute(create_sql.format(table=new_table))
+        self.for_each_batch(table, lambda start, end: self.cursor.execute(f"""
+            INSERT INTO {new_table} ({', '.join(columns)})
+            SELECT {', '.join(select_exprs)} FROM {table}
+            WHERE rowid >= ? AND rowid < ?
+        """, (start, end)), label=f"{table} 재구성", batch_size=batch_size)
+        
+        self.cursor.execute(f"DROP TABLE {table}")
+        self.cursor.execute(f"ALTER TABLE {new_table} RENAME TO {table}")
+        
+        if sequence is not None and "AUTOINCREMENT" in create_sql.upper():
+            self.cursor.execute(
+                "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = ?", (sequence, table)
+            )
+            if not self.cursor.rowcount:
+                self.cursor.execute(
+                    "INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table, sequence)
+                )
+    
+    def _sequence(self, table: str) -> Optional[int]:
+        """AUTOINCREMENT 테이블의 마지막 발급 ID (sqlite_sequence, 없으면 None)"""
+        if not self.table_exists('sqlite_sequence'):
+            return None
+        self.cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,))
+        row = self.cursor.fetchone()
+        return row[0] if row else None
+
+
+@dataclass
+class Migration:
+    """마이그레이션 단계"""
+    version: int
+    description: str
+    apply: Callable[[MigrationContext], None]
+
+
+def _create_base_schema(ctx: MigrationContext):
+    """기본 테이블 및 인덱스 생성 (DB를 처음 만드는 경우 샘플 데이터 삽입)"""
+    is_new = not ctx.table_exists('terms')
+    cursor = ctx.cursor
+    
+    # 사용자 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            role TEXT DEFAULT 'user',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # 카테고리 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL,
+            description TEXT,
+            color TEXT DEFAULT '#3498db'
+        )
+    """)
+    
+    # 용어 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS terms (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            definition TEXT NOT NULL,
+            example TEXT,
+            created_by INTEGER REFERENCES users(id),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # 동의어 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS synonyms (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
+            synonym_name TEXT NOT NULL
+        )
+    """)
+    
+    # 용어-카테고리 연결 (다대다)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS term_categories (
+            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
+            category_id INTEGER REFERENCES categories(id) ON DELETE CASCADE,
+            PRIMARY KEY (term_id, category_id)
+        )
+    """)
+    
+    # 변경 이력 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS term_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
+            action_type TEXT NOT NULL,
+            field_name TEXT,
+            old_value TEXT,
+            new_value TEXT,
+            changed_by INTEGER REFERENCES users(id),
+            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # 검색 성능을 위한 인덱스
+    ctx.create_index("idx_terms_name", "terms(name)")
+    ctx.create_index("idx_synonyms_name", "synonyms(synonym_name)")
+    ctx.create_index("idx_history_term", "term_history(term_id)")
+    
+    if is_new:
+        insert_sample_data(cursor)
+
+
+def _create_search_indexes(ctx: MigrationContext):
+    """검색 인덱스 테이블 및 동기화 트리거 생성
+    
+    - terms_fts: 트라이그램 FTS5 테이블 (3글자 이상 부분 문자열 검색)
+      rowid는 terms.id와 같으며, 동의어는 줄바꿈으로 이어 붙여 synonyms 컬럼에 저장
+    - term_bigrams: 2글자 검색어용 바이그램 색인 (리포지토리에서 갱신)
+    - term_chosung: 초성 검색 색인 (리포지토리에서 갱신)
+    - term_fuzzy_keys / term_fuzzy_grams: 유사 검색용 자모 트라이그램 색인 (리포지토리에서 갱신)
+    """
+    cursor = ctx.cursor
+    cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'terms_fts'"
+    )
+    row = cursor.fetchone()
+    rebuild_fts = row is None or "trigram" not in row[0]
+    
+    if rebuild_fts:
+        # 이전 토크나이저로 만든 인덱스는 트리거와 함께 새로 생성
+        cursor.execute("DROP TABLE IF EXISTS terms_fts")
+        for trigger in (
+            "trg_terms_fts_insert", "trg_terms_fts_update", "trg_terms_fts_delete",
+            "trg_synonyms_fts_insert", "trg_synonyms_fts_delete", "trg_synonyms_fts_update",
+        ):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS terms_fts USING fts5(
+            name, definition, example, synonyms,
+            tokenize = 'trigram'
+        )
+    """)
+    
+    # 용어 추가/수정/삭제 시 동기화
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_terms_fts_insert AFTER INSERT ON terms
+        BEGIN
+            INSERT INTO terms_fts (rowid, name, definition, example, synonyms)
+            VALUES (
+                new.id, new.name, new.definition, COALESCE(new.example, ''),
+                (SELECT COALESCE(group_concat(synonym_name, char(10)), '')
+                 FROM synonyms WHERE term_id = new.id)
+            );
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_terms_fts_update
+        AFTER UPDATE OF name, definition, example ON terms
+        BEGIN
+            UPDATE terms_fts
+            SET name = new.name,
+                definition = new.definition,
+                example = COALESCE(new.example, '')
+            WHERE rowid = new.id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_terms_fts_delete AFTER DELETE ON terms
+        BEGIN
+            DELETE FROM terms_fts WHERE rowid = old.id;
+        END
+    """)
+    
+    # 동의어 변경 시 해당 용어의 synonyms 컬럼 갱신
+    synonyms_sql = """
+        UPDATE terms_fts
+        SET synonyms = (SELECT COALESCE(group_concat(synonym_name, char(10)), '')
+                        FROM synonyms WHERE term_id = {ref}.term_id)
+        WHERE rowid = {ref}.term_id;
+    """
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_synonyms_fts_insert AFTER INSERT ON synonyms
+        BEGIN {synonyms_sql.format(ref='new')} END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_synonyms_fts_delete AFTER DELETE ON synonyms
+        BEGIN {synonyms_sql.format(ref='old')} END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_synonyms_fts_update AFTER UPDATE ON synonyms
+        BEGIN {synonyms_sql.format(ref='old')} {synonyms_sql.format(ref='new')} END
+    """)
+    
+    # 인덱스를 새로 만든 경우 현재 데이터로 채움
+    if rebuild_fts:
+        ctx.for_each_batch("terms", lambda start, end: cursor.execute("""
+            INSERT INTO terms_fts (rowid, name, definition, example, synonyms)
+            SELECT t.id, t.name, t.definition, COALESCE(t.example, ''),
+                   (SELECT COALESCE(group_concat(s.synonym_name, char(10)), '')
+                    FROM synonyms s WHERE s.term_id = t.id)
+            FROM terms t
+            WHERE t.id >= ? AND t.id < ?
+        """, (start, end)), label="전문 검색 인덱스")
+    
+    # 2글자 검색용 바이그램 색인
+    is_new_bigrams = not ctx.table_exists('term_bigrams')
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS term_bigrams (
+            gram TEXT NOT NULL,
+            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
+            PRIMARY KEY (gram, term_id)
+        ) WITHOUT ROWID
+    """)
+    ctx.create_index("idx_term_bigrams_term", "term_bigrams(term_id)")
+    
+    if is_new_bigrams:
+        ctx.for_each_batch(
+            "terms", lambda start, end: search_index.rebuild_bigrams(cursor, start, end),
+            label="바이그램 색인"
+        )
+    
+    # 초성 검색 색인 (용어명/동의어 초성 키의 접미사)
+    is_new_chosung = not ctx.table_exists('term_chosung')
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS term_chosung (
+            key TEXT NOT NULL,
+            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
+            PRIMARY KEY (key, term_id)
+        ) WITHOUT ROWID
+    """)
+    ctx.create_index("idx_term_chosung_term", "term_chosung(term_id)")
+    
+    if is_new_chosung:
+        ctx.for_each_batch(
+            "terms", lambda start, end: search_index.rebuild_chosung(cursor, start, end),
+            label="초성 색인"
+        )
+    
+    # 유사 검색 색인 (용어명/동의어별 자모 트라이그램)
+    is_new_fuzzy = not ctx.table_exists('term_fuzzy_keys')
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS term_fuzzy_keys (
+            id INTEGER PRIMARY KEY,
+            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
+            gram_count INTEGER NOT NULL
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS term_fuzzy_grams (
+            gram TEXT NOT NULL,
+            key_id INTEGER REFERENCES term_fuzzy_keys(id) ON DELETE CASCADE,
+            PRIMARY KEY (gram, key_id)
+        ) WITHOUT ROWID
+    """)
+    ctx.create_index("idx_term_fuzzy_keys_term", "term_fuzzy_keys(term_id)")
+    ctx.create_index("idx_term_fuzzy_grams_key", "term_fuzzy_grams(key_id)")
+    
+    if is_new_fuzzy:
+        ctx.for_each_batch(
+            "terms", lambda start, end: search_index.rebuild_fuzzy(cursor, start, end),
+            label="유사 검색 색인"
+        )
+
+
+def _create_relation_indexes(ctx: MigrationContext):
+    """용어별 동의어 / 카테고리별 용어 조회 인덱스
+    
+    동의어 일괄 조회와 terms_fts 동의어 트리거, 카테고리 필터와 카테고리 삭제 시
+    연결 행 삭제가 테이블 전체를 읽지 않도록 한다.
+    """
+    ctx.create_index("idx_synonyms_term", "synonyms(term_id)")
+    ctx.create_index("idx_term_categories_category", "term_categories(category_id)")
+
+
+def _create_history_order_index(ctx: MigrationContext):
+    """변경 이력 최신순 인덱스
+    
+    (changed_at, id) 키셋 페이지 조회가 정렬 없이 인덱스 범위만 읽도록 한다.
+    """
+    ctx.create_index("idx_history_changed", "term_history(changed_at, id)")
+
+
+def _create_history_filter_indexes(ctx: MigrationContext):
+    """변경 이력 필터 조회용 정수 시각 컬럼과 복합 인덱스
+    
+    changed_ts는 changed_at(UTC)의 Unix 초로, 새 이력은 트리거가 채운다.
+    필터 컬럼마다 (컬럼, changed_ts) 인덱스를 두어 조건과 기간을 인덱스 범위로
+    찾고 최신순 정렬도 인덱스 순서로 처리한다 (rowid가 인덱스 끝에 포함되므로
+    (changed_ts, id) 키셋 조건도 그대로 쓸 수 있다).
+    """
+    cursor = ctx.cursor
+    ctx.add_column("term_history", "changed_ts", "INTEGER")
+    
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_history_changed_ts AFTER INSERT ON term_history
+        WHEN new.changed_ts IS NULL
+        BEGIN
+            UPDATE term_history
+            SET changed_ts = CAST(strftime('%s', new.changed_at) AS INTEGER)
+            WHERE id = new.id;
+        END
+    """)
+    
+    ctx.for_each_batch("term_history", lambda start, end: cursor.execute("""
+        UPDATE term_history
+        SET changed_ts = CAST(strftime('%s', changed_at) AS INTEGER)
+        WHERE id >= ? AND id < ? AND changed_ts IS NULL
+    """, (start, end)), label="변경 시각 변환", commit=True)
+    
+    # 최신순 페이지 조회는 changed_ts 인덱스가 대신함
+    cursor.execute("DROP INDEX IF EXISTS idx_history_changed")
+    ctx.create_index("idx_history_ts", "term_history(changed_ts)")
+    ctx.create_index("idx_history_user_ts", "term_history(changed_by, changed_ts)")
+    ctx.create_index("idx_history_action_ts", "term_history(action_type, changed_ts)")
+    ctx.create_index("idx_history_field_ts", "term_history(field_name, changed_ts)")
+    ctx.create_index("idx_history_term_ts", "term_history(term_id, changed_ts)")
+
+
+def _compress_history_values(ctx: MigrationContext):
+    """수정 이력 값을 주기적 원문 + 델타 형태로 변환 (history_store)
+    
+    value_delta가 있는 행은 old_value/new_value를 비우고, 값은 같은 (용어, 필드)
+    연쇄의 원문 행부터 델타를 차례로 적용해 복원한다. 용어 ID 구간별로 연쇄를
+    통째로 읽어 변환하며, 줄어든 만큼의 빈 페이지는 마이그레이션 후 VACUUM으로 정리한다.
+    """
+    cursor = ctx.cursor
+    ctx.add_column("term_history", "value_delta", "BLOB")
+    # 연쇄 조회용 (rowid가 인덱스 끝에 포함되므로 ID 순서로 읽힘)
+    ctx.create_index("idx_history_chain", "term_history(term_id, field_name)")
+    
+    cursor.execute("""
+        SELECT MIN(term_id), MAX(term_id), COUNT(*) FROM term_history
+        WHERE action_type = 'update'
+    """)
+    first, last, total = cursor.fetchone()
+    if not total:
+        return
+    
+    done = 0
+    for start in range(first, last + 1, BATCH_SIZE):
+        cursor.execute("""
+            SELECT id, term_id, field_name, old_value, new_value FROM term_history
+            WHERE action_type = 'update' AND term_id >= ? AND term_id < ?
+            ORDER BY term_id, field_name, id
+        """, (start, start + BATCH_SIZE))
+        
+        updates = []
+        chain_key, previous_new, chain_length = None, None, 0
+        for history_id, term_id, field_name, old, new in cursor.fetchall():
+            if (term_id, field_name) != chain_key:
+                chain_key, previous_new, chain_length = (term_id, field_name), None, 0
+            _, _, delta = history_store.encode(previous_new, chain_length, old, new)
+            if delta is None:
+                chain_length = 1
+            else:
+                chain_length += 1
+                updates.append((delta, history_id))
+            previous_new = new
+            done += 1
+        
+        cursor.executemany(
+            "UPDATE term_history SET old_value = NULL, new_value = NULL, value_delta = ? WHERE id = ?",
+            updates
+        )
+        ctx.report("변경 이력 델타 변환", done, total)
+    
+    ctx.vacuum = True
+
+
+def _create_term_checkpoints(ctx: MigrationContext):
+    """용어 상태 체크포인트 테이블 (과거 시점 재구성용, history_store)
+    
+    history_id까지의 이력이 반영된 용어 필드를 저장한다. 기존 용어는 현재 상태를
+    마지막 이력 행 기준 체크포인트로 만들어, 그 이전 시점은 이력을 거꾸로 적용해 구한다.
+    """
+    cursor = ctx.cursor
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS term_checkpoints (
+            term_id INTEGER REFERENCES terms(id) ON DELETE CASCADE,
+            history_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            definition TEXT NOT NULL,
+            example TEXT,
+            synonyms TEXT,
+            PRIMARY KEY (term_id, history_id)
+        ) WITHOUT ROWID
+    """)
+    
+    ctx.for_each_batch(
+        "terms", lambda start, end: history_store.seed_checkpoints(cursor, start, end),
+        label="용어 체크포인트"
+    )
+
+
+def _add_term_tombstones(ctx: MigrationContext):
+    """용어 소프트 삭제 (deleted_at 삭제 표시)
+    
+    - terms.deleted_at: 삭제 시각 (NULL이면 살아 있는 용어)
+    - 부분 인덱스: 이름 인덱스는 살아 있는 용어만, 삭제 시각 인덱스는 삭제된 용어만 담아
+      목록/검색과 영구 삭제 작업이 서로의 행을 읽지 않도록 한다
+    - term_history: term_id의 ON DELETE CASCADE를 없애 영구 삭제 후에도 이력이 남도록
+      테이블을 재구성한다 (인덱스와 changed_ts 트리거도 다시 생성)
+    """
+    cursor = ctx.cursor
+    ctx.add_column("terms", "deleted_at", "TIMESTAMP")
+    
+    cursor.execute("DROP INDEX IF EXISTS idx_terms_name")
+    ctx.create_index("idx_terms_live_name", "terms(name)", where="deleted_at IS NULL")
+    ctx.create_index("idx_terms_deleted", "terms(deleted_at)", where="deleted_at IS NOT NULL")
+    
+    columns = ["id", "term_id", "action_type", "field_name", "old_value", "new_value",
+               "changed_by", "changed_at", "changed_ts", "value_delta"]
+    ctx.rebuild_table("term_history", """
+        CREATE TABLE {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            term_id INTEGER,
+            action_type TEXT NOT NULL,
+            field_name TEXT,
+            old_value TEXT,
+            new_value TEXT,
+            changed_by INTEGER REFERENCES users(id),
+            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            changed_ts INTEGER,
+            value_delta BLOB
+        )
+    """, columns)
+    
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_history_changed_ts AFTER INSERT ON term_history
+        WHEN new.changed_ts IS NULL
+        BEGIN
+            UPDATE term_history
+            SET changed_ts = CAST(strftime('%s', new.changed_at) AS INTEGER)
+            WHERE id = new.id;
+        END
+    """)
+    ctx.create_index("idx_history_term", "term_history(term_id)")
+    ctx.create_index("idx_history_ts", "term_history(changed_ts)")
+    ctx.create_index("idx_history_user_ts", "term_history(changed_by, changed_ts)")
+    ctx.create_index("idx_history_action_ts", "term_history(action_type, changed_ts)")
+    ctx.create_index("idx_history_field_ts", "term_history(field_name, changed_ts)")
+    ctx.create_index("idx_history_term_ts", "term_history(term_id, changed_ts)")
+    ctx.create_index("idx_history_chain", "term_history(term_id, field_name)")
+
+
+def _create_db_settings(ctx: MigrationContext):
+    """DB 단위 설정 기록 테이블
+    
+    파일 시스템이 WAL을 지원하지 않아 다른 저널 모드로 대신한 경우 등을 기록해
+    시작할 때마다 같은 PRAGMA 설정을 다시 시도하지 않도록 한다.
+    """
+    ctx.cursor.execute("""
+        CREATE TABLE IF NOT EXISTS db_settings (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """)
+
+
+def insert_sample_data(cursor: sqlite3.Cursor):
+    """기본 관리자와 샘플 카테고리 삽입 (이미 있으면 무시)"""
+    # 기본 관리자 사용자
+    cursor.execute("""
+        INSERT OR IGNORE INTO users (username, role) VALUES ('admin', 'admin')
+    """)
+    
+    # 샘플 카테고리
+    categories = [
+        ('개발', '개발팀에서 사용하는 기술 용어', '#e74c3c'),
+        ('마케팅', '마케팅/영업 관련 용어', '#2ecc71'),
+        ('재무', '재무/회계 관련 용어', '#f39c12'),
+        ('일반', '공통으로 사용하는 용어', '#3498db'),
+    ]
+    cursor.executemany("""
+        INSERT OR IGNORE INTO categories (name, description, color) VALUES (?, ?, ?)
+    """, categories)
+
+
+# 스키마 마이그레이션 (버전 순)
+# 버전 0은 버전 관리 이전에 만들어진 DB로, 모든 단계가 기존 객체를 그대로 두므로
+# 처음부터 다시 적용해도 안전하다. 새 단계는 목록 끝에 추가한다.
+MIGRATIONS = [
+    Migration(1, "기본 테이블 및 인덱스", _create_base_schema),
+    Migration(2, "검색 인덱스 (FTS5 트라이그램, 바이그램, 초성, 자모 트라이그램)", _create_search_indexes),
+    Migration(3, "동의어/카테고리 연결 조회 인덱스", _create_relation_indexes),
+    Migration(4, "변경 이력 최신순 인덱스", _create_history_order_index),
+    Migration(5, "변경 이력 필터 인덱스", _create_history_filter_indexes),
+    Migration(6, "변경 이력 델타 압축", _compress_history_values),
+    Migration(7, "용어 상태 체크포인트", _create_term_checkpoints),
+    Migration(8, "용어 소프트 삭제", _add_term_tombstones),
+    Migration(9, "DB 설정 기록", _create_db_settings),
+]
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """DB에 기록된 스키마 버전 (PRAGMA user_version)"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(conn: sqlite3.Connection,
+                   progress: Optional[ProgressCallback] = print_progress) -> List[int]:
+    """대기 중인 마이그레이션을 순서대로 적용하고 적용한 버전 목록을 반환
+    
+    단계마다 BEGIN IMMEDIATE로 쓰기 잠금을 잡은 뒤 버전을 다시 확인하므로
+    여러 사용자가 동시에 앱을 시작해도 각 단계는 한 번만 적용된다.
+    단계가 끝나면 user_version을 올리고 커밋하며, 새로 만든 인덱스는 ANALYZE한다.
+    """
+    if conn.in_transaction:
+        conn.commit()
+    
+    applied = []
+    for migration in MIGRATIONS:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if get_schema_version(conn) >= migration.version:
+                conn.rollback()
+                continue
+            
+            print(f"DB 마이그레이션 {migration.version}: {migration.description}")
+            ctx = MigrationContext(conn, migration.version, progress)
+            migration.apply(ctx)
+            conn.execute(f"PRAGMA user_version = {migration.version}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        
+        # 쿼리 플래너 통계 갱신
+        for index_name in ctx.created_indexes:
+            conn.execute(f"ANALYZE {index_name}")
+        conn.commit()
+        if ctx.vacuum:
+            conn.execute("VACUUM")
+        applied.append(migration.version)
+    
+    return applied
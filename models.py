@@ -3,12 +3,17 @@
 데이터 클래스 정의
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
-@dataclass
+# Python 3.10+에서는 __slots__ 데이터 클래스로 만들어 인스턴스 메모리를 줄인다
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class User:
     """사용자 모델"""
     id: Optional[int] = None
@@ -21,7 +26,7 @@ class User:
         return self.role == "admin"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Category:
     """카테고리 모델"""
     id: Optional[int] = None
@@ -30,7 +35,7 @@ class Category:
     color: str = "#3498db"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Term:
     """용어 모델"""
     id: Optional[int] = None
@@ -47,12 +52,21 @@ class Term:
     creator_name: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
+class TermSummary:
+    """용어 목록 표시용 요약 (정의 미리보기, 카테고리 이름만)"""
+    id: int = 0
+    name: str = ""
+    definition_preview: str = ""
+    category_names: str = ""
+
+
+@dataclass(**_SLOTS)
 class TermHistory:
     """용어 변경 이력 모델"""
     id: Optional[int] = None
     term_id: int = 0
-    action_type: str = ""  # 'create', 'update', 'delete'
+    action_type: str = ""  # 'create', 'update', 'delete', 'restore'
     field_name: Optional[str] = None
     old_value: Optional[str] = None
     new_value: Optional[str] = None
@@ -62,3 +76,29 @@ class TermHistory:
     # 조회 시 채워짐
     changer_name: str = ""
     term_name: str = ""
+
+
+@dataclass(**_SLOTS)
+class HistoryFilter:
+    """변경 이력 조회 조건 (None인 조건은 적용하지 않음)"""
+    changed_by: Optional[int] = None
+    action_type: Optional[str] = None  # 'create', 'update', 'delete', 'restore'
+    field_name: Optional[str] = None
+    term_id: Optional[int] = None  # API 전용 (화면에서는 용어별 히스토리 다이얼로그 사용)
+    
+    # 변경 시각 범위 [changed_from, changed_to) (UTC)
+    changed_from: Optional[datetime] = None
+    changed_to: Optional[datetime] = None
+
+
+@dataclass(**_SLOTS)
+class RevertResult:
+    """변경 되돌리기 결과"""
+    term_count: int = 0    # 되돌린 용어 수
+    field_count: int = 0   # 되돌린 필드 수
+    
+    # 이후 다른 수정이 있어 건너뛴 (용어 ID, 필드명)
+    conflicts: List[Tuple[int, str]] = field(default_factory=list)
+    
+    # 되돌릴 수 없는 이력(생성/삭제) 수
+    skipped: int = 0
@@ -0,0 +1,65 @@
+"""
+회사 용어 위키 - 삭제된 용어 영구 삭제
+삭제 표시 후 보관 기간이 지난 용어를 배치 단위로 정리 (변경 이력은 남김)
+
+사용법: python purge.py [--days 보관 일수 (기본 30)] [--all]
+"""
+
+import argparse
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database import init_database, close_connections
+from repository import TermRepository
+
+
+# 삭제 표시 후 영구 삭제까지 보관하는 기간 (일)
+DEFAULT_RETENTION_DAYS = 30
+
+
+def positive_int(text: str) -> int:
+    """1 이상의 정수 인자"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {text}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return value
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """명령행 인자 해석 (잘못된 값이면 사용법을 출력하고 종료)"""
+    parser = argparse.ArgumentParser(
+        description="삭제 표시 후 보관 기간이 지난 용어를 영구 삭제합니다 (변경 이력은 남김)."
+    )
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--days", type=positive_int, default=DEFAULT_RETENTION_DAYS,
+                       help=f"보관 일수 (기본 {DEFAULT_RETENTION_DAYS})")
+    group.add_argument("--all", action="store_true",
+                       help="보관 기간과 관계없이 삭제 표시된 용어를 모두 영구 삭제")
+    return parser.parse_args(argv)
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    
+    init_database()
+    if args.all:
+        deleted_before = None
+        scope = "삭제 표시된"
+    else:
+        deleted_before = datetime.now(timezone.utc) - timedelta(days=args.days)
+        scope = f"삭제 후 {args.days}일이 지난"
+    purged = TermRepository.purge_deleted(deleted_before)
+    print(f"{scope} 용어 {purged}개를 영구 삭제했습니다.")
+    
+    close_connections()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,24 @@
 데이터 액세스 레이어
 """
 
-from typing import List, Optional, Tuple
-from datetime import datetime
-from database import get_connection
-from models import User, Category, Term, TermHistory
+import calendar
+import threading
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from database import cancellable, check_external_changes, connection, transaction
+from models import User, Category, Term, TermSummary, TermHistory, HistoryFilter, RevertResult
+import search_index
+import history_store
+import cache
+from hangul import chosung
+
+
+def _tuple_cursor(conn):
+    """sqlite3.Row 대신 튜플을 반환하는 커서 (위치 기반 매퍼용)"""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
 
 
 class UserRepository:
@@ -15,445 +29,1240 @@ class UserRepository:
     @staticmethod
     def get_or_create(username: str) -> User:
         """사용자 조회 또는 생성"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
-        row = cursor.fetchone()
-        
-        if row:
-            user = User(
-                id=row['id'],
-                username=row['username'],
-                role=row['role'],
-                created_at=row['created_at']
-            )
-        else:
-            cursor.execute(
-                "INSERT INTO users (username) VALUES (?)",
-                (username,)
-            )
-            conn.commit()
-            user = User(id=cursor.lastrowid, username=username, role='user')
-        
-        conn.close()
-        return user
+        with transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
+            row = cursor.fetchone()
+            
+            if row:
+                user = User(
+                    id=row['id'],
+                    username=row['username'],
+                    role=row['role'],
+                    created_at=row['created_at']
+                )
+            else:
+                cursor.execute(
+                    "INSERT INTO users (username) VALUES (?)",
+                    (username,)
+                )
+                user = User(id=cursor.lastrowid, username=username, role='user')
+            
+            return user
     
     @staticmethod
     def get_all() -> List[User]:
         """모든 사용자 조회"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users ORDER BY username")
-        
-        users = [
-            User(
-                id=row['id'],
-                username=row['username'],
-                role=row['role'],
-                created_at=row['created_at']
-            )
-            for row in cursor.fetchall()
-        ]
-        conn.close()
-        return users
+        with connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM users ORDER BY username")
+            
+            users = [
+                User(
+                    id=row['id'],
+                    username=row['username'],
+                    role=row['role'],
+                    created_at=row['created_at']
+                )
+                for row in cursor.fetchall()
+            ]
+            return users
     
     @staticmethod
     def update_role(user_id: int, role: str):
         """사용자 권한 변경"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("UPDATE users SET role = ? WHERE id = ?", (role, user_id))
-        conn.commit()
-        conn.close()
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE users SET role = ? WHERE id = ?", (role, user_id))
 
 
 class CategoryRepository:
-    """카테고리 관리 리포지토리"""
+    """카테고리 관리 리포지토리
+    
+    카테고리는 'categories' 버전이 바뀌거나 다른 연결이 DB에 커밋했을 때만 다시 읽는다.
+    반환하는 Category는 복사본이므로 호출하는 쪽에서 수정해도 캐시에 영향이 없다.
+    """
+    
+    @staticmethod
+    def _load() -> Tuple[List[Category], Dict[int, Category], Dict[str, Category]]:
+        """모든 카테고리와 ID/이름 색인 조회"""
+        with connection() as conn:
+            cursor = _tuple_cursor(conn)
+            cursor.execute("SELECT id, name, description, color FROM categories ORDER BY name")
+            
+            categories = [Category(*row) for row in cursor.fetchall()]
+            by_id = {c.id: c for c in categories}
+            by_name = {c.name: c for c in categories}
+            return categories, by_id, by_name
+    
+    _cache = cache.VersionedCache('categories', lambda: CategoryRepository._load())
+    
+    @staticmethod
+    def _cached() -> Tuple[List[Category], Dict[int, Category], Dict[str, Category]]:
+        """캐시된 카테고리 (다른 사용자가 DB를 바꿨으면 다시 읽음)"""
+        check_external_changes()
+        return CategoryRepository._cache.get()
+    
+    @staticmethod
+    def _shared_by_id() -> Dict[int, Category]:
+        """캐시의 카테고리 인스턴스 (용어끼리 공유하므로 수정하지 않음)"""
+        return CategoryRepository._cached()[1]
     
     @staticmethod
     def get_all() -> List[Category]:
         """모든 카테고리 조회"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM categories ORDER BY name")
-        
-        categories = [
-            Category(
-                id=row['id'],
-                name=row['name'],
-                description=row['description'],
-                color=row['color']
-            )
-            for row in cursor.fetchall()
-        ]
-        conn.close()
-        return categories
+        categories, _, _ = CategoryRepository._cached()
+        return [replace(c) for c in categories]
+    
+    @staticmethod
+    def get_by_id(category_id: int) -> Optional[Category]:
+        """ID로 카테고리 조회"""
+        _, by_id, _ = CategoryRepository._cached()
+        category = by_id.get(category_id)
+        return replace(category) if category else None
+    
+    @staticmethod
+    def get_by_name(name: str) -> Optional[Category]:
+        """이름으로 카테고리 조회"""
+        _, _, by_name = CategoryRepository._cached()
+        category = by_name.get(name)
+        return replace(category) if category else None
     
     @staticmethod
     def create(category: Category) -> int:
         """카테고리 생성"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO categories (name, description, color) VALUES (?, ?, ?)",
-            (category.name, category.description, category.color)
-        )
-        conn.commit()
-        category_id = cursor.lastrowid
-        conn.close()
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO categories (name, description, color) VALUES (?, ?, ?)",
+                (category.name, category.description, category.color)
+            )
+            category_id = cursor.lastrowid
+        
+        cache.bump('categories')
         return category_id
     
     @staticmethod
     def update(category: Category):
         """카테고리 수정"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE categories SET name = ?, description = ?, color = ? WHERE id = ?",
-            (category.name, category.description, category.color, category.id)
-        )
-        conn.commit()
-        conn.close()
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE categories SET name = ?, description = ?, color = ? WHERE id = ?",
+                (category.name, category.description, category.color, category.id)
+            )
+        
+        # 캐시된 용어가 가진 카테고리 이름/색상도 바뀜
+        cache.bump('categories', 'terms')
     
     @staticmethod
     def delete(category_id: int):
         """카테고리 삭제"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM categories WHERE id = ?", (category_id,))
-        conn.commit()
-        conn.close()
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM categories WHERE id = ?", (category_id,))
+        
+        # 카테고리 필터 검색 결과도 바뀜
+        cache.bump('categories', 'terms')
 
 
 class TermRepository:
     """용어 관리 리포지토리"""
     
+    # IN (...) 절 하나에 넣을 최대 ID 수 (SQLite 바인드 변수 한도 고려)
+    _RELATION_CHUNK_SIZE = 500
+    
+    # 검색 결과 캐시 (결과가 SEARCH_HAYSTACK_LIMIT개 이하면 검색어를 늘려 갈 때 메모리에서 좁힘)
+    SEARCH_HAYSTACK_LIMIT = 3000
+    _search_cache = cache.SearchCache('terms')
+    
+    # 목록 정의 미리보기 길이 (넘으면 '...' 붙임)
+    PREVIEW_LENGTH = 80
+    
+    # 용어 상세 캐시 (조회 결과로 채우고 쓰기 시 무효화)
+    DETAIL_CACHE_SIZE = 1024
+    _detail_cache = cache.LRUCache('terms', DETAIL_CACHE_SIZE)
+    
+    # 유사 검색: 검색어 트라이그램 중 일치해야 하는 최소 비율 / 최대 결과 수
+    FUZZY_MIN_SCORE = 0.5
+    FUZZY_LIMIT = 200
+    
+    # 용어 조회 컬럼 (_row_to_term의 위치 순서와 같아야 함)
+    _TERM_COLUMNS = """t.id, t.name, t.definition, t.example, t.created_by,
+                       t.created_at, t.updated_at, u.username"""
+    
     @staticmethod
-    def get_all(search_query: str = "", category_id: Optional[int] = None) -> List[Term]:
-        """용어 목록 조회 (검색 및 필터링)"""
-        conn = get_connection()
-        cursor = conn.cursor()
+    def _row_to_term(row: tuple) -> Term:
+        """_TERM_COLUMNS 순서의 튜플을 Term 객체로 변환 (키워드 인자 없이 위치로 생성)"""
+        return Term(row[0], row[1], row[2], row[3], row[4], row[5], row[6], [], [], row[7] or "")
+    
+    @staticmethod
+    def _load_relations(cursor, terms: List[Term]):
+        """동의어/카테고리를 일괄 조회하여 채움
         
-        query = """
-            SELECT DISTINCT t.*, u.username as creator_name
-            FROM terms t
-            LEFT JOIN users u ON t.created_by = u.id
-            LEFT JOIN term_categories tc ON t.id = tc.term_id
-            LEFT JOIN synonyms s ON t.id = s.term_id
-            WHERE 1=1
+        용어마다 쿼리를 실행하지 않고 ID 목록을 청크 단위 IN 절로 묶어
+        조회한 뒤 메모리에서 각 용어에 배분한다.
+        """
+        if not terms:
+            return
+        
+        by_id = {term.id: term for term in terms}
+        for term in terms:
+            term.synonyms = []
+            term.categories = []
+        
+        ids = list(by_id)
+        chunk_size = TermRepository._RELATION_CHUNK_SIZE
+        # 같은 카테고리는 모든 용어가 카테고리 캐시의 인스턴스 하나를 공유
+        # (캐시에 아직 없는 카테고리만 조회 결과로 만듦)
+        shared = CategoryRepository._shared_by_id()
+        created = {}
+        
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            
+            # 동의어 조회
+            cursor.execute(f"""
+                SELECT term_id, synonym_name FROM synonyms
+                WHERE term_id IN ({placeholders})
+                ORDER BY id
+            """, chunk)
+            for term_id, synonym_name in cursor.fetchall():
+                by_id[term_id].synonyms.append(synonym_name)
+            
+            # 카테고리 조회
+            cursor.execute(f"""
+                SELECT tc.term_id, c.id, c.name, c.description, c.color FROM term_categories tc
+                JOIN categories c ON c.id = tc.category_id
+                WHERE tc.term_id IN ({placeholders})
+                ORDER BY c.name
+            """, chunk)
+            for row in cursor.fetchall():
+                category = shared.get(row[1]) or created.get(row[1])
+                if category is None:
+                    category = created[row[1]] = Category(*row[1:])
+                by_id[row[0]].categories.append(category)
+    
+    @staticmethod
+    def _build_search_filter(search_query: str) -> Tuple[str, list]:
+        """검색어에 맞는 WHERE 조건과 파라미터 생성
+        
+        LIKE '%검색어%'와 같은 부분 문자열 검색을 색인으로 처리한다.
+        - 3글자 이상: terms_fts 트라이그램 인덱스
+        - 2글자: term_bigrams 바이그램 색인
+        - 1글자: 색인으로 줄일 수 없으므로 LIKE 검색
+        어느 경우든 비ASCII 문자까지 대소문자를 무시한다. LIKE는 ASCII만 대소문자를
+        무시하므로, 대소문자가 있는 비ASCII 1글자(É, Δ 등)만 fold_case SQL 함수로
+        비교한다 (행마다 파이썬 함수를 호출해 LIKE보다 10배 이상 느림).
+        """
+        if not search_query:
+            return "", []
+        
+        if len(search_query) >= 3:
+            phrase = '"{}"'.format(search_query.replace('"', '""'))
+            return (
+                " AND t.id IN (SELECT rowid FROM terms_fts WHERE terms_fts MATCH ?)",
+                [phrase]
+            )
+        
+        if len(search_query) == 2:
+            return (
+                " AND t.id IN (SELECT term_id FROM term_bigrams WHERE gram = ?)",
+                [search_index.fold_case(search_query)]
+            )
+        
+        if not search_query.isascii() and search_query.lower() != search_query.upper():
+            return (
+                """ AND (instr(fold_case(t.name), ?) OR instr(fold_case(t.definition), ?)
+                         OR instr(fold_case(t.example), ?)
+                         OR t.id IN (SELECT term_id FROM synonyms
+                                     WHERE instr(fold_case(synonym_name), ?)))""",
+                [search_index.fold_case(search_query)] * 4
+            )
+        
+        escaped = search_query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        search_param = f"%{escaped}%"
+        return (
+            """ AND (t.name LIKE ? ESCAPE '\\' OR t.definition LIKE ? ESCAPE '\\'
+                     OR t.example LIKE ? ESCAPE '\\'
+                     OR t.id IN (SELECT term_id FROM synonyms
+                                 WHERE synonym_name LIKE ? ESCAPE '\\'))""",
+            [search_param] * 4
+        )
+    
+    @staticmethod
+    def _build_chosung_filter(search_query: str) -> Tuple[str, list]:
+        """초성 검색 조건 (term_chosung 접두어 범위 검색)"""
+        start, end = search_index.chosung_range(search_query)
+        return (
+            " AND t.id IN (SELECT term_id FROM term_chosung WHERE key >= ? AND key < ?)",
+            [start, end]
+        )
+    
+    @staticmethod
+    def _fuzzy_scores(cursor, search_query: str,
+                      category_id: Optional[int] = None) -> Dict[int, Tuple[float, float]]:
+        """유사 검색 후보와 점수 조회
+        
+        자모 트라이그램 색인에서 검색어와 트라이그램을 공유하는 용어명/동의어만
+        후보로 모은 뒤, (검색어 트라이그램 일치 비율, 자카드 유사도)로 순위를 매긴다.
+        카테고리 조건은 FUZZY_LIMIT개로 자르기 전에 적용한다.
+        반환: {용어 ID: (일치 비율, 유사도)} (점수 높은 순)
         """
+        grams = search_index.fuzzy_grams(search_query)
+        if not grams:
+            return {}
+        
+        category_sql, category_params = "", []
+        if category_id:
+            category_sql = """
+            WHERE EXISTS (SELECT 1 FROM term_categories tc
+                          WHERE tc.term_id = k.term_id AND tc.category_id = ?)"""
+            category_params = [category_id]
+        
+        placeholders = ",".join("?" * len(grams))
+        cursor.execute(f"""
+            SELECT k.term_id,
+                   MAX(m.shared * 1.0 / ?) AS coverage,
+                   MAX(m.shared * 1.0 / (k.gram_count + ? - m.shared)) AS similarity
+            FROM (
+                SELECT key_id, COUNT(*) AS shared FROM term_fuzzy_grams
+                WHERE gram IN ({placeholders})
+                GROUP BY key_id
+            ) m
+            JOIN term_fuzzy_keys k ON k.id = m.key_id{category_sql}
+            GROUP BY k.term_id
+            HAVING coverage >= ?
+            ORDER BY coverage DESC, similarity DESC
+            LIMIT ?
+        """, [len(grams), len(grams), *grams, *category_params,
+              TermRepository.FUZZY_MIN_SCORE, TermRepository.FUZZY_LIMIT])
+        
+        return {term_id: (coverage, similarity)
+                for term_id, coverage, similarity in cursor.fetchall()}
+    
+    @staticmethod
+    def _build_filter(cursor, search_query: str, category_id: Optional[int],
+                      mode: str) -> Tuple[str, list, Optional[Dict[int, Tuple[float, float]]]]:
+        """검색/카테고리 조건 생성 (반환: WHERE 조건, 파라미터, 유사 검색 점수)"""
         params = []
         
-        if search_query:
-            query += " AND (t.name LIKE ? OR t.definition LIKE ? OR s.synonym_name LIKE ?)"
-            search_param = f"%{search_query}%"
-            params.extend([search_param, search_param, search_param])
+        # 검색 인덱스로 후보 용어 조회
+        fuzzy_scores = None
+        if mode == "chosung" and search_query.strip():
+            search_sql, search_params = TermRepository._build_chosung_filter(search_query)
+        elif mode == "fuzzy" and search_query.strip():
+            fuzzy_scores = TermRepository._fuzzy_scores(cursor, search_query, category_id)
+            placeholders = ",".join("?" * len(fuzzy_scores))
+            search_sql = f" AND t.id IN ({placeholders})" if fuzzy_scores else " AND 0"
+            search_params = list(fuzzy_scores)
+        else:
+            search_sql, search_params = TermRepository._build_search_filter(search_query)
+        where = " AND t.deleted_at IS NULL" + search_sql
+        params.extend(search_params)
         
         if category_id:
-            query += " AND tc.category_id = ?"
+            where += " AND t.id IN (SELECT term_id FROM term_categories WHERE category_id = ?)"
             params.append(category_id)
         
-        query += " ORDER BY t.name"
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        return where, params, fuzzy_scores
+    
+    @staticmethod
+    def get_all(search_query: str = "", category_id: Optional[int] = None,
+                mode: str = "text", cancel: Optional[threading.Event] = None) -> List[Term]:
+        """용어 목록 조회 (검색 및 필터링)
         
-        terms = []
-        for row in rows:
-            term = Term(
-                id=row['id'],
-                name=row['name'],
-                definition=row['definition'],
-                example=row['example'],
-                created_by=row['created_by'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at'],
-                creator_name=row['creator_name'] or ""
+        mode: 'text' (부분 문자열 검색), 'chosung' (초성 검색),
+              'fuzzy' (오타 허용 유사 검색, 유사도 순 정렬)
+        cancel: 설정되면 조회를 중단하고 QueryCancelled 발생
+        """
+        with connection() as conn, cancellable(conn, cancel):
+            cursor = _tuple_cursor(conn)
+            
+            where, params, fuzzy_scores = TermRepository._build_filter(
+                cursor, search_query, category_id, mode
             )
+            cursor.execute(f"""
+                SELECT {TermRepository._TERM_COLUMNS}
+                FROM terms t
+                LEFT JOIN users u ON t.created_by = u.id
+                WHERE 1=1{where}
+                ORDER BY t.name
+            """, params)
+            terms = list(map(TermRepository._row_to_term, cursor.fetchall()))
             
-            # 동의어 조회
-            cursor.execute(
-                "SELECT synonym_name FROM synonyms WHERE term_id = ?",
-                (term.id,)
+            # 유사 검색은 유사도 순 (동점이면 이름 순)
+            if fuzzy_scores:
+                terms.sort(key=lambda term: fuzzy_scores[term.id], reverse=True)
+            
+            # 관계 데이터 일괄 조회
+            TermRepository._load_relations(cursor, terms)
+            
+            return terms
+    
+    @staticmethod
+    def _search_cache_key(search_query: str, mode: str) -> Tuple[str, bool]:
+        """검색 결과 캐시 키와 메모리에서 좁힐 수 있는지 여부
+        
+        부분 문자열 검색은 fold_case로 대소문자를 통일하고 (검색어 길이와 관계없이
+        같은 규칙으로 비교하므로), 초성 검색은 초성 키로 정규화한다.
+        """
+        if mode == "chosung" and search_query.strip():
+            return chosung(search_query), True
+        if mode == "text":
+            return search_index.fold_case(search_query), True
+        return search_query, False
+    
+    @staticmethod
+    def _load_haystacks(cursor, term_ids: List[int], mode: str) -> Dict[int, str]:
+        """메모리 좁히기용 검색 대상 문자열 (필드 경계는 줄바꿈으로 구분)
+        
+        text: 용어명/정의/예시/동의어 (소문자), chosung: 용어명/동의어의 초성 키
+        """
+        fields: Dict[int, List[str]] = {}
+        for i in range(0, len(term_ids), TermRepository._RELATION_CHUNK_SIZE):
+            chunk = term_ids[i:i + TermRepository._RELATION_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT id, name, definition, example FROM terms WHERE id IN ({placeholders})
+            """, chunk)
+            for term_id, name, definition, example in cursor.fetchall():
+                if mode == "chosung":
+                    fields[term_id] = [chosung(name)]
+                else:
+                    fields[term_id] = [name, definition or "", example or ""]
+            cursor.execute(f"""
+                SELECT term_id, synonym_name FROM synonyms WHERE term_id IN ({placeholders})
+            """, chunk)
+            for term_id, synonym_name in cursor.fetchall():
+                fields[term_id].append(chosung(synonym_name) if mode == "chosung" else synonym_name)
+        
+        if mode == "chosung":
+            return {term_id: "\n".join(texts) for term_id, texts in fields.items()}
+        return {term_id: search_index.fold_case("\n".join(texts)) for term_id, texts in fields.items()}
+    
+    @staticmethod
+    def search_ids(search_query: str = "", category_id: Optional[int] = None,
+                   mode: str = "text", cancel: Optional[threading.Event] = None) -> List[int]:
+        """get_all()과 같은 조건/순서의 용어 ID 목록 (본문과 관계 데이터는 읽지 않음)
+        
+        결과는 캐시되며, 검색어가 이전 검색어를 포함하면 이전 결과를 메모리에서 좁힌다.
+        다른 사용자가 DB를 바꿨으면 캐시된 결과를 쓰지 않는다.
+        """
+        check_external_changes()
+        scope = (mode, category_id)
+        key, narrowable = TermRepository._search_cache_key(search_query, mode)
+        search_cache = TermRepository._search_cache
+        
+        ids = search_cache.get(scope, key)
+        if ids is None and narrowable:
+            ids = search_cache.narrow(scope, key)
+        if ids is not None:
+            return ids
+        
+        version_at_query = cache.version('terms')
+        with connection() as conn, cancellable(conn, cancel):
+            cursor = conn.cursor()
+            
+            where, params, fuzzy_scores = TermRepository._build_filter(
+                cursor, search_query, category_id, mode
             )
-            term.synonyms = [r['synonym_name'] for r in cursor.fetchall()]
+            cursor.execute(f"SELECT t.id FROM terms t WHERE 1=1{where} ORDER BY t.name", params)
+            ids = [row[0] for row in cursor.fetchall()]
             
-            # 카테고리 조회
-            cursor.execute("""
-                SELECT c.* FROM categories c
-                JOIN term_categories tc ON c.id = tc.category_id
-                WHERE tc.term_id = ?
-            """, (term.id,))
-            term.categories = [
-                Category(
-                    id=r['id'],
-                    name=r['name'],
-                    description=r['description'],
-                    color=r['color']
-                )
-                for r in cursor.fetchall()
-            ]
+            if fuzzy_scores:
+                ids.sort(key=lambda term_id: fuzzy_scores[term_id], reverse=True)
             
-            terms.append(term)
+            haystacks = None
+            if narrowable and len(ids) <= TermRepository.SEARCH_HAYSTACK_LIMIT:
+                haystacks = TermRepository._load_haystacks(cursor, ids, mode)
         
-        conn.close()
-        return terms
+        search_cache.put(scope, key, version_at_query, ids, haystacks)
+        return ids
     
     @staticmethod
-    def get_by_id(term_id: int) -> Optional[Term]:
-        """ID로 용어 조회"""
-        conn = get_connection()
-        cursor = conn.cursor()
+    def get_summaries(term_ids: List[int]) -> List[TermSummary]:
+        """ID 목록의 목록 표시용 요약 조회 (term_ids 순서 유지, 없는 ID는 제외)
+        
+        정의는 SQL에서 PREVIEW_LENGTH 글자로 자르고, 카테고리 이름은 이름순으로 이어 붙인다.
+        """
+        with connection() as conn:
+            cursor = _tuple_cursor(conn)
+            
+            by_id = {}
+            for i in range(0, len(term_ids), TermRepository._RELATION_CHUNK_SIZE):
+                chunk = term_ids[i:i + TermRepository._RELATION_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT t.id, t.name,
+                           CASE WHEN length(t.definition) > ?
+                                THEN substr(t.definition, 1, ?) || '...'
+                                ELSE t.definition END,
+                           (SELECT group_concat(name, ', ') FROM (
+                                SELECT c.name FROM term_categories tc
+                                JOIN categories c ON c.id = tc.category_id
+                                WHERE tc.term_id = t.id
+                                ORDER BY c.name
+                           ))
+                    FROM terms t
+                    WHERE t.id IN ({placeholders}) AND t.deleted_at IS NULL
+                """, [TermRepository.PREVIEW_LENGTH, TermRepository.PREVIEW_LENGTH, *chunk])
+                for term_id, name, preview, category_names in cursor.fetchall():
+                    by_id[term_id] = TermSummary(
+                        id=term_id,
+                        name=name,
+                        definition_preview=preview or "",
+                        category_names=category_names or ""
+                    )
+            
+            return [by_id[term_id] for term_id in term_ids if term_id in by_id]
+    
+    @staticmethod
+    def get_many(term_ids: List[int], include_deleted: bool = False) -> List[Term]:
+        """ID 목록의 용어 조회 (term_ids 순서 유지, 없는 ID는 제외)
+        
+        조회한 용어는 상세 캐시에도 넣는다. 반환한 객체는 캐시와 공유하므로 수정하지 않는다.
+        include_deleted면 삭제 표시된 용어도 포함하며, 이때는 캐시에 넣지 않는다.
+        """
+        live_sql = "" if include_deleted else " AND t.deleted_at IS NULL"
+        version_at_read = cache.version('terms')
+        with connection() as conn:
+            cursor = _tuple_cursor(conn)
+            
+            by_id = {}
+            for i in range(0, len(term_ids), TermRepository._RELATION_CHUNK_SIZE):
+                chunk = term_ids[i:i + TermRepository._RELATION_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT {TermRepository._TERM_COLUMNS}
+                    FROM terms t
+                    LEFT JOIN users u ON t.created_by = u.id
+                    WHERE t.id IN ({placeholders}){live_sql}
+                """, chunk)
+                for row in cursor.fetchall():
+                    by_id[row[0]] = TermRepository._row_to_term(row)
+            
+            terms = [by_id[term_id] for term_id in term_ids if term_id in by_id]
+            TermRepository._load_relations(cursor, terms)
         
-        cursor.execute("""
-            SELECT t.*, u.username as creator_name
+        if not include_deleted:
+            for term in terms:
+                TermRepository._detail_cache.put(term.id, term, version_at_read)
+        return terms
+    
+    @staticmethod
+    def _fetch_by_id(cursor, term_id: int, include_deleted: bool = False) -> Optional[Term]:
+        """ID로 용어 조회 (캐시를 거치지 않음, include_deleted면 삭제 표시된 용어도 포함)"""
+        live_sql = "" if include_deleted else " AND t.deleted_at IS NULL"
+        cursor.execute(f"""
+            SELECT {TermRepository._TERM_COLUMNS}
             FROM terms t
             LEFT JOIN users u ON t.created_by = u.id
-            WHERE t.id = ?
+            WHERE t.id = ?{live_sql}
         """, (term_id,))
         row = cursor.fetchone()
         
         if not row:
-            conn.close()
             return None
         
-        term = Term(
-            id=row['id'],
-            name=row['name'],
-            definition=row['definition'],
-            example=row['example'],
-            created_by=row['created_by'],
-            created_at=row['created_at'],
-            updated_at=row['updated_at'],
-            creator_name=row['creator_name'] or ""
-        )
+        term = TermRepository._row_to_term(row)
+        TermRepository._load_relations(cursor, [term])
         
-        # 동의어 조회
-        cursor.execute(
-            "SELECT synonym_name FROM synonyms WHERE term_id = ?",
-            (term.id,)
-        )
-        term.synonyms = [r['synonym_name'] for r in cursor.fetchall()]
-        
-        # 카테고리 조회
-        cursor.execute("""
-            SELECT c.* FROM categories c
-            JOIN term_categories tc ON c.id = tc.category_id
-            WHERE tc.term_id = ?
-        """, (term.id,))
-        term.categories = [
-            Category(
-                id=r['id'],
-                name=r['name'],
-                description=r['description'],
-                color=r['color']
-            )
-            for r in cursor.fetchall()
-        ]
-        
-        conn.close()
         return term
     
+    @staticmethod
+    def _copy(term: Term) -> Term:
+        """캐시 항목의 복사본 (호출하는 쪽에서 수정해도 캐시에 영향 없음)"""
+        return replace(term, synonyms=list(term.synonyms), categories=list(term.categories))
+    
+    @staticmethod
+    def get_cached(term_id: int) -> Optional[Term]:
+        """캐시에 있는 용어 (없으면 None)
+        
+        용어는 DB에서 읽지 않고, 다른 사용자가 DB를 바꿨는지만 확인한다 (바뀌었으면 None).
+        """
+        check_external_changes()
+        term = TermRepository._detail_cache.get(term_id)
+        return TermRepository._copy(term) if term else None
+    
+    @staticmethod
+    def get_by_id(term_id: int) -> Optional[Term]:
+        """ID로 용어 조회 (캐시 우선)"""
+        cached = TermRepository.get_cached(term_id)
+        if cached:
+            return cached
+        
+        version_at_read = cache.version('terms')
+        with connection() as conn:
+            term = TermRepository._fetch_by_id(_tuple_cursor(conn), term_id)
+        
+        if not term:
+            return None
+        TermRepository._detail_cache.put(term_id, term, version_at_read)
+        return TermRepository._copy(term)
+    
+    @staticmethod
+    def prefetch(term_ids: List[int]):
+        """캐시에 없는 용어만 미리 읽어 둠"""
+        check_external_changes()
+        missing = [term_id for term_id in term_ids
+                   if TermRepository._detail_cache.get(term_id) is None]
+        if missing:
+            TermRepository.get_many(missing)
+    
     @staticmethod
     def create(term: Term, user_id: int, category_ids: List[int] = None) -> int:
         """용어 생성"""
-        conn = get_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(
+                """INSERT INTO terms (name, definition, example, created_by)
+                   VALUES (?, ?, ?, ?)""",
+                (term.name, term.definition, term.example, user_id)
+            )
+            term_id = cursor.lastrowid
+            
+            # 동의어 저장 (수정 시와 같이 중복 없이)
+            synonyms = list(dict.fromkeys(s.strip() for s in term.synonyms if s.strip()))
+            cursor.executemany(
+                "INSERT INTO synonyms (term_id, synonym_name) VALUES (?, ?)",
+                [(term_id, synonym) for synonym in synonyms]
+            )
+            
+            # 카테고리 연결
+            if category_ids:
+                for cat_id in category_ids:
+                    cursor.execute(
+                        "INSERT INTO term_categories (term_id, category_id) VALUES (?, ?)",
+                        (term_id, cat_id)
+                    )
+            
+            # 검색 색인 갱신
+            search_index.index_term(
+                cursor, term_id, term.name, term.definition, term.example, synonyms
+            )
+            
+            # 히스토리 기록
+            cursor.execute(
+                """INSERT INTO term_history 
+                   (term_id, action_type, field_name, new_value, changed_by)
+                   VALUES (?, 'create', 'term', ?, ?)""",
+                (term_id, term.name, user_id)
+            )
+            history_store.checkpoint_if_due(cursor, term_id)
         
-        cursor.execute(
-            """INSERT INTO terms (name, definition, example, created_by)
-               VALUES (?, ?, ?, ?)""",
-            (term.name, term.definition, term.example, user_id)
-        )
-        term_id = cursor.lastrowid
+        cache.bump('terms')
+        return term_id
+    
+    @staticmethod
+    def update(term: Term, user_id: int, category_ids: List[int] = None):
+        """용어 수정 (히스토리 자동 기록)
         
-        # 동의어 저장
-        for synonym in term.synonyms:
-            if synonym.strip():
+        기존 상태를 같은 트랜잭션 안에서 읽어 비교하고, 바뀐 필드와 추가/삭제된
+        동의어·카테고리 연결만 기록한다. 바뀐 것이 없으면 아무것도 쓰지 않는다.
+        """
+        with transaction() as conn:
+            cursor = _tuple_cursor(conn)
+            
+            # 기존 데이터 조회 (같은 트랜잭션 안에서 DB 기준으로)
+            cursor.execute(
+                "SELECT name, definition, example FROM terms WHERE id = ? AND deleted_at IS NULL",
+                (term.id,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return
+            old_name, old_definition, old_example = row[0], row[1], row[2] or ""
+            
+            # 이전 버전에서 중복 저장된 동의어도 행마다 색인 키가 있으므로 행 목록도 보관
+            cursor.execute("SELECT synonym_name FROM synonyms WHERE term_id = ?", (term.id,))
+            old_synonym_rows = [synonym for synonym, in cursor.fetchall()]
+            old_synonyms = set(old_synonym_rows)
+            cursor.execute(
+                "SELECT category_id FROM term_categories WHERE term_id = ?", (term.id,)
+            )
+            old_category_ids = {category_id for category_id, in cursor.fetchall()}
+            
+            new_synonyms = {s.strip() for s in term.synonyms if s.strip()}
+            new_category_ids = set(category_ids or [])
+            
+            # 변경 사항 기록
+            changes = []
+            if old_name != term.name:
+                changes.append(('name', old_name, term.name))
+            if old_definition != term.definition:
+                changes.append(('definition', old_definition, term.definition))
+            if old_example != term.example:
+                changes.append(('example', old_example, term.example))
+            fields_changed = bool(changes)
+            
+            if old_synonyms != new_synonyms:
+                changes.append(('synonyms', history_store.join_synonyms(old_synonyms),
+                                history_store.join_synonyms(new_synonyms)))
+            
+            if not changes and old_category_ids == new_category_ids:
+                return
+            
+            # 용어 업데이트 (필드가 그대로면 FTS 트리거가 돌지 않도록 수정 시각만 갱신)
+            if fields_changed:
                 cursor.execute(
-                    "INSERT INTO synonyms (term_id, synonym_name) VALUES (?, ?)",
-                    (term_id, synonym.strip())
+                    """UPDATE terms 
+                       SET name = ?, definition = ?, example = ?, updated_at = CURRENT_TIMESTAMP
+                       WHERE id = ?""",
+                    (term.name, term.definition, term.example, term.id)
                 )
-        
-        # 카테고리 연결
-        if category_ids:
-            for cat_id in category_ids:
+            else:
                 cursor.execute(
+                    "UPDATE terms SET updated_at = CURRENT_TIMESTAMP WHERE id = ?", (term.id,)
+                )
+            
+            # 동의어 업데이트 (추가/삭제된 것만)
+            removed_synonyms = old_synonyms - new_synonyms
+            if removed_synonyms:
+                cursor.executemany(
+                    "DELETE FROM synonyms WHERE term_id = ? AND synonym_name = ?",
+                    [(term.id, synonym) for synonym in removed_synonyms]
+                )
+            added_synonyms = new_synonyms - old_synonyms
+            if added_synonyms:
+                cursor.executemany(
+                    "INSERT INTO synonyms (term_id, synonym_name) VALUES (?, ?)",
+                    [(term.id, synonym) for synonym in added_synonyms]
+                )
+            
+            # 카테고리 업데이트 (추가/삭제된 연결만)
+            removed_categories = old_category_ids - new_category_ids
+            if removed_categories:
+                cursor.executemany(
+                    "DELETE FROM term_categories WHERE term_id = ? AND category_id = ?",
+                    [(term.id, cat_id) for cat_id in removed_categories]
+                )
+            added_categories = new_category_ids - old_category_ids
+            if added_categories:
+                cursor.executemany(
                     "INSERT INTO term_categories (term_id, category_id) VALUES (?, ?)",
-                    (term_id, cat_id)
+                    [(term.id, cat_id) for cat_id in added_categories]
                 )
+            
+            # 검색 색인 갱신 (바뀐 키만, 동의어는 삭제/추가 후 남는 행 기준)
+            new_synonym_rows = [synonym for synonym in old_synonym_rows
+                                if synonym not in removed_synonyms] + list(added_synonyms)
+            search_index.update_term(
+                cursor, term.id,
+                (old_name, old_definition, old_example, old_synonym_rows),
+                (term.name, term.definition, term.example, new_synonym_rows)
+            )
+            
+            # 히스토리 기록 (값은 원문 또는 델타로 저장)
+            if changes:
+                history_store.insert_updates(cursor, term.id, changes, user_id)
+                history_store.checkpoint_if_due(cursor, term.id)
         
-        # 히스토리 기록
+        cache.bump('terms')
+    
+    @staticmethod
+    def _select_revert_rows(cursor, history_filter: Optional[HistoryFilter],
+                            history_ids: Optional[List[int]]) -> List[tuple]:
+        """되돌릴 이력 행 [(id, term_id, action_type, field_name, old_value, 델타 여부), ...] (ID순)"""
+        columns = "h.id, h.term_id, h.action_type, h.field_name, h.old_value, h.value_delta IS NOT NULL"
+        
+        if history_ids is not None:
+            rows = []
+            for i in range(0, len(history_ids), TermRepository._RELATION_CHUNK_SIZE):
+                chunk = history_ids[i:i + TermRepository._RELATION_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT {columns} FROM term_history h WHERE h.id IN ({placeholders})", chunk)
+                rows.extend(cursor.fetchall())
+            rows.sort()
+            return rows
+        
+        conditions, params = HistoryRepository._build_filter(history_filter)
+        if not conditions:
+            raise ValueError("되돌릴 이력의 조건(사용자, 기간 등)이 없습니다.")
         cursor.execute(
-            """INSERT INTO term_history 
-               (term_id, action_type, field_name, new_value, changed_by)
-               VALUES (?, 'create', 'term', ?, ?)""",
-            (term_id, term.name, user_id)
+            f"SELECT {columns} FROM term_history h WHERE {' AND '.join(conditions)} ORDER BY h.id",
+            params
         )
+        return cursor.fetchall()
+    
+    @staticmethod
+    def _load_current_fields(cursor, term_ids: List[int]) -> Dict[int, Dict[str, object]]:
+        """용어별 현재 필드 {용어 ID: {'name', 'definition', 'example', 'synonyms'(집합)}} (삭제된 용어 제외)
         
-        conn.commit()
-        conn.close()
-        return term_id
+        'synonym_rows'에는 동의어 행 목록을 중복 행까지 그대로 담는다 (검색 색인 갱신용).
+        """
+        current: Dict[int, Dict[str, object]] = {}
+        for i in range(0, len(term_ids), TermRepository._RELATION_CHUNK_SIZE):
+            chunk = term_ids[i:i + TermRepository._RELATION_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"""SELECT id, name, definition, example FROM terms
+                    WHERE id IN ({placeholders}) AND deleted_at IS NULL""", chunk
+            )
+            for term_id, name, definition, example in cursor.fetchall():
+                current[term_id] = {'name': name, 'definition': definition,
+                                    'example': example or "", 'synonyms': set(),
+                                    'synonym_rows': []}
+            cursor.execute(
+                f"SELECT term_id, synonym_name FROM synonyms WHERE term_id IN ({placeholders})", chunk
+            )
+            for term_id, synonym_name in cursor.fetchall():
+                if term_id in current:
+                    current[term_id]['synonyms'].add(synonym_name)
+                    current[term_id]['synonym_rows'].append(synonym_name)
+        return current
     
     @staticmethod
-    def update(term: Term, user_id: int, category_ids: List[int] = None):
-        """용어 수정 (히스토리 자동 기록)"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # 기존 데이터 조회
-        old_term = TermRepository.get_by_id(term.id)
-        if not old_term:
-            conn.close()
-            return
+    def _plan_revert(cursor, history_filter: Optional[HistoryFilter],
+                     history_ids: Optional[List[int]]) -> Tuple[Dict[int, tuple], RevertResult]:
+        """되돌리기 계획: ({용어 ID: (현재 필드, 목표 필드, 변경 목록)}, 결과 요약)
         
-        # 변경 사항 기록
-        changes = []
-        if old_term.name != term.name:
-            changes.append(('name', old_term.name, term.name))
-        if old_term.definition != term.definition:
-            changes.append(('definition', old_term.definition, term.definition))
-        if old_term.example != term.example:
-            changes.append(('example', old_term.example, term.example))
+        (용어, 필드)마다 선택한 수정 중 가장 이른 것의 이전 값이 목표 값이다.
+        그 뒤에 선택하지 않은 수정이 하나라도 있는 필드는 (선택한 수정 사이에 끼어 있어도)
+        덮어쓰지 않고 충돌로 보고한다 (현재 값이 이미 목표 값이면 충돌로 보지 않고 건너뜀).
+        """
+        rows = TermRepository._select_revert_rows(cursor, history_filter, history_ids)
+        updates = [row for row in rows if row[2] == 'update']
+        result = RevertResult(skipped=len(rows) - len(updates))
         
-        # 용어 업데이트
-        cursor.execute(
-            """UPDATE terms 
-               SET name = ?, definition = ?, example = ?, updated_at = CURRENT_TIMESTAMP
-               WHERE id = ?""",
-            (term.name, term.definition, term.example, term.id)
+        delta_values = history_store.resolve_values(
+            cursor, [(row[0], row[1], row[3]) for row in updates if row[5]]
         )
+        # (용어, 필드) -> (목표 값, 선택한 첫 이력 ID)
+        targets: Dict[Tuple[int, str], Tuple[Optional[str], int]] = {}
+        selected = set()
+        for history_id, term_id, _, field_name, old_value, is_delta in updates:
+            if is_delta:
+                old_value = delta_values[history_id][0]
+            selected.add(history_id)
+            targets.setdefault((term_id, field_name), (old_value, history_id))
         
-        # 동의어 업데이트 (기존 삭제 후 재삽입)
-        old_synonyms = set(old_term.synonyms)
-        new_synonyms = set(s.strip() for s in term.synonyms if s.strip())
+        # 선택한 첫 수정 뒤에 선택하지 않은 수정이 있는 (용어, 필드)
+        term_ids = sorted({term_id for term_id, _ in targets})
+        overwritten = set()
+        for i in range(0, len(term_ids), TermRepository._RELATION_CHUNK_SIZE):
+            chunk = term_ids[i:i + TermRepository._RELATION_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT id, term_id, field_name FROM term_history
+                WHERE action_type = 'update' AND term_id IN ({placeholders})
+            """, chunk)
+            for history_id, term_id, field_name in cursor.fetchall():
+                key = (term_id, field_name)
+                if key in targets and history_id > targets[key][1] and history_id not in selected:
+                    overwritten.add(key)
         
-        if old_synonyms != new_synonyms:
-            changes.append(('synonyms', ', '.join(old_synonyms), ', '.join(new_synonyms)))
+        current = TermRepository._load_current_fields(cursor, term_ids)
+        plan: Dict[int, tuple] = {}
+        for (term_id, field_name), (value, _) in targets.items():
+            if term_id not in current or field_name not in current[term_id]:
+                continue
+            old_fields = current[term_id]
+            if field_name == 'synonyms':
+                value = set(history_store.split_synonyms(value))
+            else:
+                value = value or ""
+            
+            # 이미 목표 값이면 (다시 실행한 경우 등) 건너뜀
+            if value == old_fields[field_name]:
+                continue
+            if (term_id, field_name) in overwritten:
+                result.conflicts.append((term_id, field_name))
+                continue
+            
+            if term_id not in plan:
+                plan[term_id] = (old_fields, dict(old_fields), [])
+            new_fields, changes = plan[term_id][1], plan[term_id][2]
+            if field_name == 'synonyms':
+                changes.append(('synonyms', history_store.join_synonyms(old_fields['synonyms']),
+                                history_store.join_synonyms(value)))
+            else:
+                changes.append((field_name, old_fields[field_name], value))
+            new_fields[field_name] = value
         
-        cursor.execute("DELETE FROM synonyms WHERE term_id = ?", (term.id,))
-        for synonym in new_synonyms:
-            cursor.execute(
-                "INSERT INTO synonyms (term_id, synonym_name) VALUES (?, ?)",
-                (term.id, synonym)
-            )
+        result.term_count = len(plan)
+        result.field_count = sum(len(entry[2]) for entry in plan.values())
+        return plan, result
+    
+    @staticmethod
+    def revert_changes(reverted_by: int, history_filter: Optional[HistoryFilter] = None,
+                       history_ids: Optional[List[int]] = None, dry_run: bool = False) -> RevertResult:
+        """수정 이력 일괄 되돌리기
         
-        # 카테고리 업데이트
-        cursor.execute("DELETE FROM term_categories WHERE term_id = ?", (term.id,))
-        if category_ids:
-            for cat_id in category_ids:
-                cursor.execute(
-                    "INSERT INTO term_categories (term_id, category_id) VALUES (?, ?)",
-                    (term.id, cat_id)
-                )
+        history_filter(사용자, 기간 등) 또는 history_ids로 고른 수정 이력을 되돌린다.
+        모든 용어를 한 트랜잭션에서 묶음 쓰기로 갱신하고, 되돌린 내용은 reverted_by의
+        새 수정 이력으로 남긴다. dry_run이면 쓰지 않고 결과 요약만 계산한다.
+        """
+        if dry_run:
+            with connection() as conn:
+                _, result = TermRepository._plan_revert(_tuple_cursor(conn), history_filter, history_ids)
+            return result
         
-        # 히스토리 기록
-        for field_name, old_val, new_val in changes:
-            cursor.execute(
-                """INSERT INTO term_history 
-                   (term_id, action_type, field_name, old_value, new_value, changed_by)
-                   VALUES (?, 'update', ?, ?, ?, ?)""",
-                (term.id, field_name, old_val, new_val, user_id)
+        with transaction() as conn:
+            cursor = _tuple_cursor(conn)
+            plan, result = TermRepository._plan_revert(cursor, history_filter, history_ids)
+            
+            field_rows, touch_rows = [], []
+            removed_synonyms, added_synonyms = [], []
+            for term_id, (old_fields, new_fields, changes) in plan.items():
+                if any(field_name != 'synonyms' for field_name, _, _ in changes):
+                    field_rows.append((new_fields['name'], new_fields['definition'],
+                                       new_fields['example'], term_id))
+                else:
+                    touch_rows.append((term_id,))
+                removed_synonyms.extend((term_id, synonym) for synonym
+                                        in old_fields['synonyms'] - new_fields['synonyms'])
+                added_synonyms.extend((term_id, synonym) for synonym
+                                      in new_fields['synonyms'] - old_fields['synonyms'])
+            
+            cursor.executemany(
+                """UPDATE terms 
+                   SET name = ?, definition = ?, example = ?, updated_at = CURRENT_TIMESTAMP
+                   WHERE id = ?""",
+                field_rows
+            )
+            cursor.executemany(
+                "UPDATE terms SET updated_at = CURRENT_TIMESTAMP WHERE id = ?", touch_rows
+            )
+            cursor.executemany(
+                "DELETE FROM synonyms WHERE term_id = ? AND synonym_name = ?", removed_synonyms
+            )
+            cursor.executemany(
+                "INSERT INTO synonyms (term_id, synonym_name) VALUES (?, ?)", added_synonyms
             )
+            
+            # 검색 색인 (용어별 바뀐 키만, 동의어는 삭제/추가 후 남는 행 기준)
+            for term_id, (old_fields, new_fields, changes) in plan.items():
+                old_rows = old_fields['synonym_rows']
+                new_rows = ([synonym for synonym in old_rows if synonym in new_fields['synonyms']]
+                            + sorted(new_fields['synonyms'] - old_fields['synonyms']))
+                search_index.update_term(
+                    cursor, term_id,
+                    (old_fields['name'], old_fields['definition'], old_fields['example'], old_rows),
+                    (new_fields['name'], new_fields['definition'], new_fields['example'], new_rows)
+                )
+            
+            # 히스토리와 체크포인트 (모든 용어를 묶어 기록)
+            history_store.insert_updates_many(
+                cursor, {term_id: changes for term_id, (_, _, changes) in plan.items()}, reverted_by
+            )
+            history_store.checkpoint_many_if_due(cursor, list(plan))
         
-        conn.commit()
-        conn.close()
+        if plan:
+            cache.bump('terms')
+        return result
     
     @staticmethod
     def delete(term_id: int, user_id: int):
-        """용어 삭제"""
-        conn = get_connection()
-        cursor = conn.cursor()
+        """용어 삭제 (deleted_at 삭제 표시, 이력과 관계 데이터는 남김)
         
-        # 삭제 전 이름 조회
-        cursor.execute("SELECT name FROM terms WHERE id = ?", (term_id,))
-        row = cursor.fetchone()
-        if row:
-            term_name = row['name']
+        검색 색인에서는 바로 제거하므로 목록/검색에 나타나지 않는다.
+        행은 purge_deleted()가 나중에 영구 삭제한다.
+        """
+        with transaction() as conn:
+            cursor = _tuple_cursor(conn)
+            
+            # 삭제 전 이름 조회
+            cursor.execute(
+                "SELECT name FROM terms WHERE id = ? AND deleted_at IS NULL", (term_id,)
+            )
+            row = cursor.fetchone()
+            if row:
+                term_name = row[0]
+                
+                # 히스토리 기록
+                cursor.execute(
+                    """INSERT INTO term_history 
+                       (term_id, action_type, field_name, old_value, changed_by)
+                       VALUES (?, 'delete', 'term', ?, ?)""",
+                    (term_id, term_name, user_id)
+                )
+                
+                # 삭제 표시
+                cursor.execute(
+                    "UPDATE terms SET deleted_at = CURRENT_TIMESTAMP WHERE id = ?", (term_id,)
+                )
+                search_index.remove_term(cursor, term_id)
+        
+        cache.bump('terms')
+    
+    @staticmethod
+    def restore(term_id: int, user_id: int) -> bool:
+        """삭제한 용어 복원 (반환: 복원 여부, 영구 삭제됐거나 삭제 상태가 아니면 False)"""
+        with transaction() as conn:
+            cursor = _tuple_cursor(conn)
+            
+            cursor.execute(
+                "SELECT name FROM terms WHERE id = ? AND deleted_at IS NOT NULL", (term_id,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return False
+            
+            cursor.execute("UPDATE terms SET deleted_at = NULL WHERE id = ?", (term_id,))
+            search_index.restore_term(cursor, term_id)
             
             # 히스토리 기록
             cursor.execute(
                 """INSERT INTO term_history 
-                   (term_id, action_type, field_name, old_value, changed_by)
-                   VALUES (?, 'delete', 'term', ?, ?)""",
-                (term_id, term_name, user_id)
+                   (term_id, action_type, field_name, new_value, changed_by)
+                   VALUES (?, 'restore', 'term', ?, ?)""",
+                (term_id, row[0], user_id)
             )
-            
-            # 삭제
-            cursor.execute("DELETE FROM terms WHERE id = ?", (term_id,))
         
-        conn.commit()
-        conn.close()
+        cache.bump('terms')
+        return True
+    
+    # 영구 삭제 한 번에 처리할 용어 수 (배치마다 커밋)
+    PURGE_BATCH_SIZE = 500
+    
+    @staticmethod
+    def purge_deleted(deleted_before: Optional[datetime] = None,
+                      batch_size: int = PURGE_BATCH_SIZE) -> int:
+        """삭제 표시된 용어를 영구 삭제 (반환: 삭제한 용어 수)
+        
+        deleted_before(UTC)보다 먼저 삭제된 용어만 대상으로 하며 (None이면 전체),
+        배치마다 따로 커밋해 다른 사용자의 쓰기를 오래 막지 않는다.
+        동의어, 카테고리 연결, 검색 색인, 체크포인트는 함께 삭제되고 이력은 남는다.
+        """
+        condition, params = "deleted_at IS NOT NULL", []
+        if deleted_before is not None:
+            condition += " AND deleted_at < ?"
+            params.append(deleted_before.strftime("%Y-%m-%d %H:%M:%S"))
+        
+        purged = 0
+        while True:
+            with transaction() as conn:
+                cursor = _tuple_cursor(conn)
+                cursor.execute(
+                    f"SELECT id FROM terms WHERE {condition} ORDER BY deleted_at LIMIT ?",
+                    params + [batch_size]
+                )
+                term_ids = [term_id for term_id, in cursor.fetchall()]
+                if term_ids:
+                    placeholders = ",".join("?" * len(term_ids))
+                    cursor.execute(f"DELETE FROM terms WHERE id IN ({placeholders})", term_ids)
+            
+            purged += len(term_ids)
+            if len(term_ids) < batch_size:
+                return purged
 
 
 class HistoryRepository:
     """변경 이력 리포지토리"""
     
+    # 이력 조회 컬럼 (_row_to_history의 위치 순서와 같아야 함, 마지막은 델타 여부)
+    _HISTORY_COLUMNS = """h.id, h.term_id, h.action_type, h.field_name, h.old_value,
+                          h.new_value, h.changed_by, h.changed_at, u.username, t.name,
+                          h.value_delta IS NOT NULL"""
+    
+    @staticmethod
+    def _row_to_history(row: tuple) -> TermHistory:
+        """_HISTORY_COLUMNS 순서의 튜플을 TermHistory 객체로 변환"""
+        return TermHistory(row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
+                           row[8] or "알 수 없음", row[9] or "(삭제됨)")
+    
     @staticmethod
-    def get_all(limit: int = 100) -> List[TermHistory]:
-        """전체 히스토리 조회"""
-        conn = get_connection()
-        cursor = conn.cursor()
+    def _fetch_history(cursor) -> List[TermHistory]:
+        """조회 결과를 TermHistory 목록으로 변환
         
-        cursor.execute("""
-            SELECT h.*, u.username as changer_name, t.name as term_name
-            FROM term_history h
-            LEFT JOIN users u ON h.changed_by = u.id
-            LEFT JOIN terms t ON h.term_id = t.id
-            ORDER BY h.changed_at DESC
-            LIMIT ?
-        """, (limit,))
-        
-        history = [
-            TermHistory(
-                id=row['id'],
-                term_id=row['term_id'],
-                action_type=row['action_type'],
-                field_name=row['field_name'],
-                old_value=row['old_value'],
-                new_value=row['new_value'],
-                changed_by=row['changed_by'],
-                changed_at=row['changed_at'],
-                changer_name=row['changer_name'] or "알 수 없음",
-                term_name=row['term_name'] or "(삭제됨)"
-            )
-            for row in cursor.fetchall()
-        ]
+        델타로 저장된 값은 복원하고, 동의어 값은 화면 표시용 문자열로 바꾼다.
+        """
+        rows = cursor.fetchall()
+        history = list(map(HistoryRepository._row_to_history, rows))
         
-        conn.close()
+        delta_rows = [(h.id, h.term_id, h.field_name) for h, row in zip(history, rows) if row[10]]
+        if delta_rows:
+            values = history_store.resolve_values(cursor, delta_rows)
+            for h in history:
+                if h.id in values:
+                    h.old_value, h.new_value = values[h.id]
+        
+        for h in history:
+            if h.field_name == 'synonyms':
+                h.old_value = history_store.format_synonyms(h.old_value)
+                h.new_value = history_store.format_synonyms(h.new_value)
         return history
     
+    @staticmethod
+    def _to_ts(value: datetime) -> int:
+        """UTC datetime을 changed_ts(Unix 초)로 변환"""
+        return calendar.timegm(value.timetuple())
+    
+    @staticmethod
+    def _build_filter(history_filter: Optional[HistoryFilter]) -> Tuple[List[str], list]:
+        """조회 조건 WHERE 절 목록과 파라미터"""
+        conditions, params = [], []
+        if history_filter is None:
+            return conditions, params
+        
+        for column in ('changed_by', 'action_type', 'field_name', 'term_id'):
+            value = getattr(history_filter, column)
+            if value is not None:
+                conditions.append(f"h.{column} = ?")
+                params.append(value)
+        if history_filter.changed_from is not None:
+            conditions.append("h.changed_ts >= ?")
+            params.append(HistoryRepository._to_ts(history_filter.changed_from))
+        if history_filter.changed_to is not None:
+            conditions.append("h.changed_ts < ?")
+            params.append(HistoryRepository._to_ts(history_filter.changed_to))
+        return conditions, params
+    
+    @staticmethod
+    def get_page(before: Optional[Tuple[str, int]] = None, limit: int = 100,
+                 history_filter: Optional[HistoryFilter] = None) -> List[TermHistory]:
+        """최신순 히스토리 한 페이지 (키셋 페이지네이션)
+        
+        before: 이전 페이지 마지막 항목의 (changed_at, id). 이 키보다 오래된 항목부터
+        limit개를 읽는다. 정렬과 키 비교는 정수 시각 changed_ts로 하므로 조건이
+        없으면 idx_history_ts, 조건이 있으면 (조건 컬럼, changed_ts) 복합 인덱스의
+        범위만 읽고, OFFSET과 달리 페이지 위치와 관계없이 조회 비용이 같다.
+        """
+        conditions, params = HistoryRepository._build_filter(history_filter)
+        if before is not None:
+            conditions.append("(h.changed_ts, h.id) < (CAST(strftime('%s', ?) AS INTEGER), ?)")
+            params.extend(before)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        with connection() as conn:
+            cursor = _tuple_cursor(conn)
+            
+            cursor.execute(f"""
+                SELECT {HistoryRepository._HISTORY_COLUMNS}
+                FROM term_history h
+                LEFT JOIN users u ON h.changed_by = u.id
+                LEFT JOIN terms t ON h.term_id = t.id
+                {where}
+                ORDER BY h.changed_ts DESC, h.id DESC
+                LIMIT ?
+            """, params + [limit])
+            
+            return HistoryRepository._fetch_history(cursor)
+    
+    @staticmethod
+    def get_by_id(history_id: int) -> Optional[TermHistory]:
+        """ID로 히스토리 조회"""
+        with connection() as conn:
+            cursor = _tuple_cursor(conn)
+            
+            cursor.execute(f"""
+                SELECT {HistoryRepository._HISTORY_COLUMNS}
+                FROM term_history h
+                LEFT JOIN users u ON h.changed_by = u.id
+                LEFT JOIN terms t ON h.term_id = t.id
+                WHERE h.id = ?
+            """, (history_id,))
+            history = HistoryRepository._fetch_history(cursor)
+            
+            return history[0] if history else None
+    
     @staticmethod
     def get_by_term(term_id: int) -> List[TermHistory]:
-        """특정 용어의 히스토리 조회"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT h.*, u.username as changer_name, t.name as term_name
-            FROM term_history h
-            LEFT JOIN users u ON h.changed_by = u.id
-            LEFT JOIN terms t ON h.term_id = t.id
-            WHERE h.term_id = ?
-            ORDER BY h.changed_at DESC
-        """, (term_id,))
+        """특정 용어의 히스토리 조회 (최신순, 같은 초의 변경은 나중 것이 먼저)"""
+        with connection() as conn:
+            cursor = _tuple_cursor(conn)
+            
+            cursor.execute(f"""
+                SELECT {HistoryRepository._HISTORY_COLUMNS}
+                FROM term_history h
+                LEFT JOIN users u ON h.changed_by = u.id
+                LEFT JOIN terms t ON h.term_id = t.id
+                WHERE h.term_id = ?
+                ORDER BY h.changed_ts DESC, h.id DESC
+            """, (term_id,))
+            
+            return HistoryRepository._fetch_history(cursor)
+    
+    @staticmethod
+    def _apply_fields(term: Term, fields: Dict[str, Optional[str]]):
+        """재구성한 필드를 용어에 반영 (수정 시각은 알 수 없으므로 비움)"""
+        term.name = fields['name']
+        term.definition = fields['definition']
+        term.example = fields['example'] or ""
+        term.synonyms = history_store.split_synonyms(fields['synonyms'])
+        term.updated_at = None
+    
+    @staticmethod
+    def _history_ids_at(cursor, term_ids: List[int], at: datetime) -> Dict[int, int]:
+        """at 시점까지의 용어별 마지막 이력 ID {용어 ID: 이력 ID} (없으면 0)"""
+        history_ids = dict.fromkeys(term_ids, 0)
+        for i in range(0, len(term_ids), TermRepository._RELATION_CHUNK_SIZE):
+            chunk = term_ids[i:i + TermRepository._RELATION_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT term_id, MAX(id) FROM term_history
+                WHERE term_id IN ({placeholders}) AND changed_ts <= ?
+                GROUP BY term_id
+            """, [*chunk, HistoryRepository._to_ts(at)])
+            history_ids.update(cursor.fetchall())
+        return history_ids
+    
+    @staticmethod
+    def get_term_as_of(term_id: int, at: Optional[datetime] = None,
+                       history_id: Optional[int] = None) -> Optional[Term]:
+        """과거 시점의 용어 (at: UTC 시각, history_id: 이 이력 행까지 반영)
+        
+        그 시점에 없던 용어면 None. 카테고리 연결은 이력이 없으므로 현재 연결을 쓴다.
+        삭제 표시된 용어도 재구성하지만, 영구 삭제된 용어는 체크포인트가 없으므로 None.
+        """
+        with connection() as conn:
+            cursor = _tuple_cursor(conn)
+            term = TermRepository._fetch_by_id(cursor, term_id, include_deleted=True)
+            if not term:
+                return None
+            if history_id is None:
+                history_id = HistoryRepository._history_ids_at(
+                    cursor, [term_id], at or datetime.now(timezone.utc)
+                )[term_id]
+            fields = history_store.reconstruct(cursor, term_id, history_id)
         
-        history = [
-            TermHistory(
-                id=row['id'],
-                term_id=row['term_id'],
-                action_type=row['action_type'],
-                field_name=row['field_name'],
-                old_value=row['old_value'],
-                new_value=row['new_value'],
-                changed_by=row['changed_by'],
-                changed_at=row['changed_at'],
-                changer_name=row['changer_name'] or "알 수 없음",
-                term_name=row['term_name'] or "(삭제됨)"
+        if fields is None:
+            return None
+        HistoryRepository._apply_fields(term, fields)
+        return term
+    
+    @staticmethod
+    def get_glossary_as_of(at: datetime) -> List[Term]:
+        """과거 시점의 전체 용어 목록 (이름순)
+        
+        at 이후 이력이 있는 용어만 체크포인트에서 재구성하고, 나머지는 현재 상태를 그대로 쓴다.
+        at 이후에 삭제 표시된 용어도 포함한다.
+        """
+        ts = HistoryRepository._to_ts(at)
+        with connection() as conn:
+            cursor = _tuple_cursor(conn)
+            cursor.execute(
+                "SELECT DISTINCT term_id FROM term_history WHERE changed_ts > ?", (ts,)
             )
-            for row in cursor.fetchall()
-        ]
+            changed = {term_id for term_id, in cursor.fetchall()}
+            cursor.execute("""
+                SELECT id FROM terms
+                WHERE CAST(strftime('%s', created_at) AS INTEGER) <= ?
+                  AND (deleted_at IS NULL OR CAST(strftime('%s', deleted_at) AS INTEGER) > ?)
+            """, (ts, ts))
+            term_ids = [term_id for term_id, in cursor.fetchall()]
         
-        conn.close()
-        return history
+        # 삭제된 용어도 포함하므로 캐시와 공유하지 않는 객체 (그대로 수정해도 됨)
+        terms = TermRepository.get_many(term_ids, include_deleted=True)
+        
+        with connection() as conn:
+            cursor = _tuple_cursor(conn)
+            history_ids = HistoryRepository._history_ids_at(
+                cursor, [term.id for term in terms if term.id in changed], at
+            )
+            states = history_store.reconstruct_many(cursor, history_ids)
+        
+        glossary = []
+        for term in terms:
+            if term.id in states:
+                if states[term.id] is None:
+                    continue
+                HistoryRepository._apply_fields(term, states[term.id])
+            glossary.append(term)
+        
+        glossary.sort(key=lambda term: term.name)
+        return glossary
@@ -0,0 +1,284 @@
+"""
+회사 용어 위키 - 검색 인덱스
+용어별 n-gram / 초성 / 자모 트라이그램 색인 생성 및 갱신
+"""
+
+import sqlite3
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from hangul import chosung, decompose
+
+
+# 바이그램 색인 대상: 용어명, 정의, 예시, 동의어
+# (3글자 이상 검색어는 terms_fts 트라이그램 인덱스가 처리)
+BIGRAM_SIZE = 2
+
+# 유사 검색용 자모 트라이그램 (앞뒤 경계 표시 문자 포함)
+FUZZY_GRAM_SIZE = 3
+FUZZY_PAD_START = "\x02"
+FUZZY_PAD_END = "\x03"
+
+# 색인 대상 필드: (용어명, 정의, 예시, 동의어 목록)
+TermFields = Tuple[str, str, str, Iterable[str]]
+
+
+def fold_case(text: Optional[str]) -> Optional[str]:
+    """검색용 대소문자 통일 (비ASCII 포함, 바이그램 색인과 1글자 검색이 함께 사용)
+    
+    DB 연결에 같은 이름의 SQL 함수로도 등록된다 (database.get_connection).
+    """
+    return text.lower() if text is not None else None
+
+
+def bigrams(text: str) -> Set[str]:
+    """문자열의 바이그램 집합 (대소문자 무시)"""
+    text = fold_case(text or "")
+    return {text[i:i + BIGRAM_SIZE] for i in range(len(text) - BIGRAM_SIZE + 1)}
+
+
+def term_bigrams(name: str, definition: str, example: str, synonyms: Iterable[str]) -> Set[str]:
+    """용어 하나의 바이그램 집합
+    
+    필드끼리는 이어 붙이지 않으므로 필드 경계를 걸치는 바이그램은 생기지 않는다.
+    """
+    grams = bigrams(name) | bigrams(definition) | bigrams(example)
+    for synonym in synonyms:
+        grams |= bigrams(synonym)
+    return grams
+
+
+def chosung_keys(name: str, synonyms: Iterable[str]) -> Set[str]:
+    """용어명/동의어 초성 키의 모든 접미사
+    
+    접미사를 저장해 두면 초성 부분 문자열 검색을 인덱스 접두어 검색으로 처리할 수 있다.
+    예: 'ㅁㅊㅇㄱ' -> {'ㅁㅊㅇㄱ', 'ㅊㅇㄱ', 'ㅇㄱ', 'ㄱ'}
+    """
+    keys = set()
+    for text in [name, *synonyms]:
+        key = chosung(text)
+        keys.update(key[i:] for i in range(len(key)))
+    return keys
+
+
+def chosung_range(query: str) -> tuple:
+    """초성 검색어의 접두어 범위 (key >= 시작 AND key < 끝)"""
+    prefix = chosung(query)
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def fuzzy_grams(text: str) -> Set[str]:
+    """자모 분해 문자열의 트라이그램 집합
+    
+    앞에 경계 문자 두 개, 뒤에 하나를 붙여 첫 글자와 끝 글자도 트라이그램에 포함시킨다.
+    예: '매출' -> ㅁㅐㅊㅜㄹ -> {'^^ㅁ', '^ㅁㅐ', 'ㅁㅐㅊ', 'ㅐㅊㅜ', 'ㅊㅜㄹ', 'ㅜㄹ$'}
+        (^, $는 각각 FUZZY_PAD_START, FUZZY_PAD_END)
+    """
+    jamo = decompose(text)
+    if not jamo:
+        return set()
+    padded = FUZZY_PAD_START * (FUZZY_GRAM_SIZE - 1) + jamo + FUZZY_PAD_END
+    return {padded[i:i + FUZZY_GRAM_SIZE] for i in range(len(padded) - FUZZY_GRAM_SIZE + 1)}
+
+
+def _index_fuzzy(cursor: sqlite3.Cursor, term_id: int, names: Iterable[str]):
+    """용어명/동의어별 자모 트라이그램 색인 추가"""
+    for text in names:
+        grams = fuzzy_grams(text)
+        if not grams:
+            continue
+        cursor.execute(
+            "INSERT INTO term_fuzzy_keys (term_id, gram_count) VALUES (?, ?)",
+            (term_id, len(grams))
+        )
+        key_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO term_fuzzy_grams (gram, key_id) VALUES (?, ?)",
+            [(gram, key_id) for gram in grams]
+        )
+
+
+def index_term(cursor: sqlite3.Cursor, term_id: int, name: str, definition: str,
+               example: str, synonyms: Iterable[str]):
+    """용어의 검색 색인 재작성"""
+    synonyms = list(synonyms)
+    
+    cursor.execute("DELETE FROM term_bigrams WHERE term_id = ?", (term_id,))
+    cursor.executemany(
+        "INSERT INTO term_bigrams (gram, term_id) VALUES (?, ?)",
+        [(gram, term_id) for gram in term_bigrams(name, definition, example, synonyms)]
+    )
+    
+    cursor.execute("DELETE FROM term_chosung WHERE term_id = ?", (term_id,))
+    cursor.executemany(
+        "INSERT INTO term_chosung (key, term_id) VALUES (?, ?)",
+        [(key, term_id) for key in chosung_keys(name, synonyms)]
+    )
+    
+    # term_fuzzy_grams는 ON DELETE CASCADE로 함께 삭제됨
+    cursor.execute("DELETE FROM term_fuzzy_keys WHERE term_id = ?", (term_id,))
+    _index_fuzzy(cursor, term_id, [name, *synonyms])
+
+
+def _replace_keys(cursor: sqlite3.Cursor, table: str, column: str, term_id: int,
+                  old_keys: Set[str], new_keys: Set[str]):
+    """용어의 색인 키 중 바뀐 것만 삭제/추가"""
+    removed = old_keys - new_keys
+    added = new_keys - old_keys
+    if removed:
+        cursor.executemany(
+            f"DELETE FROM {table} WHERE {column} = ? AND term_id = ?",
+            [(key, term_id) for key in removed]
+        )
+    if added:
+        cursor.executemany(
+            f"INSERT INTO {table} ({column}, term_id) VALUES (?, ?)",
+            [(key, term_id) for key in added]
+        )
+
+
+def _update_fuzzy(cursor: sqlite3.Cursor, term_id: int, old_names: List[str],
+                  new_names: List[str]):
+    """사라진 용어명/동의어의 자모 트라이그램 키만 삭제하고 새 이름만 추가
+    
+    키에는 원문이 없으므로 저장된 트라이그램 집합으로 어느 이름의 키인지 찾는다.
+    """
+    # 용어명과 같은 동의어도 키를 따로 가지므로 중복을 센다
+    removed = list((Counter(old_names) - Counter(new_names)).elements())
+    added = list((Counter(new_names) - Counter(old_names)).elements())
+    
+    if removed:
+        cursor.execute("""
+            SELECT k.id, g.gram FROM term_fuzzy_keys k
+            JOIN term_fuzzy_grams g ON g.key_id = k.id
+            WHERE k.term_id = ?
+        """, (term_id,))
+        key_grams: Dict[int, Set[str]] = {}
+        for key_id, gram in cursor.fetchall():
+            key_grams.setdefault(key_id, set()).add(gram)
+        key_ids: Dict[frozenset, List[int]] = {}
+        for key_id, grams in key_grams.items():
+            key_ids.setdefault(frozenset(grams), []).append(key_id)
+        
+        # term_fuzzy_grams는 ON DELETE CASCADE로 함께 삭제됨
+        stale = []
+        for text in removed:
+            candidates = key_ids.get(frozenset(fuzzy_grams(text)))
+            if candidates:
+                stale.append((candidates.pop(),))
+        cursor.executemany("DELETE FROM term_fuzzy_keys WHERE id = ?", stale)
+    
+    _index_fuzzy(cursor, term_id, added)
+
+
+def update_term(cursor: sqlite3.Cursor, term_id: int, old: TermFields, new: TermFields):
+    """용어 수정 시 검색 색인 증분 갱신
+    
+    old/new: (용어명, 정의, 예시, 동의어 목록)
+    바이그램/초성 색인은 달라진 키만 삭제/추가하고, 자모 트라이그램 색인은
+    용어명이나 동의어가 바뀐 경우에만 다시 만든다.
+    """
+    old_name, old_definition, old_example, old_synonyms = old
+    name, definition, example, synonyms = new
+    old_synonyms, synonyms = list(old_synonyms), list(synonyms)
+    names_changed = old_name != name or set(old_synonyms) != set(synonyms)
+    
+    if names_changed or (old_definition, old_example) != (definition, example):
+        _replace_keys(
+            cursor, "term_bigrams", "gram", term_id,
+            term_bigrams(old_name, old_definition, old_example, old_synonyms),
+            term_bigrams(name, definition, example, synonyms)
+        )
+    
+    if names_changed:
+        _replace_keys(
+            cursor, "term_chosung", "key", term_id,
+            chosung_keys(old_name, old_synonyms), chosung_keys(name, synonyms)
+        )
+        _update_fuzzy(cursor, term_id, [old_name, *old_synonyms], [name, *synonyms])
+
+
+def remove_term(cursor: sqlite3.Cursor, term_id: int):
+    """소프트 삭제한 용어를 모든 검색 색인에서 제거 (terms_fts 포함)"""
+    cursor.execute("DELETE FROM terms_fts WHERE rowid = ?", (term_id,))
+    cursor.execute("DELETE FROM term_bigrams WHERE term_id = ?", (term_id,))
+    cursor.execute("DELETE FROM term_chosung WHERE term_id = ?", (term_id,))
+    cursor.execute("DELETE FROM term_fuzzy_keys WHERE term_id = ?", (term_id,))
+
+
+def restore_term(cursor: sqlite3.Cursor, term_id: int):
+    """복원한 용어를 현재 데이터로 다시 색인 (terms_fts 포함)"""
+    cursor.execute("SELECT name, definition, example FROM terms WHERE id = ?", (term_id,))
+    name, definition, example = cursor.fetchone()
+    cursor.execute("SELECT synonym_name FROM synonyms WHERE term_id = ?", (term_id,))
+    synonyms = [row[0] for row in cursor.fetchall()]
+    
+    cursor.execute(
+        "INSERT INTO terms_fts (rowid, name, definition, example, synonyms) VALUES (?, ?, ?, ?, ?)",
+        (term_id, name, definition, example or "", "\n".join(synonyms))
+    )
+    index_term(cursor, term_id, name, definition, example or "", synonyms)
+
+
+def _range_filter(column: str, start_id: Optional[int], end_id: Optional[int]) -> Tuple[str, list]:
+    """용어 ID 범위 조건 [start_id, end_id) (None이면 전체)"""
+    if start_id is None:
+        return "", []
+    return f" WHERE {column} >= ? AND {column} < ?", [start_id, end_id]
+
+
+def _load_synonyms(cursor: sqlite3.Cursor, start_id: Optional[int] = None,
+                   end_id: Optional[int] = None) -> Dict[int, List[str]]:
+    """용어별 동의어 목록"""
+    where, params = _range_filter("term_id", start_id, end_id)
+    synonyms = {}
+    cursor.execute(f"SELECT term_id, synonym_name FROM synonyms{where} ORDER BY id", params)
+    for term_id, synonym_name in cursor.fetchall():
+        synonyms.setdefault(term_id, []).append(synonym_name)
+    return synonyms
+
+
+def rebuild_bigrams(cursor: sqlite3.Cursor, start_id: Optional[int] = None,
+                    end_id: Optional[int] = None):
+    """바이그램 색인 재구성 (용어 ID 범위 [start_id, end_id), 생략 시 전체)"""
+    where, params = _range_filter("term_id", start_id, end_id)
+    cursor.execute(f"DELETE FROM term_bigrams{where}", params)
+    synonyms = _load_synonyms(cursor, start_id, end_id)
+    
+    where, params = _range_filter("id", start_id, end_id)
+    cursor.execute(f"SELECT id, name, definition, example FROM terms{where}", params)
+    rows: List[tuple] = []
+    for term_id, name, definition, example in cursor.fetchall():
+        for gram in term_bigrams(name, definition, example, synonyms.get(term_id, [])):
+            rows.append((gram, term_id))
+    cursor.executemany("INSERT INTO term_bigrams (gram, term_id) VALUES (?, ?)", rows)
+
+
+def rebuild_chosung(cursor: sqlite3.Cursor, start_id: Optional[int] = None,
+                    end_id: Optional[int] = None):
+    """초성 색인 재구성 (용어 ID 범위 [start_id, end_id), 생략 시 전체)"""
+    where, params = _range_filter("term_id", start_id, end_id)
+    cursor.execute(f"DELETE FROM term_chosung{where}", params)
+    synonyms = _load_synonyms(cursor, start_id, end_id)
+    
+    where, params = _range_filter("id", start_id, end_id)
+    cursor.execute(f"SELECT id, name FROM terms{where}", params)
+    rows: List[tuple] = []
+    for term_id, name in cursor.fetchall():
+        for key in chosung_keys(name, synonyms.get(term_id, [])):
+            rows.append((key, term_id))
+    cursor.executemany("INSERT INTO term_chosung (key, term_id) VALUES (?, ?)", rows)
+
+
+def rebuild_fuzzy(cursor: sqlite3.Cursor, start_id: Optional[int] = None,
+                  end_id: Optional[int] = None):
+    """자모 트라이그램 색인 재구성 (용어 ID 범위 [start_id, end_id), 생략 시 전체)"""
+    # term_fuzzy_grams는 ON DELETE CASCADE로 함께 삭제됨
+    where, params = _range_filter("term_id", start_id, end_id)
+    cursor.execute(f"DELETE FROM term_fuzzy_keys{where}", params)
+    synonyms = _load_synonyms(cursor, start_id, end_id)
+    
+    where, params = _range_filter("id", start_id, end_id)
+    cursor.execute(f"SELECT id, name FROM terms{where}", params)
+    for term_id, name in cursor.fetchall():
+        _index_fuzzy(cursor, term_id, [name, *synonyms.get(term_id, [])])
@@ -0,0 +1,24 @@
+"""
+회사 용어 위키 - 테스트 공통 설정
+테스트마다 임시 DB 파일을 새로 만들어 최신 스키마로 초기화
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+from repository import UserRepository
+
+
+@pytest.fixture
+def wiki_db(tmp_path, monkeypatch):
+    """임시 DB (기본 관리자 ID 반환)"""
+    monkeypatch.setattr(database, 'get_db_path', lambda: tmp_path / "wiki.db")
+    database.close_connections()
+    database.init_database(progress=None)
+    yield UserRepository.get_or_create("admin").id
+    database.close_connections()
@@ -0,0 +1,88 @@
+"""
+회사 용어 위키 - 캐시 무효화 테스트
+"""
+
+import sqlite3
+
+import database
+import search_index
+from models import Term
+from repository import CategoryRepository, TermRepository
+
+
+def _commit_elsewhere(sql: str, params=()):
+    """같은 DB 파일을 쓰는 다른 사용자(별도 연결)의 쓰기"""
+    conn = sqlite3.connect(database.get_db_path())
+    try:
+        with conn:
+            conn.execute(sql, params)
+    finally:
+        conn.close()
+
+
+def test_category_rename_reaches_cached_term(wiki_db):
+    category = CategoryRepository.get_by_name("개발")
+    term_id = TermRepository.create(Term(name="배포", definition="릴리스"), wiki_db, [category.id])
+    assert TermRepository.get_by_id(term_id).categories[0].name == "개발"
+    
+    category.name, category.color = "엔지니어링", "#000000"
+    CategoryRepository.update(category)
+    
+    cached = TermRepository.get_by_id(term_id).categories[0]
+    assert (cached.name, cached.color) == ("엔지니어링", "#000000")
+
+
+def test_category_delete_reaches_cached_term_and_search(wiki_db):
+    category = CategoryRepository.get_by_name("개발")
+    term_id = TermRepository.create(Term(name="배포", definition="릴리스"), wiki_db, [category.id])
+    assert TermRepository.get_by_id(term_id).categories
+    assert TermRepository.search_ids("배포", category.id) == [term_id]
+    
+    CategoryRepository.delete(category.id)
+    
+    assert TermRepository.get_by_id(term_id).categories == []
+    assert TermRepository.search_ids("배포", category.id) == []
+
+
+def test_edit_by_other_process_reaches_cached_term(wiki_db):
+    term_id = TermRepository.create(Term(name="배포", definition="릴리스"), wiki_db)
+    assert TermRepository.get_by_id(term_id).definition == "릴리스"
+    
+    _commit_elsewhere("UPDATE terms SET definition = ? WHERE id = ?", ("배포 절차", term_id))
+    
+    assert TermRepository.get_cached(term_id) is None
+    assert TermRepository.get_by_id(term_id).definition == "배포 절차"
+
+
+def test_category_added_by_other_process_is_listed(wiki_db):
+    names = [c.name for c in CategoryRepository.get_all()]
+    
+    _commit_elsewhere("INSERT INTO categories (name, description, color) VALUES (?, '', '#123456')",
+                      ("품질 관리",))
+    _commit_elsewhere("UPDATE categories SET name = ? WHERE name = ?", ("엔지니어링", "개발"))
+    
+    assert sorted(c.name for c in CategoryRepository.get_all()) == sorted(
+        [name for name in names if name != "개발"] + ["품질 관리", "엔지니어링"]
+    )
+    assert CategoryRepository.get_by_name("개발") is None
+
+
+def test_term_added_by_other_process_reaches_cached_search(wiki_db):
+    term_id = TermRepository.create(Term(name="배포", definition="릴리스"), wiki_db)
+    assert TermRepository.search_ids("배포") == [term_id]
+    
+    conn = sqlite3.connect(database.get_db_path())
+    try:
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO terms (name, definition, example, created_by) VALUES (?, ?, '', ?)",
+                ("배포 절차", "단계", wiki_db)
+            )
+            other_id = cursor.lastrowid
+            search_index.index_term(conn.cursor(), other_id, "배포 절차", "단계", "", [])
+    finally:
+        conn.close()
+    
+    # 이전 결과를 좁히는 경로, 같은 검색어의 캐시 항목 모두 새 용어를 포함
+    assert TermRepository.search_ids("배포 절") == [other_id]
+    assert TermRepository.search_ids("배포") == [term_id, other_id]
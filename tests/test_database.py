@@ -0,0 +1,72 @@
+"""
+회사 용어 위키 - DB 초기화 테스트
+"""
+
+import sqlite3
+
+import pytest
+
+import database
+from database import connection, init_database
+from migrations import MigrationContext
+
+
+def _set_journal_mode(mode: str):
+    with connection() as conn:
+        conn.execute(f"PRAGMA journal_mode = {mode}")
+
+
+def test_up_to_date_start_reports_profile(wiki_db, capsys):
+    capsys.readouterr()
+    
+    assert init_database(progress=None) is False
+    assert "DB 설정: profile=default, journal_mode=wal" in capsys.readouterr().out
+
+
+def test_recorded_journal_fallback_is_not_retried(wiki_db):
+    _set_journal_mode('delete')
+    with connection() as conn:
+        conn.execute("INSERT INTO db_settings (key, value) VALUES ('journal_mode_fallback', 'wal:delete')")
+        conn.commit()
+    
+    assert init_database(progress=None) is False
+
+
+def test_journal_mode_is_reapplied_without_fallback_record(wiki_db):
+    _set_journal_mode('delete')
+    
+    assert init_database(progress=None) is True
+    with connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+
+def test_refused_journal_mode_is_recorded(wiki_db, monkeypatch):
+    _set_journal_mode('delete')
+    active = {'profile': 'default', 'journal_mode': 'delete'}
+    monkeypatch.setattr(database, 'apply_profile', lambda: active)
+    
+    assert init_database(progress=None) is True
+    assert init_database(progress=None) is False
+
+
+def test_old_sqlite_is_rejected_with_clear_error(wiki_db, monkeypatch):
+    monkeypatch.setattr(database.sqlite3, 'sqlite_version_info', (3, 31, 1))
+    monkeypatch.setattr(database.sqlite3, 'sqlite_version', "3.31.1")
+    
+    with pytest.raises(RuntimeError, match="3.34.0"):
+        init_database(progress=None)
+
+
+@pytest.mark.parametrize("deleted_ids", [(3,), (1, 2, 3)])
+def test_rebuild_table_keeps_autoincrement_sequence(deleted_ids):
+    create_sql = "CREATE TABLE {table} (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT)"
+    conn = sqlite3.connect(":memory:")
+    conn.execute(create_sql.format(table="items"))
+    conn.executemany("INSERT INTO items (name) VALUES (?)", [("a",), ("b",), ("c",)])
+    conn.executemany("DELETE FROM items WHERE id = ?", [(i,) for i in deleted_ids])
+    
+    MigrationContext(conn, 1).rebuild_table("items", create_sql, ["id", "name"])
+    
+    # 영구 삭제된 마지막 ID를 다시 쓰지 않음
+    assert conn.execute("INSERT INTO items (name) VALUES ('d')").lastrowid == 4
+    conn.close()
@@ -0,0 +1,44 @@
+"""
+회사 용어 위키 - 변경 이력 조회 테스트
+"""
+
+import history_store
+from models import HistoryFilter, Term
+from repository import HistoryRepository, TermRepository, UserRepository
+
+
+def test_term_history_orders_same_second_edits_newest_first(wiki_db):
+    term_id = TermRepository.create(Term(name="매출", definition="v0"), wiki_db)
+    for i in range(1, 6):
+        term = TermRepository.get_by_id(term_id)
+        term.definition = f"v{i}"
+        TermRepository.update(term, wiki_db)
+    
+    history = HistoryRepository.get_by_term(term_id)
+    
+    assert [h.id for h in history] == sorted((h.id for h in history), reverse=True)
+    assert [h.new_value for h in history[:2]] == ["v5", "v4"]
+
+
+def test_synonym_containing_separator_survives_reconstruction_and_revert(wiki_db):
+    bob = UserRepository.get_or_create("bob").id
+    term_id = TermRepository.create(
+        Term(name="손익", definition="정의", synonyms=["수익, 비용", "P&L"]), wiki_db
+    )
+    term = TermRepository.get_by_id(term_id)
+    term.synonyms = ["P&L"]
+    TermRepository.update(term, bob)
+    
+    created = HistoryRepository.get_by_term(term_id)[-1]
+    assert sorted(HistoryRepository.get_term_as_of(term_id, history_id=created.id).synonyms) == [
+        "P&L", "수익, 비용"
+    ]
+    
+    TermRepository.revert_changes(wiki_db, HistoryFilter(changed_by=bob))
+    assert sorted(TermRepository.get_by_id(term_id).synonyms) == ["P&L", "수익, 비용"]
+
+
+def test_legacy_comma_joined_synonyms_are_still_read():
+    assert history_store.split_synonyms("DB, 데이터베이스") == ["DB", "데이터베이스"]
+    assert history_store.split_synonyms("[베타], 알파") == ["[베타]", "알파"]
+    assert history_store.split_synonyms(history_store.join_synonyms(["a, b", "c"])) == ["a, b", "c"]
@@ -0,0 +1,249 @@
+"""
+회사 용어 위키 - 변경 이력 저장 테스트
+델타 인코딩/복원과 원문(스냅샷) 주기, 체크포인트 기준 과거 시점 재구성
+"""
+
+import pytest
+
+import history_store
+from database import connection, transaction
+from models import Term
+from repository import HistoryRepository, TermRepository
+
+
+# 델타가 원문보다 작아지도록 충분히 긴 정의
+LONG_DEFINITION = "매출은 기업이 주된 영업활동으로 벌어들인 금액이다. " * 20
+
+
+def _edit(term_id: int, user_id: int, **fields):
+    """용어 필드 수정"""
+    term = TermRepository.get_by_id(term_id)
+    for name, value in fields.items():
+        setattr(term, name, value)
+    TermRepository.update(term, user_id)
+
+
+def _stored_rows(term_id: int, field_name: str):
+    """(용어, 필드) 수정 이력 행의 저장 형태 [(id, old_value, new_value, value_delta), ...] (오래된 순)"""
+    with connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT id, old_value, new_value, value_delta FROM term_history
+               WHERE term_id = ? AND field_name = ? AND action_type = 'update'
+               ORDER BY id""",
+            (term_id, field_name)
+        )
+        return [tuple(row) for row in cursor.fetchall()]
+
+
+@pytest.mark.parametrize("old, new", [
+    ("", ""),
+    ("", "새 정의"),
+    ("기존 정의", ""),
+    ("abcdef", "abcdef"),
+    ("매출 총이익", "매출 순이익"),
+    ("앞부분 가운데 뒷부분", "앞부분 뒷부분"),
+    ("aaaa", "aaaaaa"),
+    ("완전히 다른 문장", "xyz"),
+    (LONG_DEFINITION, LONG_DEFINITION.replace("금액", "수익", 3) + "끝"),
+])
+def test_apply_delta_round_trips(old, new):
+    assert history_store.apply_delta(old, history_store.make_delta(old, new)) == new
+
+
+def test_encode_stores_delta_only_inside_chain():
+    old = LONG_DEFINITION
+    new = LONG_DEFINITION + "추가"
+    
+    stored = history_store.encode(old, 1, old, new)
+    assert stored[:2] == (None, None)
+    assert history_store.apply_delta(old, stored[2]) == new
+    
+    # 연쇄의 첫 행, 주기에 도달한 행, 직전 새 값과 이어지지 않는 행, NULL 값은 원문
+    assert history_store.encode(None, 0, old, new) == (old, new, None)
+    assert history_store.encode(old, history_store.SNAPSHOT_INTERVAL, old, new) == (old, new, None)
+    assert history_store.encode("다른 값", 1, old, new) == (old, new, None)
+    assert history_store.encode(old, 1, old, None) == (old, None, None)
+    # 델타가 원문보다 크면 원문
+    assert history_store.encode("a", 1, "a", "b") == ("a", "b", None)
+
+
+def test_update_chain_takes_snapshot_every_interval(wiki_db):
+    interval = history_store.SNAPSHOT_INTERVAL
+    term_id = TermRepository.create(Term(name="매출", definition=LONG_DEFINITION), wiki_db)
+    values = [LONG_DEFINITION]
+    for i in range(2 * interval + 3):
+        values.append(f"{LONG_DEFINITION}수정 {i}")
+        _edit(term_id, wiki_db, definition=values[-1])
+    
+    rows = _stored_rows(term_id, 'definition')
+    
+    snapshots = [i for i, row in enumerate(rows) if row[3] is None]
+    assert snapshots == [0, interval, 2 * interval]
+    for i, (_, old_value, new_value, delta) in enumerate(rows):
+        if delta is None:
+            assert (old_value, new_value) == (values[i], values[i + 1])
+        else:
+            assert (old_value, new_value) == (None, None)
+
+
+def test_delta_rows_resolve_to_original_values(wiki_db):
+    interval = history_store.SNAPSHOT_INTERVAL
+    term_id = TermRepository.create(Term(name="매출", definition=LONG_DEFINITION), wiki_db)
+    values = [LONG_DEFINITION]
+    for i in range(interval + 3):
+        values.append(f"{LONG_DEFINITION}수정 {i}")
+        _edit(term_id, wiki_db, definition=values[-1])
+    expected = list(zip(values, values[1:]))
+    
+    history = [h for h in reversed(HistoryRepository.get_by_term(term_id))
+               if h.action_type == 'update']
+    assert [(h.old_value, h.new_value) for h in history] == expected
+    
+    # 연쇄 가운데 행 하나만 조회해도 (주기 경계 직전/직후 포함) 같은 값으로 복원
+    rows = _stored_rows(term_id, 'definition')
+    with connection() as conn:
+        cursor = conn.cursor()
+        for i in (1, interval - 1, interval, interval + 2):
+            resolved = history_store.resolve_values(cursor, [(rows[i][0], term_id, 'definition')])
+            assert resolved[rows[i][0]] == expected[i]
+
+
+def test_chain_restarts_after_value_set_outside_chain(wiki_db):
+    term_id = TermRepository.create(Term(name="매출", definition=LONG_DEFINITION), wiki_db)
+    _edit(term_id, wiki_db, definition=LONG_DEFINITION + "1")
+    _edit(term_id, wiki_db, definition=LONG_DEFINITION + "2")
+    with transaction() as conn:
+        history_store.insert_updates(
+            conn.cursor(), term_id, [('definition', "외부 값", LONG_DEFINITION + "3")], wiki_db
+        )
+    
+    rows = _stored_rows(term_id, 'definition')
+    
+    assert [row[3] is None for row in rows] == [True, False, True]
+    assert rows[2][1:3] == ("외부 값", LONG_DEFINITION + "3")
+
+
+def _latest_history_id(term_id: int) -> int:
+    """용어의 마지막 이력 행 ID"""
+    with connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT MAX(id) FROM term_history WHERE term_id = ?", (term_id,))
+        return cursor.fetchone()[0]
+
+
+def _checkpoint_ids(term_id: int):
+    """용어 체크포인트의 기준 이력 행 ID (오래된 순)"""
+    with connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT history_id FROM term_checkpoints WHERE term_id = ? ORDER BY history_id",
+            (term_id,)
+        )
+        return [history_id for history_id, in cursor.fetchall()]
+
+
+def _fields(name: str, definition: str, example: str = "", synonyms=()):
+    """재구성 결과와 비교할 필드"""
+    return {'name': name, 'definition': definition, 'example': example,
+            'synonyms': history_store.join_synonyms(synonyms)}
+
+
+def _reconstruct(term_id: int, history_id: int):
+    with connection() as conn:
+        return history_store.reconstruct(conn.cursor(), term_id, history_id)
+
+
+def _edit_and_record(term_id: int, user_id: int, states: dict, **fields):
+    """용어를 수정하고 {마지막 이력 ID: 기대 필드}에 수정 후 상태 기록"""
+    _edit(term_id, user_id, **fields)
+    term = TermRepository.get_by_id(term_id)
+    states[_latest_history_id(term_id)] = _fields(
+        term.name, term.definition, term.example, term.synonyms
+    )
+
+
+def test_reconstruct_replays_forward_from_checkpoint(wiki_db):
+    term_id = TermRepository.create(Term(name="매출", definition="v0"), wiki_db)
+    states = {_latest_history_id(term_id): _fields("매출", "v0")}
+    for i in range(1, history_store.CHECKPOINT_INTERVAL + 6):
+        if i % 7 == 0:
+            _edit_and_record(term_id, wiki_db, states, definition=f"v{i}",
+                             example=f"예시 {i}", synonyms=[f"동의어 {i}"])
+        else:
+            _edit_and_record(term_id, wiki_db, states, definition=f"v{i}")
+    
+    checkpoints = _checkpoint_ids(term_id)
+    
+    # 생성 시점과 CHECKPOINT_INTERVAL개 이력 뒤에 하나씩
+    assert len(checkpoints) == 2
+    assert checkpoints[1] in states
+    for history_id, expected in states.items():
+        assert _reconstruct(term_id, history_id) == expected
+
+
+def test_reconstruct_replays_backward_before_first_checkpoint(wiki_db):
+    term_id = TermRepository.create(Term(name="매출", definition="v0"), wiki_db)
+    states = {_latest_history_id(term_id): _fields("매출", "v0")}
+    for i in range(1, 6):
+        _edit_and_record(term_id, wiki_db, states, definition=f"v{i}", example=f"예시 {i}")
+    
+    # 체크포인트 도입 전 이력: 마이그레이션처럼 현재 상태로만 체크포인트를 만든다
+    with transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM term_checkpoints WHERE term_id = ?", (term_id,))
+        history_store.seed_checkpoints(cursor, term_id, term_id + 1)
+    assert _checkpoint_ids(term_id) == [max(states)]
+    
+    # 체크포인트 뒤 수정은 앞으로 재생
+    for i in range(6, 9):
+        _edit_and_record(term_id, wiki_db, states, name=f"매출 {i}", definition=f"v{i}")
+    
+    for history_id, expected in states.items():
+        assert _reconstruct(term_id, history_id) == expected
+    assert _reconstruct(term_id, 0) is None
+
+
+def test_reconstruct_tracks_delete_and_restore(wiki_db):
+    term_id = TermRepository.create(Term(name="매출", definition="v0"), wiki_db)
+    _edit(term_id, wiki_db, definition="v1")
+    edited = _latest_history_id(term_id)
+    TermRepository.delete(term_id, wiki_db)
+    deleted = _latest_history_id(term_id)
+    TermRepository.restore(term_id, wiki_db)
+    restored = _latest_history_id(term_id)
+    _edit(term_id, wiki_db, definition="v2")
+    
+    assert _reconstruct(term_id, edited) == _fields("매출", "v1")
+    assert _reconstruct(term_id, deleted) is None
+    assert _reconstruct(term_id, restored) == _fields("매출", "v1")
+    assert _reconstruct(term_id, _latest_history_id(term_id)) == _fields("매출", "v2")
+
+
+def test_reconstruct_many_matches_reconstruct(wiki_db, monkeypatch):
+    # 여러 묶음으로 나눠 조회하는 경로도 거치도록 묶음 크기를 줄인다
+    monkeypatch.setattr(history_store, '_CHUNK_SIZE', 2)
+    term_ids = [TermRepository.create(Term(name=f"용어 {i}", definition="v0"), wiki_db)
+                for i in range(4)]
+    for i, term_id in enumerate(term_ids):
+        for j in range(1, i + 3):
+            _edit(term_id, wiki_db, definition=f"v{j}")
+    with transaction() as conn:
+        # 두 번째 용어는 체크포인트 도입 전 이력만 있는 것처럼 만든다
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM term_checkpoints WHERE term_id = ?", (term_ids[1],))
+        history_store.seed_checkpoints(cursor, term_ids[1], term_ids[1] + 1)
+    missing = max(term_ids) + 100
+    
+    with connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT MAX(id) FROM term_history")
+        last = cursor.fetchone()[0]
+        for offset in range(0, last + 1):
+            # 용어마다 다른 시점
+            targets = {term_id: (offset + 3 * i) % (last + 1)
+                       for i, term_id in enumerate(term_ids + [missing])}
+            expected = {term_id: history_store.reconstruct(cursor, term_id, history_id)
+                        for term_id, history_id in targets.items()}
+            assert history_store.reconstruct_many(cursor, targets) == expected
+            assert expected[missing] is None
@@ -0,0 +1,40 @@
+"""
+회사 용어 위키 - 삭제된 용어 영구 삭제 테스트
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import purge
+from database import connection
+from models import Term
+from repository import HistoryRepository, TermRepository
+
+
+def test_purge_rejects_non_positive_or_non_numeric_days(capsys):
+    for argv in (["--days", "abc"], ["--days", "0"], ["--days", "-3"], ["abc"]):
+        with pytest.raises(SystemExit):
+            purge.parse_args(argv)
+        assert "usage:" in capsys.readouterr().err
+    
+    assert purge.parse_args([]).days == purge.DEFAULT_RETENTION_DAYS
+    assert purge.parse_args(["--all"]).all
+
+
+def test_purge_keeps_recent_tombstones_and_history(wiki_db):
+    old_id = TermRepository.create(Term(name="오래된 용어", definition="정의"), wiki_db)
+    recent_id = TermRepository.create(Term(name="최근 용어", definition="정의"), wiki_db)
+    TermRepository.delete(old_id, wiki_db)
+    TermRepository.delete(recent_id, wiki_db)
+    with connection() as conn:
+        conn.execute("UPDATE terms SET deleted_at = datetime('now', '-40 days') WHERE id = ?", (old_id,))
+        conn.commit()
+    
+    cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+    assert TermRepository.purge_deleted(cutoff, batch_size=1) == 1
+    
+    assert not TermRepository.restore(old_id, wiki_db)
+    assert [h.action_type for h in HistoryRepository.get_by_term(old_id)] == ['delete', 'create']
+    assert TermRepository.restore(recent_id, wiki_db)
+    assert TermRepository.search_ids("최근 용어") == [recent_id]
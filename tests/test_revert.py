@@ -0,0 +1,130 @@
+"""
+회사 용어 위키 - 수정 이력 되돌리기 테스트
+"""
+
+import history_store
+from database import connection
+from models import HistoryFilter, Term
+from repository import HistoryRepository, TermRepository, UserRepository
+
+
+# 델타가 원문보다 작아지도록 충분히 긴 정의
+LONG_DEFINITION = "매출은 기업이 주된 영업활동으로 벌어들인 금액이다. " * 20
+
+
+def _edit(term_id: int, user_id: int, **fields):
+    """용어 필드 수정"""
+    term = TermRepository.get_by_id(term_id)
+    for name, value in fields.items():
+        setattr(term, name, value)
+    TermRepository.update(term, user_id)
+
+
+def test_revert_restores_value_before_first_selected_edit(wiki_db):
+    bob = UserRepository.get_or_create("bob").id
+    term_id = TermRepository.create(Term(name="매출", definition="v0"), wiki_db)
+    _edit(term_id, bob, definition="bob1")
+    _edit(term_id, bob, definition="bob2", example="예시")
+    
+    result = TermRepository.revert_changes(wiki_db, HistoryFilter(changed_by=bob))
+    
+    term = TermRepository.get_by_id(term_id)
+    assert (term.definition, term.example) == ("v0", "")
+    assert (result.term_count, result.field_count, result.conflicts) == (1, 2, [])
+
+
+def test_revert_reports_later_edit_by_other_user_as_conflict(wiki_db):
+    bob = UserRepository.get_or_create("bob").id
+    carol = UserRepository.get_or_create("carol").id
+    term_id = TermRepository.create(Term(name="매출", definition="v0"), wiki_db)
+    _edit(term_id, bob, definition="bob1")
+    _edit(term_id, carol, definition="carol")
+    
+    result = TermRepository.revert_changes(wiki_db, HistoryFilter(changed_by=bob))
+    
+    assert result.conflicts == [(term_id, 'definition')]
+    assert TermRepository.get_by_id(term_id).definition == "carol"
+
+
+def test_revert_reports_interleaved_edit_as_conflict(wiki_db):
+    bob = UserRepository.get_or_create("bob").id
+    carol = UserRepository.get_or_create("carol").id
+    term_id = TermRepository.create(Term(name="매출", definition="v0"), wiki_db)
+    _edit(term_id, bob, definition="bob1")
+    _edit(term_id, carol, definition="carol")
+    _edit(term_id, bob, definition="bob2")
+    
+    result = TermRepository.revert_changes(wiki_db, HistoryFilter(changed_by=bob))
+    
+    assert result.conflicts == [(term_id, 'definition')]
+    assert result.field_count == 0
+    assert TermRepository.get_by_id(term_id).definition == "bob2"
+
+
+def test_dry_run_writes_nothing_and_second_run_is_noop(wiki_db):
+    bob = UserRepository.get_or_create("bob").id
+    term_id = TermRepository.create(Term(name="매출", definition="v0", synonyms=["a"]), wiki_db)
+    _edit(term_id, bob, synonyms=["a", "b"])
+    
+    preview = TermRepository.revert_changes(wiki_db, HistoryFilter(changed_by=bob), dry_run=True)
+    assert TermRepository.get_by_id(term_id).synonyms == ["a", "b"]
+    
+    result = TermRepository.revert_changes(wiki_db, HistoryFilter(changed_by=bob))
+    assert (preview.field_count, result.field_count) == (1, 1)
+    assert TermRepository.get_by_id(term_id).synonyms == ["a"]
+    
+    again = TermRepository.revert_changes(wiki_db, HistoryFilter(changed_by=bob))
+    assert (again.field_count, again.conflicts) == (0, [])
+
+
+def test_batched_revert_continues_each_delta_chain(wiki_db):
+    interval = history_store.SNAPSHOT_INTERVAL
+    bob = UserRepository.get_or_create("bob").id
+    # 되돌리기 행이 연쇄의 1번째(델타), interval - 1번째(델타), interval번째(원문)에 오도록
+    prior_edits = [0, interval - 2, interval - 1]
+    term_ids, before_bob = [], []
+    for i, count in enumerate(prior_edits):
+        term_id = TermRepository.create(Term(name=f"용어{i}", definition=LONG_DEFINITION), wiki_db)
+        for j in range(count):
+            _edit(term_id, wiki_db, definition=f"{LONG_DEFINITION}수정 {j}")
+        before_bob.append(TermRepository.get_by_id(term_id).definition)
+        _edit(term_id, bob, definition=f"{LONG_DEFINITION}bob")
+        term_ids.append(term_id)
+    
+    TermRepository.revert_changes(wiki_db, HistoryFilter(changed_by=bob))
+    
+    with connection() as conn:
+        cursor = conn.cursor()
+        for term_id, count, value in zip(term_ids, prior_edits, before_bob):
+            cursor.execute(
+                """SELECT value_delta IS NULL FROM term_history
+                   WHERE term_id = ? AND field_name = 'definition' ORDER BY id DESC LIMIT 1""",
+                (term_id,)
+            )
+            assert cursor.fetchone()[0] == (count + 1 == interval)
+            
+            latest = HistoryRepository.get_by_term(term_id)[0]
+            assert (latest.old_value, latest.new_value) == (f"{LONG_DEFINITION}bob", value)
+            assert TermRepository.get_by_id(term_id).definition == value
+
+
+def _history_queries_during_revert(user_id: int, term_count: int) -> int:
+    """term_count개 용어의 수정을 되돌리는 동안 실행된 이력/체크포인트 조회 수"""
+    bob = UserRepository.get_or_create(f"bob{term_count}").id
+    for i in range(term_count):
+        term_id = TermRepository.create(Term(name=f"용어{term_count}-{i}", definition="v0"), user_id)
+        _edit(term_id, bob, definition="bob", example="예시")
+    
+    statements = []
+    with connection() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            TermRepository.revert_changes(user_id, HistoryFilter(changed_by=bob))
+        finally:
+            conn.set_trace_callback(None)
+    return sum(1 for sql in statements if sql.lstrip().upper().startswith(("SELECT", "WITH"))
+               and ("term_history" in sql or "term_checkpoints" in sql))
+
+
+def test_revert_reads_history_in_batches(wiki_db):
+    assert _history_queries_during_revert(wiki_db, 3) == _history_queries_during_revert(wiki_db, 40)
@@ -0,0 +1,64 @@
+"""
+회사 용어 위키 - 가상화 목록 데이터 소스 테스트
+"""
+
+import pytest
+
+from models import Term
+from repository import CategoryRepository, TermRepository
+from ui.history_view import HistoryRowSource
+from ui.term_list_view import TermRowSource
+from ui.virtual_tree import RowSource
+
+
+def test_row_source_requires_len_and_load():
+    class Incomplete(RowSource):
+        def __len__(self) -> int:
+            return 0
+    
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_term_page_keeps_positions_when_term_deleted_after_search(wiki_db):
+    term_ids = [TermRepository.create(Term(name=f"용어{i}", definition="정의"), wiki_db)
+                for i in range(3)]
+    source = TermRowSource(term_ids)
+    TermRepository.delete(term_ids[1], wiki_db)
+    
+    rows = source.load(0, 3)
+    
+    assert [iid for iid, _, _ in rows] == [str(term_id) for term_id in term_ids]
+    assert rows[1][1][0] == TermRowSource.DELETED_LABEL and rows[1][2] is None
+    assert rows[2][1][0] == "용어2"
+
+
+def test_search_resolves_category_name_in_worker(wiki_db):
+    development = CategoryRepository.get_by_name("개발").id
+    inside = TermRepository.create(Term(name="배포", definition="정의"), wiki_db, [development])
+    TermRepository.create(Term(name="배포 일정", definition="정의"), wiki_db)
+    
+    source, pages = TermRowSource.search("배포", "개발", "text")
+    assert source.term_ids == [inside]
+    
+    source, pages = TermRowSource.search("배포", None, "text")
+    assert len(source) == 2 and len(pages[0]) == 2
+
+
+def test_history_source_changes_length_only_when_page_is_applied(wiki_db):
+    for i in range(4):
+        TermRepository.create(Term(name=f"용어{i}", definition="정의"), wiki_db)
+    source = HistoryRowSource(lambda h: (h.id,), page_size=3)
+    
+    first = source.load(0, 3)
+    assert len(source) == 3  # 작업 스레드의 load()는 상태를 바꾸지 않음
+    source.page_loaded(0, 3, first)
+    assert len(source) == 6
+    
+    second = source.load(3, 6)
+    source.page_loaded(3, 6, second)
+    
+    assert len(source) == 4
+    assert [iid for iid, _, _ in first + second] == sorted(
+        (iid for iid, _, _ in first + second), key=int, reverse=True
+    )
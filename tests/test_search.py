@@ -0,0 +1,94 @@
+"""
+회사 용어 위키 - 검색 테스트
+"""
+
+import pytest
+
+import search_index
+from database import transaction
+from models import HistoryFilter, Term
+from repository import CategoryRepository, TermRepository, UserRepository
+
+
+def _set_synonyms(term_id: int, user_id: int, synonyms):
+    """용어의 동의어 목록 수정"""
+    term = TermRepository.get_by_id(term_id)
+    term.synonyms = synonyms
+    TermRepository.update(term, user_id)
+
+
+def test_fuzzy_search_applies_category_before_candidate_limit(wiki_db, monkeypatch):
+    monkeypatch.setattr(TermRepository, 'FUZZY_LIMIT', 5)
+    development = CategoryRepository.get_by_name("개발").id
+    finance = CategoryRepository.get_by_name("재무").id
+    for i in range(10):
+        TermRepository.create(Term(name="데이터베이스", definition=f"정의 {i}"), wiki_db, [finance])
+    target = TermRepository.create(Term(name="데이터베이스 서버", definition="정의"), wiki_db, [development])
+    
+    assert TermRepository.search_ids("데이터베이스", development, mode="fuzzy") == [target]
+
+
+def test_duplicate_synonyms_are_stored_once(wiki_db):
+    term_id = TermRepository.create(
+        Term(name="매출", definition="정의", synonyms=["세일즈", " 세일즈 "]), wiki_db
+    )
+    assert TermRepository.get_by_id(term_id).synonyms == ["세일즈"]
+    assert TermRepository.search_ids("세일즈", mode="fuzzy") == [term_id]
+    
+    _set_synonyms(term_id, wiki_db, [])
+    
+    assert TermRepository.search_ids("세일즈", mode="fuzzy") == []
+    assert TermRepository.search_ids("세일즈") == []
+
+
+def _duplicate_synonym_row(term_id: int, synonym: str):
+    """이전 버전의 create()처럼 같은 동의어를 한 행 더 넣고 자모 트라이그램 키도 행마다 만듦"""
+    with transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO synonyms (term_id, synonym_name) VALUES (?, ?)", (term_id, synonym))
+        cursor.execute("SELECT name, definition, example FROM terms WHERE id = ?", (term_id,))
+        name, definition, example = cursor.fetchone()
+        cursor.execute("SELECT synonym_name FROM synonyms WHERE term_id = ?", (term_id,))
+        synonyms = [row[0] for row in cursor.fetchall()]
+        search_index.index_term(cursor, term_id, name, definition, example or "", synonyms)
+
+
+def test_removing_legacy_duplicate_synonym_rows_clears_fuzzy_keys(wiki_db):
+    term_id = TermRepository.create(Term(name="매출", definition="정의", synonyms=["세일즈"]), wiki_db)
+    _duplicate_synonym_row(term_id, "세일즈")
+    
+    _set_synonyms(term_id, wiki_db, ["세일즈", "영업"])
+    assert TermRepository.search_ids("세일즈", mode="fuzzy") == [term_id]
+    
+    _set_synonyms(term_id, wiki_db, [])
+    
+    assert TermRepository.search_ids("세일즈", mode="fuzzy") == []
+
+
+def test_revert_removing_legacy_duplicate_synonym_rows_clears_fuzzy_keys(wiki_db):
+    bob = UserRepository.get_or_create("bob").id
+    term_id = TermRepository.create(Term(name="매출", definition="정의"), wiki_db)
+    _set_synonyms(term_id, bob, ["세일즈"])
+    _duplicate_synonym_row(term_id, "세일즈")
+    
+    TermRepository.revert_changes(wiki_db, HistoryFilter(changed_by=bob))
+    
+    assert TermRepository.get_by_id(term_id).synonyms == []
+    assert TermRepository.search_ids("세일즈", mode="fuzzy") == []
+
+
+@pytest.mark.parametrize("query", ["É", "ÉC", "ÉCO", "é", "éc", "éco", "Δ", "δ"])
+def test_search_ignores_non_ascii_case_for_every_query_length(wiki_db, query):
+    term_id = TermRepository.create(
+        Term(name="écoute", definition="청취", synonyms=["Δέλτα"]), wiki_db
+    )
+    
+    assert TermRepository.search_ids(query) == [term_id]
+
+
+def test_one_letter_non_ascii_result_is_narrowed_in_memory(wiki_db):
+    term_id = TermRepository.create(Term(name="Écoute", definition="청취"), wiki_db)
+    assert TermRepository.search_ids("é") == [term_id]
+    
+    assert TermRepository.search_ids("ÉC") == [term_id]
+    assert TermRepository.search_ids("éx") == []
@@ -0,0 +1,169 @@
+"""
+회사 용어 위키 - Treeview 증분 갱신 테스트
+화면 없이 돌도록 sync_tree가 쓰는 Treeview 메서드만 흉내 낸 목록으로 검사
+"""
+
+import random
+
+import pytest
+
+from ui.tree_sync import _stable_positions, sync_tree
+
+
+class FakeTree:
+    """최상위 항목만 있는 Treeview 대역 (호출한 변경 작업을 ops에 기록)"""
+    
+    def __init__(self, rows=()):
+        self.children = [str(iid) for iid, _ in rows]
+        self.values = {str(iid): tuple(values) for iid, values in rows}
+        self.ops = []
+    
+    def get_children(self, item=''):
+        return tuple(self.children)
+    
+    def item(self, iid, option=None, **kw):
+        if 'values' in kw:
+            self.ops.append(('item', iid))
+            self.values[iid] = tuple(kw['values'])
+            return None
+        return self.values[iid]
+    
+    def index(self, iid):
+        return self.children.index(iid)
+    
+    def insert(self, parent, index, iid=None, values=()):
+        self.ops.append(('insert', iid))
+        self.children.insert(index, iid)
+        self.values[iid] = tuple(values)
+        return iid
+    
+    def delete(self, *iids):
+        self.ops.append(('delete',) + iids)
+        for iid in iids:
+            self.children.remove(iid)
+            del self.values[iid]
+    
+    def detach(self, *iids):
+        for iid in iids:
+            self.children.remove(iid)
+    
+    def move(self, iid, parent, index):
+        self.ops.append(('move', iid))
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+    
+    def rows(self):
+        return [(iid, self.values[iid]) for iid in self.children]
+    
+    def moves(self):
+        return [op[1] for op in self.ops if op[0] == 'move']
+
+
+def _rows(*iids):
+    return [(iid, (iid,)) for iid in iids]
+
+
+def _lis_length(sequence):
+    """최장 증가 부분 수열 길이 (O(n^2) 기준 구현)"""
+    lengths = []
+    for i, value in enumerate(sequence):
+        lengths.append(1 + max((lengths[j] for j in range(i) if sequence[j] < value), default=0))
+    return max(lengths, default=0)
+
+
+@pytest.mark.parametrize("positions, stable", [
+    ([], set()),
+    ([-1, -1], set()),
+    ([0, 1, 2], {0, 1, 2}),
+    ([2, 1, 0], {2}),
+    ([1, 2, 0], {0, 1}),
+    ([0, -1, 1, -1, 2], {0, 2, 4}),
+    ([3, 0, 1, 2], {1, 2, 3}),
+])
+def test_stable_positions_is_longest_increasing_subsequence(positions, stable):
+    assert _stable_positions(positions) == stable
+
+
+def test_sync_inserts_into_empty_tree():
+    tree = FakeTree()
+    rows = _rows("a", "b", "c")
+    
+    sync_tree(tree, rows)
+    
+    assert tree.rows() == rows
+    assert tree.moves() == []
+
+
+def test_sync_applies_delete_insert_update_and_reorder():
+    tree = FakeTree(_rows("a", "b", "c", "d", "e"))
+    rows = [("e", ("e",)), ("a", ("a",)), ("x", ("x",)), ("c", ("c 수정",)), ("d", ("d",))]
+    
+    sync_tree(tree, rows)
+    
+    assert tree.rows() == rows
+    assert ('delete', 'b') in tree.ops
+    # a, c, d는 순서가 유지되므로 e 하나만 옮기고, 값은 c만 고친다
+    assert tree.moves() == ["e"]
+    assert [op for op in tree.ops if op[0] == 'item'] == [('item', 'c')]
+
+
+def test_sync_moves_only_items_outside_longest_kept_order():
+    tree = FakeTree(_rows("a", "b", "c", "d", "e"))
+    
+    sync_tree(tree, _rows("b", "c", "d", "e", "a"))
+    assert tree.moves() == ["a"]
+    
+    tree.ops.clear()
+    sync_tree(tree, _rows("a", "e", "d", "c", "b"))
+    assert tree.rows() == _rows("a", "e", "d", "c", "b")
+    assert len(tree.moves()) == 4
+
+
+def test_sync_with_same_rows_does_nothing():
+    rows = _rows("a", "b", "c")
+    tree = FakeTree(rows)
+    sync_tree(tree, rows)
+    tree.ops.clear()
+    
+    sync_tree(tree, rows)
+    
+    assert tree.ops == []
+
+
+def test_sync_accepts_integer_iids():
+    tree = FakeTree(_rows("1", "2"))
+    
+    sync_tree(tree, [(2, ("2",)), (3, ("3",)), (1, ("1",))])
+    
+    assert tree.rows() == [("2", ("2",)), ("3", ("3",)), ("1", ("1",))]
+
+
+def test_sync_rereads_values_when_tree_changed_outside_sync():
+    tree = FakeTree(_rows("a", "b"))
+    sync_tree(tree, _rows("a", "b"))
+    # sync_tree를 거치지 않고 항목 추가 (보관한 값과 항목 수가 달라짐)
+    tree.insert('', 2, iid="c", values=("c",))
+    tree.ops.clear()
+    
+    sync_tree(tree, _rows("a", "b", "c"))
+    
+    assert tree.ops == []
+
+
+def test_sync_matches_rows_with_minimal_moves_for_random_changes():
+    rng = random.Random(18)
+    tree = FakeTree()
+    pool = [str(i) for i in range(30)]
+    for round_number in range(200):
+        before = list(tree.children)
+        rows = [(iid, (f"{iid}-{rng.randrange(3)}",))
+                for iid in rng.sample(pool, rng.randrange(len(pool) + 1))]
+        tree.ops.clear()
+        
+        sync_tree(tree, rows)
+        
+        assert tree.rows() == rows, round_number
+        kept = [iid for iid in before if iid in dict(rows)]
+        order = [kept.index(iid) for iid, _ in rows if iid in kept]
+        assert len(tree.moves()) == len(kept) - _lis_length(order), round_number
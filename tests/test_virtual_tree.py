@@ -0,0 +1,98 @@
+"""
+회사 용어 위키 - 가상화 목록 페이지 요청 테스트
+화면 없이 돌도록 위젯을 만들지 않고 페이지 요청 상태만 검사
+"""
+
+from typing import List
+
+from ui import virtual_tree
+from ui.virtual_tree import Row, RowSource, VirtualTreeview
+
+
+class ListSource(RowSource):
+    """고정 행 목록 데이터 소스"""
+    
+    def __init__(self, count: int):
+        self.count = count
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def load(self, start: int, stop: int) -> List[Row]:
+        return [(str(i), (str(i),), None) for i in range(start, min(stop, self.count))]
+
+
+class FakeExecutor:
+    """제출한 요청의 콜백만 보관하는 QueryExecutor 대역"""
+    
+    def __init__(self):
+        self.jobs = []
+    
+    def submit(self, key, func, *args, on_done, on_error=None, **kwargs):
+        self.jobs.append((key, on_done, on_error))
+    
+    def cancel(self, key):
+        pass
+
+
+def _bare_list(source: RowSource) -> VirtualTreeview:
+    """Tk 위젯 없이 페이지 요청 상태만 가진 VirtualTreeview"""
+    view = VirtualTreeview.__new__(VirtualTreeview)
+    view.executor = FakeExecutor()
+    view._source = source
+    view._pages = {}
+    view._loading_pages = set()
+    return view
+
+
+def test_failed_page_is_requested_again(monkeypatch):
+    errors = []
+    monkeypatch.setattr(virtual_tree.messagebox, 'showerror', lambda *args: errors.append(args))
+    view = _bare_list(ListSource(500))
+    
+    view._request_page(1)
+    view._request_page(1)
+    assert len(view.executor.jobs) == 1
+    
+    _, _, on_error = view.executor.jobs[0]
+    on_error(RuntimeError("database is locked"))
+    
+    assert view._loading_pages == set() and len(errors) == 1
+    view._request_page(1)
+    assert len(view.executor.jobs) == 2
+
+
+def test_failure_for_replaced_source_is_ignored(monkeypatch):
+    errors = []
+    monkeypatch.setattr(virtual_tree.messagebox, 'showerror', lambda *args: errors.append(args))
+    view = _bare_list(ListSource(500))
+    view._request_page(0)
+    _, _, on_error = view.executor.jobs[0]
+    
+    view._source = ListSource(10)
+    view._loading_pages = {0}
+    on_error(RuntimeError("database is locked"))
+    
+    assert view._loading_pages == {0} and errors == []
+
+
+def test_loaded_page_is_applied_to_source_on_ui_thread():
+    class RecordingSource(ListSource):
+        def __init__(self, count: int):
+            super().__init__(count)
+            self.applied = []
+        
+        def page_loaded(self, start, stop, rows):
+            self.applied.append((start, stop, len(rows)))
+    
+    size = VirtualTreeview.PAGE_SIZE
+    source = RecordingSource(2 * size + 10)
+    view = _bare_list(source)
+    view._top, view._visible_rows = 0, 10
+    view._request_page(2)
+    _, on_done, _ = view.executor.jobs[0]
+    
+    on_done(source.load(2 * size, 3 * size))
+    
+    assert source.applied == [(2 * size, 3 * size, 10)]
+    assert 2 in view._pages and view._loading_pages == set()
@@ -4,7 +4,7 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, colorchooser
-from typing import Optional
+from typing import List, Optional
 import sys
 import os
 
@@ -12,6 +12,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models import Category, User
 from repository import CategoryRepository
+from ui.query_executor import QueryExecutor
+from ui.tree_sync import sync_tree
 from ui.styles import COLORS, FONTS, SIZES
 
 
@@ -21,6 +23,7 @@ class CategoryView(ttk.Frame):
     def __init__(self, parent, current_user: User):
         super().__init__(parent, style='Card.TFrame')
         self.current_user = current_user
+        self.executor = QueryExecutor(self, on_busy=self._on_busy)
         
         self._create_widgets()
         self.refresh_list()
@@ -44,6 +47,10 @@ class CategoryView(ttk.Frame):
             command=self._on_add_click
         ).pack(side='right')
         
+        # 로딩 표시
+        self.loading_label = ttk.Label(title_frame, text="")
+        self.loading_label.pack(side='right', padx=10)
+        
         # 카테고리 목록
         list_frame = ttk.Frame(self, style='Card.TFrame')
         list_frame.pack(fill='both', expand=True, padx=SIZES['padding'])
@@ -97,21 +104,28 @@ class CategoryView(ttk.Frame):
         self.tree.bind('<<TreeviewSelect>>', self._on_select)
     
     def refresh_list(self):
-        """목록 새로고침"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        categories = CategoryRepository.get_all()
-        
-        for cat in categories:
-            self.tree.insert('', 'end', iid=cat.id, values=(
-                cat.name,
-                cat.description,
-                cat.color
-            ))
+        """목록 새로고침 (백그라운드 조회)"""
+        self.executor.submit('list', CategoryRepository.get_all,
+                             on_done=self._render_categories)
+    
+    def _render_categories(self, categories: List[Category]):
+        """조회 결과로 목록 갱신 (바뀐 행만 위젯에 반영)"""
+        sync_tree(self.tree, [
+            (str(cat.id), (cat.name, cat.description, cat.color))
+            for cat in categories
+        ])
         
         self._update_button_states()
     
+    def _on_busy(self, busy: bool):
+        """로딩 표시 갱신"""
+        self.loading_label.config(text="⏳ 불러오는 중..." if busy else "")
+    
+    def destroy(self):
+        """진행 중인 조회 취소 후 위젯 제거"""
+        self.executor.shutdown()
+        super().destroy()
+    
     def _on_select(self, event):
         """선택 이벤트"""
         self._update_button_states()
@@ -136,9 +150,7 @@ class CategoryView(ttk.Frame):
         if not selection:
             return
         
-        cat_id = int(selection[0])
-        categories = CategoryRepository.get_all()
-        category = next((c for c in categories if c.id == cat_id), None)
+        category = CategoryRepository.get_by_id(int(selection[0]))
         
         if category:
             dialog = CategoryDialog(self, category)
@@ -4,26 +4,94 @@
 """
 
 import tkinter as tk
-from tkinter import ttk
-from typing import Optional
+from datetime import datetime, timedelta
+from tkinter import ttk, messagebox
+from typing import Callable, Dict, List, Optional, Tuple
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models import Term, TermHistory, User
-from repository import HistoryRepository
+from models import HistoryFilter, Term, TermHistory, User
+from repository import HistoryRepository, TermRepository, UserRepository
+from ui.query_executor import QueryExecutor
+from ui.virtual_tree import Row, RowSource, VirtualTreeview
 from ui.styles import COLORS, FONTS, SIZES
 
 
+class HistoryRowSource(RowSource):
+    """전체 히스토리를 최신순 키셋 페이지로 읽는 데이터 소스
+    
+    전체 건수를 세지 않고, 읽은 페이지 뒤에 한 페이지만 더 있는 것으로 보고한다.
+    사용자가 끝까지 스크롤해 그 페이지를 요청하면 이전 페이지 마지막 항목의
+    (changed_at, id) 키로 다음 페이지를 읽고, 결과가 한 페이지보다 적으면 끝으로 본다.
+    """
+    
+    def __init__(self, format_row: Callable[[TermHistory], tuple],
+                 history_filter: Optional[HistoryFilter] = None,
+                 page_size: int = VirtualTreeview.PAGE_SIZE):
+        self.format_row = format_row
+        self.history_filter = history_filter
+        self.page_size = page_size
+        # 페이지별 시작 키 (이전 페이지 마지막 항목, 첫 페이지는 None)
+        self._page_keys: List[Optional[Tuple[str, int]]] = [None]
+        self._total: Optional[int] = None
+    
+    def __len__(self) -> int:
+        if self._total is not None:
+            return self._total
+        return len(self._page_keys) * self.page_size
+    
+    def load(self, start: int, stop: int) -> List[Row]:
+        """[start, stop) 구간 히스토리 조회 (start는 페이지 경계)
+        
+        작업 스레드에서 호출되므로 상태는 바꾸지 않고, 다음 페이지 키와 전체 건수는
+        UI 스레드의 page_loaded()에서 반영한다.
+        """
+        history = HistoryRepository.get_page(
+            before=self._page_keys[start // self.page_size], limit=stop - start,
+            history_filter=self.history_filter
+        )
+        return [(str(h.id), self.format_row(h), h) for h in history]
+    
+    def page_loaded(self, start: int, stop: int, rows: List[Row]):
+        """읽은 페이지로 다음 페이지 시작 키 또는 전체 건수 갱신 (UI 스레드)"""
+        page = start // self.page_size
+        if len(rows) < stop - start:
+            self._total = start + len(rows)
+        elif page + 1 == len(self._page_keys):
+            last = rows[-1][2]
+            self._page_keys.append((last.changed_at, last.id))
+    
+    @staticmethod
+    def open(format_row: Callable[[TermHistory], tuple],
+             history_filter: Optional[HistoryFilter] = None) -> Tuple['HistoryRowSource', Dict[int, List[Row]]]:
+        """첫 페이지를 읽은 데이터 소스 생성 (작업 스레드)"""
+        source = HistoryRowSource(format_row, history_filter)
+        return source, {0: source.load(0, source.page_size)}
+
+
 class HistoryView(ttk.Frame):
     """전체 히스토리 뷰"""
     
-    def __init__(self, parent, current_user: User):
+    # 필터 선택지 (표시 이름 -> 조회 값)
+    ACTION_FILTERS = {"전체": None, "생성": 'create', "수정": 'update', "삭제": 'delete',
+                      "복원": 'restore'}
+    FIELD_FILTERS = {"전체": None, "용어명": 'name', "정의": 'definition',
+                     "예시": 'example', "동의어": 'synonyms'}
+    DATE_FORMAT = "%Y-%m-%d"
+    
+    def __init__(self, parent, current_user: User,
+                 on_terms_changed: Optional[Callable[[], None]] = None):
         super().__init__(parent, style='Card.TFrame')
         self.current_user = current_user
+        self.on_terms_changed = on_terms_changed  # 용어 복원 후 호출 (함께 띄운 용어 목록 갱신 등)
+        self.executor = QueryExecutor(self, on_busy=self._on_busy)
+        self.user_ids: Dict[str, int] = {}
+        self.history_filter: Optional[HistoryFilter] = None
         
         self._create_widgets()
+        self.executor.submit('users', UserRepository.get_all, on_done=self._set_users)
         self.refresh_list()
     
     def _create_widgets(self):
@@ -44,20 +112,74 @@ class HistoryView(ttk.Frame):
             command=self.refresh_list
         ).pack(side='right')
         
+        ttk.Button(
+            title_frame,
+            text="♻️ 복원",
+            command=self._restore_selected
+        ).pack(side='right', padx=(0, 5))
+        
+        # 로딩 표시
+        self.loading_label = ttk.Label(title_frame, text="")
+        self.loading_label.pack(side='right', padx=10)
+        
+        # 필터 (콤보박스는 선택 즉시, 기간은 Enter로 적용)
+        filter_frame = ttk.Frame(self, style='Card.TFrame')
+        filter_frame.pack(fill='x', padx=SIZES['padding'], pady=(0, SIZES['padding']))
+        
+        ttk.Label(filter_frame, text="사용자:").pack(side='left')
+        self.user_var = tk.StringVar(value="전체")
+        self.user_combo = ttk.Combobox(
+            filter_frame, textvariable=self.user_var, values=["전체"], state='readonly', width=12
+        )
+        self.user_combo.pack(side='left', padx=(5, 10))
+        
+        ttk.Label(filter_frame, text="작업:").pack(side='left')
+        self.action_var = tk.StringVar(value="전체")
+        action_combo = ttk.Combobox(
+            filter_frame, textvariable=self.action_var, values=list(self.ACTION_FILTERS),
+            state='readonly', width=6
+        )
+        action_combo.pack(side='left', padx=(5, 10))
+        
+        ttk.Label(filter_frame, text="필드:").pack(side='left')
+        self.field_var = tk.StringVar(value="전체")
+        field_combo = ttk.Combobox(
+            filter_frame, textvariable=self.field_var, values=list(self.FIELD_FILTERS),
+            state='readonly', width=8
+        )
+        field_combo.pack(side='left', padx=(5, 10))
+        
+        for combo in (self.user_combo, action_combo, field_combo):
+            combo.bind('<<ComboboxSelected>>', lambda e: self._apply_filter())
+        
+        ttk.Label(filter_frame, text="기간 (UTC, YYYY-MM-DD):").pack(side='left')
+        self.from_var = tk.StringVar()
+        from_entry = ttk.Entry(filter_frame, textvariable=self.from_var, width=11)
+        from_entry.pack(side='left', padx=(5, 2))
+        ttk.Label(filter_frame, text="~").pack(side='left')
+        self.to_var = tk.StringVar()
+        to_entry = ttk.Entry(filter_frame, textvariable=self.to_var, width=11)
+        to_entry.pack(side='left', padx=(2, 10))
+        for entry in (from_entry, to_entry):
+            entry.bind('<Return>', lambda e: self._apply_filter())
+        
+        ttk.Button(
+            filter_frame,
+            text="초기화",
+            command=self._reset_filter
+        ).pack(side='left')
+        
         # 히스토리 목록
         list_frame = ttk.Frame(self, style='Card.TFrame')
         list_frame.pack(fill='both', expand=True, padx=SIZES['padding'])
         
-        scrollbar = ttk.Scrollbar(list_frame)
-        scrollbar.pack(side='right', fill='y')
-        
-        self.tree = ttk.Treeview(
+        # 보이는 행만 위젯에 만드는 가상화 목록
+        self.list = VirtualTreeview(
             list_frame,
-            columns=('time', 'user', 'term', 'action', 'detail'),
-            show='headings',
-            yscrollcommand=scrollbar.set
+            self.executor,
+            columns=('time', 'user', 'term', 'action', 'detail')
         )
-        scrollbar.config(command=self.tree.yview)
+        self.tree = self.list.tree
         
         self.tree.heading('time', text='시간')
         self.tree.heading('user', text='사용자')
@@ -71,36 +193,77 @@ class HistoryView(ttk.Frame):
         self.tree.column('action', width=80)
         self.tree.column('detail', width=300)
         
-        self.tree.pack(fill='both', expand=True)
+        self.list.pack(fill='both', expand=True)
         
         # 더블클릭 상세보기
         self.tree.bind('<Double-1>', self._on_double_click)
     
     def refresh_list(self):
-        """목록 새로고침"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        history = HistoryRepository.get_all(limit=200)
+        """목록 새로고침 (백그라운드 조회)"""
+        self.executor.submit('list', HistoryRowSource.open, self._format_row, self.history_filter,
+                             on_done=self._render_history)
+    
+    def _set_users(self, users: List[User]):
+        """사용자 필터 선택지 갱신"""
+        self.user_ids = {user.username: user.id for user in users}
+        self.user_combo['values'] = ["전체"] + list(self.user_ids)
+    
+    def _parse_date(self, text: str) -> Optional[datetime]:
+        """기간 입력값 변환 (빈 값은 None, 형식이 틀리면 ValueError)"""
+        text = text.strip()
+        return datetime.strptime(text, self.DATE_FORMAT) if text else None
+    
+    def _apply_filter(self):
+        """필터 조건으로 목록 다시 조회"""
+        try:
+            changed_from = self._parse_date(self.from_var.get())
+            changed_to = self._parse_date(self.to_var.get())
+        except ValueError:
+            messagebox.showerror("오류", "기간은 YYYY-MM-DD 형식으로 입력해주세요.")
+            return
         
-        for h in history:
-            action_text = self._get_action_text(h.action_type)
-            detail_text = self._get_detail_text(h)
-            
-            self.tree.insert('', 'end', iid=h.id, values=(
-                h.changed_at or "",
-                h.changer_name,
-                h.term_name,
-                action_text,
-                detail_text
-            ))
+        history_filter = HistoryFilter(
+            changed_by=self.user_ids.get(self.user_var.get()),
+            action_type=self.ACTION_FILTERS.get(self.action_var.get()),
+            field_name=self.FIELD_FILTERS.get(self.field_var.get()),
+            changed_from=changed_from,
+            # 끝 날짜도 포함
+            changed_to=changed_to + timedelta(days=1) if changed_to else None
+        )
+        self.history_filter = history_filter if history_filter != HistoryFilter() else None
+        self.refresh_list()
+    
+    def _reset_filter(self):
+        """필터 해제"""
+        for var in (self.user_var, self.action_var, self.field_var):
+            var.set("전체")
+        self.from_var.set("")
+        self.to_var.set("")
+        self.history_filter = None
+        self.refresh_list()
+    
+    def _render_history(self, result: Tuple[HistoryRowSource, Dict[int, List[Row]]]):
+        """조회 결과로 목록 갱신"""
+        source, pages = result
+        self.list.set_source(source, pages)
+    
+    def _format_row(self, h: TermHistory) -> tuple:
+        """목록에 표시할 값"""
+        return (
+            h.changed_at or "",
+            h.changer_name,
+            h.term_name,
+            self._get_action_text(h.action_type),
+            self._get_detail_text(h)
+        )
     
     def _get_action_text(self, action_type: str) -> str:
         """작업 유형 텍스트"""
         mapping = {
             'create': '➕ 생성',
             'update': '✏️ 수정',
-            'delete': '🗑️ 삭제'
+            'delete': '🗑️ 삭제',
+            'restore': '♻️ 복원'
         }
         return mapping.get(action_type, action_type)
     
@@ -110,6 +273,8 @@ class HistoryView(ttk.Frame):
             return f"새 용어 '{h.new_value}' 생성"
         elif h.action_type == 'delete':
             return f"용어 '{h.old_value}' 삭제"
+        elif h.action_type == 'restore':
+            return f"용어 '{h.new_value}' 복원"
         elif h.action_type == 'update':
             field_names = {
                 'name': '용어명',
@@ -127,12 +292,55 @@ class HistoryView(ttk.Frame):
         if not selection:
             return
         
-        history_id = int(selection[0])
-        history = HistoryRepository.get_all(limit=500)
-        h = next((item for item in history if item.id == history_id), None)
+        iid = selection[0]
+        if iid.startswith("__"):
+            return
         
+        h = self.list.row_data(iid)
+        if h:
+            dialog = HistoryDetailDialog(self, h)
+        else:
+            # 페이지가 캐시에서 밀려난 경우 해당 항목만 조회
+            self.executor.submit('detail', HistoryRepository.get_by_id, int(iid),
+                                 on_done=self._show_detail)
+    
+    def _show_detail(self, h: Optional[TermHistory]):
+        """조회한 히스토리 상세 표시"""
         if h:
             dialog = HistoryDetailDialog(self, h)
+    
+    def _restore_selected(self):
+        """선택한 삭제 이력의 용어 복원"""
+        selection = self.tree.selection()
+        h = self.list.row_data(selection[0]) if selection else None
+        if not h or h.action_type != 'delete':
+            messagebox.showinfo("알림", "복원할 삭제 이력을 선택해주세요.")
+            return
+        
+        if not messagebox.askyesno("복원 확인", f"'{h.old_value}' 용어를 복원하시겠습니까?"):
+            return
+        
+        self.executor.submit('restore', TermRepository.restore, h.term_id, self.current_user.id,
+                             on_done=self._on_restored)
+    
+    def _on_restored(self, restored: bool):
+        """복원 결과 표시"""
+        if restored:
+            self.refresh_list()
+            if self.on_terms_changed:
+                self.on_terms_changed()
+            messagebox.showinfo("완료", "용어를 복원했습니다.")
+        else:
+            messagebox.showwarning("알림", "이미 복원됐거나 영구 삭제된 용어입니다.")
+    
+    def _on_busy(self, busy: bool):
+        """로딩 표시 갱신"""
+        self.loading_label.config(text="⏳ 불러오는 중..." if busy else "")
+    
+    def destroy(self):
+        """진행 중인 조회 취소 후 위젯 제거"""
+        self.executor.shutdown()
+        super().destroy()
 
 
 class HistoryDetailDialog(tk.Toplevel):
@@ -208,6 +416,7 @@ class TermHistoryDialog(tk.Toplevel):
     def __init__(self, parent, term: Term):
         super().__init__(parent)
         self.term = term
+        self.history_by_id: Dict[str, TermHistory] = {}
         
         self.title(f"'{term.name}' 변경 이력")
         self.geometry("600x400")
@@ -254,12 +463,37 @@ class TermHistoryDialog(tk.Toplevel):
         tree.column('new', width=120)
         
         tree.pack(fill='both', expand=True)
+        self.tree = tree
+        
+        # 더블클릭: 선택한 이력 시점의 용어 보기
+        tree.bind('<Double-1>', lambda e: self._show_as_of())
         
-        # 데이터 로드
-        history = HistoryRepository.get_by_term(self.term.id)
+        # 버튼
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(pady=(10, 0))
         
+        ttk.Button(
+            button_frame,
+            text="🕒 이 시점 보기",
+            command=self._show_as_of
+        ).pack(side='left', padx=5)
+        
+        ttk.Button(
+            button_frame,
+            text="닫기",
+            command=self.destroy
+        ).pack(side='left', padx=5)
+        
+        # 데이터 로드 (백그라운드 조회)
+        self.executor = QueryExecutor(self)
+        self.executor.submit('list', HistoryRepository.get_by_term, self.term.id,
+                             on_done=self._render_history)
+    
+    def _render_history(self, history: List[TermHistory]):
+        """조회 결과로 목록 표시"""
+        self.history_by_id = {str(h.id): h for h in history}
         for h in history:
-            tree.insert('', 'end', values=(
+            self.tree.insert('', 'end', iid=str(h.id), values=(
                 h.changed_at or "",
                 h.changer_name,
                 h.action_type,
@@ -267,10 +501,80 @@ class TermHistoryDialog(tk.Toplevel):
                 (h.old_value or "")[:30] + "..." if h.old_value and len(h.old_value) > 30 else h.old_value or "",
                 (h.new_value or "")[:30] + "..." if h.new_value and len(h.new_value) > 30 else h.new_value or ""
             ))
+    
+    def _show_as_of(self):
+        """선택한 이력 행까지 반영된 용어 조회 (백그라운드)"""
+        selection = self.tree.selection()
+        if not selection:
+            return
+        
+        h = self.history_by_id.get(selection[0])
+        self.executor.submit('as_of', HistoryRepository.get_term_as_of, self.term.id,
+                             history_id=int(selection[0]),
+                             on_done=lambda term: self._on_as_of_loaded(h, term))
+    
+    def _on_as_of_loaded(self, h: Optional[TermHistory], term: Optional[Term]):
+        """재구성한 용어 표시"""
+        if term is None:
+            messagebox.showinfo("알림", "이 시점에는 용어가 존재하지 않았습니다.")
+            return
+        dialog = TermSnapshotDialog(self, term, h.changed_at if h else "")
+    
+    def destroy(self):
+        """진행 중인 조회 취소 후 창 닫기"""
+        self.executor.shutdown()
+        super().destroy()
+
+
+class TermSnapshotDialog(tk.Toplevel):
+    """과거 시점의 용어 보기 (읽기 전용)"""
+    
+    def __init__(self, parent, term: Term, changed_at: str):
+        super().__init__(parent)
+        self.term = term
+        
+        self.title(f"'{term.name}' ({changed_at} 시점)")
+        self.geometry("500x450")
+        
+        self.transient(parent)
+        
+        self._create_widgets(changed_at)
+        
+        # 중앙 정렬
+        self.update_idletasks()
+        x = (self.winfo_screenwidth() - self.winfo_width()) // 2
+        y = (self.winfo_screenheight() - self.winfo_height()) // 2
+        self.geometry(f"+{x}+{y}")
+    
+    def _create_widgets(self, changed_at: str):
+        """위젯 생성"""
+        main_frame = ttk.Frame(self, padding=20)
+        main_frame.pack(fill='both', expand=True)
+        
+        t = self.term
+        
+        info = [
+            ("시점", changed_at),
+            ("용어명", t.name),
+            ("동의어", ", ".join(t.synonyms) or "-"),
+        ]
+        
+        for label, value in info:
+            row = ttk.Frame(main_frame)
+            row.pack(fill='x', pady=3)
+            ttk.Label(row, text=f"{label}:", width=10, style='Subtitle.TLabel').pack(side='left')
+            ttk.Label(row, text=str(value)).pack(side='left')
+        
+        for label, value in (("정의:", t.definition), ("예시:", t.example)):
+            ttk.Label(main_frame, text=label, style='Subtitle.TLabel').pack(anchor='w', pady=(15, 5))
+            text = tk.Text(main_frame, height=5, font=FONTS['body'], wrap='word')
+            text.insert('1.0', value or "")
+            text.config(state='disabled')
+            text.pack(fill='x')
         
         # 닫기 버튼
         ttk.Button(
             main_frame,
             text="닫기",
             command=self.destroy
-        ).pack(pady=(10, 0))
+        ).pack(pady=(20, 0))
@@ -4,14 +4,17 @@
 """
 
 import tkinter as tk
+from datetime import datetime, timedelta
 from tkinter import ttk, messagebox
+from typing import Optional
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models import User
-from repository import UserRepository
+from models import HistoryFilter, RevertResult, User
+from repository import TermRepository, UserRepository
+from ui.query_executor import QueryExecutor
 from ui.styles import COLORS, FONTS, SIZES, apply_styles, create_sidebar_button
 from ui.term_list_view import TermListView
 from ui.category_view import CategoryView
@@ -25,6 +28,9 @@ class MainWindow(tk.Tk):
         super().__init__()
         self.current_user = current_user
         
+        # 다이얼로그를 닫아도 결과를 받아야 하는 쓰기 작업 (수정 되돌리기 등)
+        self.executor = QueryExecutor(self)
+        
         self.title("🏢 회사 용어 위키")
         self.geometry("1100x700")
         self.minsize(900, 600)
@@ -174,17 +180,58 @@ class MainWindow(tk.Tk):
     
     def _show_user_management(self):
         """사용자 관리 다이얼로그"""
-        dialog = UserManagementDialog(self)
+        dialog = UserManagementDialog(self, self.current_user)
+    
+    def refresh_current_view(self):
+        """용어 데이터가 바뀐 뒤 현재 뷰 목록 다시 조회"""
+        if isinstance(self.current_view, (TermListView, HistoryView)):
+            self.current_view.refresh_list()
+    
+    def revert_changes(self, history_filter: HistoryFilter):
+        """수정 되돌리기 실행 (백그라운드)
+        
+        사용자 관리 다이얼로그를 닫아도 결과를 안내하고 화면을 갱신하도록
+        메인 윈도우의 실행기에서 실행한다.
+        """
+        self.executor.submit(
+            'revert', TermRepository.revert_changes, self.current_user.id, history_filter,
+            on_done=self._on_reverted,
+            on_error=lambda error: messagebox.showerror("오류", f"수정을 되돌리지 못했습니다.\n{error}")
+        )
+    
+    def _on_reverted(self, result: RevertResult):
+        """되돌리기 결과 안내 후 화면 갱신"""
+        self.refresh_current_view()
+        messagebox.showinfo("완료", revert_summary(
+            f"용어 {result.term_count}개의 필드 {result.field_count}개를 되돌렸습니다.", result
+        ))
+    
+    def destroy(self):
+        """진행 중인 작업 취소 후 창 닫기"""
+        self.executor.shutdown()
+        super().destroy()
+
+
+def revert_summary(headline: str, result: RevertResult) -> str:
+    """되돌리기 결과 안내 문구"""
+    lines = [headline]
+    if result.conflicts:
+        lines.append(f"이후 다른 수정이 있어 건너뛴 필드: {len(result.conflicts)}개")
+    return "\n".join(lines)
 
 
 class UserManagementDialog(tk.Toplevel):
     """사용자 관리 다이얼로그"""
     
-    def __init__(self, parent):
+    DATE_FORMAT = "%Y-%m-%d"
+    
+    def __init__(self, parent, current_user: User):
         super().__init__(parent)
+        self.current_user = current_user
+        self.executor = QueryExecutor(self)
         
         self.title("⚙️ 사용자 관리")
-        self.geometry("500x400")
+        self.geometry("500x460")
         
         self.transient(parent)
         
@@ -245,6 +292,23 @@ class UserManagementDialog(tk.Toplevel):
             text="닫기",
             command=self.destroy
         ).pack(side='right')
+        
+        # 선택한 사용자의 기간 내 수정 되돌리기
+        revert_frame = ttk.Frame(main_frame)
+        revert_frame.pack(fill='x', pady=(10, 0))
+        
+        ttk.Label(revert_frame, text="기간 (UTC, YYYY-MM-DD):").pack(side='left')
+        self.from_var = tk.StringVar()
+        ttk.Entry(revert_frame, textvariable=self.from_var, width=11).pack(side='left', padx=(5, 2))
+        ttk.Label(revert_frame, text="~").pack(side='left')
+        self.to_var = tk.StringVar()
+        ttk.Entry(revert_frame, textvariable=self.to_var, width=11).pack(side='left', padx=(2, 5))
+        
+        ttk.Button(
+            revert_frame,
+            text="↩️ 수정 되돌리기",
+            command=self._on_revert_click
+        ).pack(side='right')
     
     def refresh_list(self):
         """목록 새로고침"""
@@ -274,3 +338,50 @@ class UserManagementDialog(tk.Toplevel):
         
         role_text = "관리자" if new_role == 'admin' else "일반 사용자"
         messagebox.showinfo("완료", f"권한이 {role_text}(으)로 변경되었습니다.")
+    
+    def _revert_filter(self) -> Optional[HistoryFilter]:
+        """선택한 사용자와 기간의 되돌리기 조건 (입력이 잘못되면 안내 후 None)"""
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("알림", "사용자를 선택해주세요.")
+            return None
+        
+        try:
+            changed_from = datetime.strptime(self.from_var.get().strip(), self.DATE_FORMAT)
+            # 끝 날짜도 포함
+            changed_to = datetime.strptime(self.to_var.get().strip(), self.DATE_FORMAT) + timedelta(days=1)
+        except ValueError:
+            messagebox.showerror("오류", "기간은 YYYY-MM-DD 형식으로 입력해주세요.")
+            return None
+        
+        return HistoryFilter(changed_by=int(selection[0]), action_type='update',
+                             changed_from=changed_from, changed_to=changed_to)
+    
+    def _on_revert_click(self):
+        """되돌릴 내용 미리 계산 (백그라운드)"""
+        history_filter = self._revert_filter()
+        if history_filter is None:
+            return
+        self.executor.submit(
+            'revert', TermRepository.revert_changes, self.current_user.id, history_filter,
+            dry_run=True,
+            on_done=lambda result: self._confirm_revert(history_filter, result)
+        )
+    
+    def _confirm_revert(self, history_filter: HistoryFilter, preview: RevertResult):
+        """미리 계산한 결과 확인 후 되돌리기 실행"""
+        if not preview.term_count:
+            messagebox.showinfo("알림", revert_summary("되돌릴 수정이 없습니다.", preview))
+            return
+        
+        message = revert_summary(
+            f"용어 {preview.term_count}개의 필드 {preview.field_count}개를 되돌립니다.", preview
+        )
+        if messagebox.askyesno("수정 되돌리기", message + "\n\n계속하시겠습니까?"):
+            # 창을 닫아도 결과를 받도록 메인 윈도우에서 실행
+            self.master.revert_changes(history_filter)
+    
+    def destroy(self):
+        """진행 중인 작업 취소 후 창 닫기"""
+        self.executor.shutdown()
+        super().destroy()
@@ -0,0 +1,152 @@
+"""
+회사 용어 위키 - 백그라운드 조회 실행기
+리포지토리 조회를 작업 스레드에서 실행하고 결과를 Tk 메인 스레드로 전달
+"""
+
+import queue
+import threading
+from tkinter import messagebox
+from typing import Any, Callable, Dict, Optional, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import QueryCancelled
+
+
+# 공용 작업 스레드 수 (연결 풀 크기보다 작게 유지)
+WORKER_COUNT = 3
+
+_jobs: queue.Queue = queue.Queue()
+_workers = []
+_workers_lock = threading.Lock()
+
+
+def _worker_loop():
+    """작업 큐에서 조회를 꺼내 실행 (위젯에 접근하지 않음)"""
+    while True:
+        func, args, kwargs, cancel, results, key, generation = _jobs.get()
+        if cancel.is_set():
+            continue
+        try:
+            result = func(*args, **kwargs)
+        except QueryCancelled:
+            continue
+        except Exception as e:
+            results.put((key, generation, None, e))
+        else:
+            results.put((key, generation, result, None))
+
+
+def _ensure_workers():
+    """작업 스레드 시작 (최초 사용 시)"""
+    with _workers_lock:
+        while len(_workers) < WORKER_COUNT:
+            worker = threading.Thread(target=_worker_loop, name="query-worker", daemon=True)
+            worker.start()
+            _workers.append(worker)
+
+
+class QueryExecutor:
+    """위젯 단위 백그라운드 조회 실행기
+    
+    submit()한 조회는 공용 작업 스레드에서 실행되고, 결과는 위젯의 after()
+    폴링으로 메인 스레드에서 콜백에 전달된다. 같은 key로 다시 요청하면 세대
+    번호가 올라가며 이전 요청은 취소되고, 늦게 도착한 이전 결과는 버려진다.
+    """
+    
+    # 결과 확인 주기 (ms)
+    POLL_MS = 30
+    
+    def __init__(self, widget, on_busy: Optional[Callable[[bool], None]] = None):
+        self.widget = widget
+        self.on_busy = on_busy
+        self._results: queue.Queue = queue.Queue()
+        self._generations: Dict[str, int] = {}
+        self._pending: Dict[str, Tuple[threading.Event, Callable, Optional[Callable]]] = {}
+        self._poll_after_id = None
+        _ensure_workers()
+    
+    def submit(self, key: str, func: Callable, *args,
+               on_done: Callable[[Any], None],
+               on_error: Optional[Callable[[Exception], None]] = None,
+               cancellable: bool = False, **kwargs) -> int:
+        """조회 요청 (반환: 세대 번호)
+        
+        cancellable이면 func에 cancel=threading.Event를 넘겨 실행 중인 SQL도 중단한다.
+        """
+        was_busy = self.is_busy()
+        previous = self._pending.pop(key, None)
+        if previous is not None:
+            previous[0].set()
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        
+        cancel = threading.Event()
+        if cancellable:
+            kwargs['cancel'] = cancel
+        self._pending[key] = (cancel, on_done, on_error)
+        _jobs.put((func, args, kwargs, cancel, self._results, key, generation))
+        
+        if not was_busy:
+            self._notify_busy(True)
+        if self._poll_after_id is None:
+            self._poll_after_id = self.widget.after(self.POLL_MS, self._poll)
+        return generation
+    
+    def cancel(self, key: str):
+        """진행 중인 요청 취소"""
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending[0].set()
+            if not self.is_busy():
+                self._notify_busy(False)
+    
+    def is_busy(self, key: Optional[str] = None) -> bool:
+        """진행 중인 요청 여부"""
+        if key is None:
+            return bool(self._pending)
+        return key in self._pending
+    
+    def shutdown(self):
+        """모든 요청 취소 및 폴링 중지 (위젯 제거 시 호출)"""
+        for cancel, _, _ in self._pending.values():
+            cancel.set()
+        self._pending.clear()
+        if self._poll_after_id is not None:
+            self.widget.after_cancel(self._poll_after_id)
+            self._poll_after_id = None
+    
+    def _notify_busy(self, busy: bool):
+        """로딩 표시 갱신"""
+        if self.on_busy:
+            self.on_busy(busy)
+    
+    def _poll(self):
+        """도착한 결과 중 최신 세대만 콜백 호출"""
+        self._poll_after_id = None
+        if not self.widget.winfo_exists():
+            return
+        
+        while True:
+            try:
+                key, generation, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generations.get(key) or key not in self._pending:
+                continue
+            
+            _, on_done, on_error = self._pending.pop(key)
+            if not self._pending:
+                self._notify_busy(False)
+            
+            if error is None:
+                on_done(result)
+            elif on_error:
+                on_error(error)
+            else:
+                messagebox.showerror("오류", f"데이터를 불러오지 못했습니다.\n{error}")
+        
+        if self._pending and self._poll_after_id is None:
+            self._poll_after_id = self.widget.after(self.POLL_MS, self._poll)
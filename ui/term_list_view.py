@@ -5,7 +5,7 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import sys
 import os
 
@@ -13,18 +13,82 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models import Term, Category, User
 from repository import TermRepository, CategoryRepository
+import cache
+from hangul import is_chosung_query
+from ui.query_executor import QueryExecutor
+from ui.virtual_tree import Row, RowSource, VirtualTreeview
 from ui.styles import COLORS, FONTS, SIZES
 
 
+class TermRowSource(RowSource):
+    """검색 결과 용어 ID 목록을 구간 단위로 읽는 데이터 소스"""
+    
+    # 검색 후 삭제된 용어 행에 표시할 이름
+    DELETED_LABEL = "(삭제됨)"
+    
+    def __init__(self, term_ids: List[int]):
+        self.term_ids = term_ids
+    
+    def __len__(self) -> int:
+        return len(self.term_ids)
+    
+    def neighbors(self, index: int, radius: int) -> List[int]:
+        """index 앞뒤 radius개 행의 용어 ID"""
+        return self.term_ids[max(index - radius, 0):index + radius + 1]
+    
+    def load(self, start: int, stop: int) -> List[Row]:
+        """[start, stop) 구간 용어 요약 조회 (전체 용어는 선택할 때 읽음)
+        
+        검색 후 삭제된 용어는 뒤 행이 밀리지 않도록 자리 표시 행으로 채운다.
+        """
+        term_ids = self.term_ids[start:stop]
+        summaries = {summary.id: summary for summary in TermRepository.get_summaries(term_ids)}
+        rows = []
+        for term_id in term_ids:
+            summary = summaries.get(term_id)
+            if summary is None:
+                rows.append((str(term_id), (self.DELETED_LABEL, "", ""), None))
+            else:
+                rows.append((str(term_id),
+                             (summary.name, summary.definition_preview, summary.category_names),
+                             summary))
+        return rows
+    
+    @staticmethod
+    def search(search_query: str, category_name: Optional[str], mode: str, around: int = 0,
+               cancel=None) -> Tuple['TermRowSource', Dict[int, List[Row]]]:
+        """검색 후 around 위치의 페이지까지 미리 읽은 데이터 소스 생성 (작업 스레드)
+        
+        category_name은 여기서 ID로 바꾼다 (카테고리 목록이 바뀌었으면 DB를 읽으므로).
+        """
+        category = CategoryRepository.get_by_name(category_name) if category_name else None
+        category_id = category.id if category else None
+        source = TermRowSource(
+            TermRepository.search_ids(search_query, category_id, mode, cancel=cancel)
+        )
+        page = min(around, max(len(source) - 1, 0)) // VirtualTreeview.PAGE_SIZE
+        start = page * VirtualTreeview.PAGE_SIZE
+        return source, {page: source.load(start, start + VirtualTreeview.PAGE_SIZE)}
+
+
 class TermListView(ttk.Frame):
     """용어 목록 뷰"""
     
+    # 검색어 입력 후 조회까지 대기 시간 (ms)
+    SEARCH_DELAY_MS = 250
+    # 선택한 행 앞뒤로 미리 읽어 둘 용어 수
+    PREFETCH_RADIUS = 20
+    
     def __init__(self, parent, current_user: User, on_term_select: Callable[[Term], None] = None):
         super().__init__(parent, style='Card.TFrame')
         self.current_user = current_user
         self.on_term_select = on_term_select
         self.selected_term: Optional[Term] = None
         
+        self._search_after_id = None
+        self._selecting_id: Optional[int] = None
+        self.executor = QueryExecutor(self, on_busy=self._on_busy)
+        
         self._create_widgets()
         self.refresh_list()
     
@@ -38,14 +102,24 @@ class TermListView(ttk.Frame):
         ttk.Label(search_frame, text="🔍 검색:").pack(side='left')
         
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', lambda *args: self.refresh_list())
+        self.search_var.trace('w', lambda *args: self._schedule_search())
         
         self.search_entry = ttk.Entry(
             search_frame,
             textvariable=self.search_var,
             width=30
         )
-        self.search_entry.pack(side='left', padx=(5, 15))
+        self.search_entry.pack(side='left', padx=(5, 5))
+        self.search_entry.bind('<Return>', lambda e: self._start_search())
+        
+        # 유사 검색 (오타 허용)
+        self.fuzzy_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            search_frame,
+            text="유사 검색",
+            variable=self.fuzzy_var,
+            command=self._start_search
+        ).pack(side='left', padx=(0, 15))
         
         # 카테고리 필터
         ttk.Label(search_frame, text="카테고리:").pack(side='left')
@@ -58,16 +132,14 @@ class TermListView(ttk.Frame):
             width=15
         )
         self.category_combo.pack(side='left', padx=5)
-        self.category_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_list())
-        
-        self._update_category_combo()
+        self.category_combo.bind('<<ComboboxSelected>>', lambda e: self._start_search())
         
         # 새로고침 버튼
         refresh_btn = ttk.Button(
             search_frame,
             text="🔄",
             width=3,
-            command=self.refresh_list
+            command=self._on_refresh_click
         )
         refresh_btn.pack(side='left', padx=5)
         
@@ -75,18 +147,14 @@ class TermListView(ttk.Frame):
         list_frame = ttk.Frame(self, style='Card.TFrame')
         list_frame.pack(fill='both', expand=True, padx=SIZES['padding'])
         
-        # 스크롤바
-        scrollbar = ttk.Scrollbar(list_frame)
-        scrollbar.pack(side='right', fill='y')
-        
-        self.tree = ttk.Treeview(
+        # 보이는 행만 위젯에 만드는 가상화 목록
+        self.list = VirtualTreeview(
             list_frame,
+            self.executor,
             columns=('name', 'definition', 'categories'),
-            show='headings',
-            selectmode='browse',
-            yscrollcommand=scrollbar.set
+            selectmode='browse'
         )
-        scrollbar.config(command=self.tree.yview)
+        self.tree = self.list.tree
         
         # 컬럼 설정
         self.tree.heading('name', text='용어명')
@@ -97,10 +165,10 @@ class TermListView(ttk.Frame):
         self.tree.column('definition', width=400, minwidth=200)
         self.tree.column('categories', width=150, minwidth=100)
         
-        self.tree.pack(fill='both', expand=True)
+        self.list.pack(fill='both', expand=True)
         
         # 선택 이벤트
-        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<<TreeviewSelect>>', self._on_select, add='+')
         self.tree.bind('<Double-1>', self._on_double_click)
         
         # 하단 버튼 영역
@@ -133,61 +201,141 @@ class TermListView(ttk.Frame):
         # 용어 수 표시
         self.count_label = ttk.Label(button_frame, text="")
         self.count_label.pack(side='right')
+        
+        # 로딩 표시
+        self.loading_label = ttk.Label(button_frame, text="")
+        self.loading_label.pack(side='right', padx=10)
     
     def _update_category_combo(self):
-        """카테고리 콤보박스 업데이트"""
-        categories = CategoryRepository.get_all()
+        """카테고리 콤보박스 업데이트 (백그라운드 조회)"""
+        self.executor.submit('categories', CategoryRepository.get_all,
+                             on_done=self._on_categories_loaded)
+    
+    def _on_categories_loaded(self, categories: List[Category]):
+        """카테고리 조회 결과 반영"""
         values = ["전체"] + [c.name for c in categories]
         self.category_combo['values'] = values
-        self._categories = {c.name: c for c in categories}
     
     def refresh_list(self):
-        """목록 새로고침"""
-        # 기존 항목 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """목록 새로고침 (카테고리 목록 포함, 스크롤 위치와 선택 유지)"""
+        self._update_category_combo()
+        self._start_search(keep_position=True)
+    
+    def _on_refresh_click(self):
+        """새로고침 버튼 (다른 사용자의 변경을 반영하도록 캐시를 무효화)"""
+        cache.bump('terms', 'categories')
+        self.refresh_list()
+    
+    def _schedule_search(self):
+        """검색어 입력 시 조회 예약
+        
+        입력이 SEARCH_DELAY_MS 동안 멈추면 조회한다. 새 입력이 들어오면
+        예약을 다시 잡고, 진행 중인 이전 조회는 즉시 취소한다.
+        """
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self.executor.cancel('search')
+        self._search_after_id = self.after(self.SEARCH_DELAY_MS, self._start_search)
+    
+    def _start_search(self, keep_position: bool = False):
+        """현재 검색 조건으로 백그라운드 조회 시작"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         
         # 검색 및 필터 적용
         search_query = self.search_var.get()
         category_name = self.category_var.get()
+        if category_name == "전체":
+            category_name = None
         
-        category_id = None
-        if category_name != "전체" and category_name in self._categories:
-            category_id = self._categories[category_name].id
+        # 용어 조회 (자음만 입력하면 초성 검색)
+        if is_chosung_query(search_query):
+            mode = "chosung"
+        elif self.fuzzy_var.get():
+            mode = "fuzzy"
+        else:
+            mode = "text"
         
-        # 용어 조회
-        terms = TermRepository.get_all(search_query, category_id)
-        
-        for term in terms:
-            categories_str = ", ".join(c.name for c in term.categories)
-            definition_preview = term.definition[:80] + "..." if len(term.definition) > 80 else term.definition
-            
-            self.tree.insert('', 'end', iid=term.id, values=(
-                term.name,
-                definition_preview,
-                categories_str
-            ))
+        # 이전 조회는 취소되고, 늦게 도착한 결과는 버려짐
+        around = self.list.top_index() if keep_position else 0
+        self.executor.submit(
+            'search', TermRowSource.search, search_query, category_name, mode, around,
+            on_done=lambda result: self._render_terms(result, keep_position),
+            cancellable=True
+        )
+    
+    def _on_busy(self, busy: bool):
+        """로딩 표시 갱신"""
+        self.loading_label.config(text="⏳ 불러오는 중..." if busy else "")
+    
+    def _render_terms(self, result: Tuple[TermRowSource, Dict[int, List[Row]]],
+                      keep_position: bool = False):
+        """조회 결과로 목록 갱신 (바뀐 행만 위젯에 반영)"""
+        source, pages = result
+        self.list.set_source(source, pages, keep_position)
         
         # 용어 수 표시
-        self.count_label.config(text=f"총 {len(terms)}개 용어")
-        
-        # 카테고리 콤보 업데이트
-        self._update_category_combo()
+        self.count_label.config(text=f"총 {len(source)}개 용어")
         
-        # 선택 초기화
+        # 선택 초기화 (선택을 유지하는 경우 편집된 내용으로 다시 조회)
         self.selected_term = None
         self._update_button_states()
+        if keep_position:
+            self._on_select(None)
+    
+    def destroy(self):
+        """예약된 조회 취소 후 위젯 제거"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self.executor.shutdown()
+        super().destroy()
     
     def _on_select(self, event):
         """용어 선택 이벤트"""
-        selection = self.tree.selection()
-        if selection:
-            term_id = int(selection[0])
-            self.selected_term = TermRepository.get_by_id(term_id)
-            self._update_button_states()
-            
-            if self.on_term_select and self.selected_term:
-                self.on_term_select(self.selected_term)
+        iid = self.list.selected_iid()
+        if iid is None:
+            return
+        
+        # 스크롤로 같은 행이 다시 선택된 경우
+        term_id = int(iid)
+        if self.selected_term and self.selected_term.id == term_id:
+            return
+        
+        # 캐시에 있으면 바로 표시 (방향키로 이동할 때 I/O를 기다리지 않음)
+        cached = TermRepository.get_cached(term_id)
+        if cached:
+            self.executor.cancel('select')
+            self._on_term_loaded(cached)
+        elif not (self.executor.is_busy('select') and self._selecting_id == term_id):
+            self._selecting_id = term_id
+            self.executor.submit('select', TermRepository.get_by_id, term_id,
+                                 on_done=self._on_term_loaded)
+        
+        self._prefetch_neighbors()
+    
+    def _prefetch_neighbors(self):
+        """선택한 행 앞뒤 용어를 백그라운드에서 캐시에 읽어 둠"""
+        index = self.list.selected_index()
+        source = self.list.source()
+        if index is None or not isinstance(source, TermRowSource):
+            return
+        
+        self.executor.submit('prefetch', TermRepository.prefetch,
+                             source.neighbors(index, self.PREFETCH_RADIUS),
+                             on_done=lambda result: None)
+    
+    def _on_term_loaded(self, term: Optional[Term]):
+        """선택한 용어 조회 결과 반영 (그 사이 선택이 바뀌었으면 무시)"""
+        if term is None or str(term.id) != self.list.selected_iid():
+            return
+        
+        self.selected_term = term
+        self._update_button_states()
+        
+        if self.on_term_select:
+            self.on_term_select(self.selected_term)
     
     def _on_double_click(self, event):
         """더블클릭 편집"""
@@ -226,7 +374,7 @@ class TermListView(ttk.Frame):
         
         if messagebox.askyesno(
             "삭제 확인",
-            f"'{self.selected_term.name}' 용어를 삭제하시겠습니까?\n\n삭제 후에도 히스토리에서 확인할 수 있습니다."
+            f"'{self.selected_term.name}' 용어를 삭제하시겠습니까?\n\n삭제 후에도 히스토리에서 확인하고 복원할 수 있습니다."
         ):
             TermRepository.delete(self.selected_term.id, self.current_user.id)
             self.refresh_list()
@@ -0,0 +1,77 @@
+"""
+회사 용어 위키 - Treeview 증분 갱신
+새 행 목록과 현재 항목을 iid 기준으로 비교해 바뀐 부분만 위젯에 반영
+"""
+
+from bisect import bisect_left
+from tkinter import ttk
+from typing import Dict, List, Sequence, Set, Tuple
+
+
+def _stable_positions(old_positions: List[int]) -> Set[int]:
+    """제자리에 둘 항목 (기존 위치의 최장 증가 부분 수열, 반환: 새 목록 인덱스)"""
+    tails: List[int] = []       # 길이별 마지막 기존 위치
+    tail_index: List[int] = []  # 길이별 마지막 항목의 새 목록 인덱스
+    previous: List[int] = []
+    for i, position in enumerate(old_positions):
+        if position < 0:
+            previous.append(-1)
+            continue
+        length = bisect_left(tails, position)
+        if length == len(tails):
+            tails.append(position)
+            tail_index.append(i)
+        else:
+            tails[length] = position
+            tail_index[length] = i
+        previous.append(tail_index[length - 1] if length else -1)
+    
+    stable = set()
+    i = tail_index[-1] if tail_index else -1
+    while i >= 0:
+        stable.add(i)
+        i = previous[i]
+    return stable
+
+
+def sync_tree(tree: ttk.Treeview, rows: Sequence[Tuple[str, tuple]]):
+    """Treeview 최상위 항목을 rows [(iid, values), ...]와 같아지도록 갱신
+    
+    사라진 항목은 삭제, 값이 바뀐 항목은 수정, 새 항목은 삽입하고, 순서가 어긋난
+    항목만 이동한다 (순서가 유지된 항목 중 가장 긴 부분 수열은 움직이지 않음).
+    마지막으로 반영한 값은 위젯에 보관해 두고 비교하므로 값 조회에 Tk 호출이 들지 않는다.
+    """
+    shown: Dict[str, tuple] = getattr(tree, '_synced_values', None)
+    current = tree.get_children()
+    if shown is None or len(shown) != len(current):
+        shown = {iid: tuple(tree.item(iid, 'values')) for iid in current}
+    
+    wanted = {str(iid) for iid, _ in rows}
+    removed = [iid for iid in current if iid not in wanted]
+    if removed:
+        tree.delete(*removed)
+        for iid in removed:
+            shown.pop(iid, None)
+    
+    old_index = {iid: i for i, iid in enumerate(iid for iid in current if iid in wanted)}
+    stable = _stable_positions([old_index.get(str(iid), -1) for iid, _ in rows])
+    
+    previous = None
+    for i, (iid, values) in enumerate(rows):
+        iid = str(iid)
+        values = tuple(values)
+        if iid not in old_index:
+            index = tree.index(previous) + 1 if previous is not None else 0
+            tree.insert('', index, iid=iid, values=values)
+        else:
+            if i not in stable:
+                # 떼어낸 뒤 위치를 구해야 자기 자신이 인덱스 계산에 끼지 않는다
+                tree.detach(iid)
+                index = tree.index(previous) + 1 if previous is not None else 0
+                tree.move(iid, '', index)
+            if shown.get(iid) != values:
+                tree.item(iid, values=values)
+        shown[iid] = values
+        previous = iid
+    
+    tree._synced_values = shown
@@ -0,0 +1,283 @@
+"""
+회사 용어 위키 - 가상화 목록
+보이는 행만 Treeview에 만들고 나머지는 데이터 소스에서 페이지 단위로 읽는 목록 위젯
+"""
+
+from abc import ABC, abstractmethod
+from tkinter import ttk, messagebox
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.query_executor import QueryExecutor
+from ui.tree_sync import sync_tree
+
+
+# 행: (iid, Treeview 값, 원본 데이터)
+Row = Tuple[str, tuple, Any]
+
+
+class RowSource(ABC):
+    """VirtualTreeview 데이터 소스
+    
+    __len__()은 전체 행 수, load(start, stop)은 [start, stop) 구간의 행 목록을 반환한다.
+    load()는 작업 스레드에서 호출되므로 위젯에 접근하거나 __len__()이 읽는 상태를
+    바꾸면 안 된다. 읽은 결과로 상태를 바꿔야 하면 UI 스레드에서 호출되는
+    page_loaded()에서 바꾼다.
+    """
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        """전체 행 수"""
+    
+    @abstractmethod
+    def load(self, start: int, stop: int) -> List[Row]:
+        """[start, stop) 구간의 행 목록 (구간의 행 수만큼, 위치가 밀리지 않도록)"""
+    
+    def page_loaded(self, start: int, stop: int, rows: List[Row]):
+        """load(start, stop) 결과가 목록에 반영되기 직전 호출 (UI 스레드, 기본은 아무것도 안 함)"""
+
+
+class VirtualTreeview(ttk.Frame):
+    """가상화 Treeview
+    
+    행이 수십만 개여도 위젯에는 화면에 보이는 행만 존재한다. 스크롤바, 마우스 휠,
+    방향키는 표시 구간의 시작 위치(top)만 옮기고, 구간의 행은 PAGE_SIZE 단위로
+    데이터 소스에서 읽어 최근 CACHE_PAGES개 페이지만 메모리에 유지한다.
+    """
+    
+    # 데이터 소스에서 한 번에 읽는 행 수 / 메모리에 유지할 페이지 수
+    PAGE_SIZE = 200
+    CACHE_PAGES = 5
+    
+    # 마우스 휠 한 칸당 이동할 행 수
+    WHEEL_ROWS = 3
+    
+    def __init__(self, parent, executor: QueryExecutor, columns: tuple, **tree_options):
+        super().__init__(parent, style='Card.TFrame')
+        self.executor = executor
+        self.columns = columns
+        
+        self._source: Optional[RowSource] = None
+        self._pages: Dict[int, List[Row]] = {}
+        self._loading_pages = set()
+        self._top = 0
+        self._visible_rows = 1
+        self._selected_iid: Optional[str] = None
+        
+        scrollbar = ttk.Scrollbar(self, command=self._on_scrollbar)
+        scrollbar.pack(side='right', fill='y')
+        self.scrollbar = scrollbar
+        
+        self.tree = ttk.Treeview(self, columns=columns, show='headings', **tree_options)
+        self.tree.pack(fill='both', expand=True)
+        
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select, add='+')
+        self.tree.bind('<MouseWheel>', self._on_mouse_wheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-self.WHEEL_ROWS))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(self.WHEEL_ROWS))
+        self.tree.bind('<Up>', lambda e: self._move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self._move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self._move_selection(-self._visible_rows))
+        self.tree.bind('<Next>', lambda e: self._move_selection(self._visible_rows))
+        self.tree.bind('<Home>', lambda e: self._move_selection(-len(self)))
+        self.tree.bind('<End>', lambda e: self._move_selection(len(self)))
+    
+    def __len__(self) -> int:
+        return len(self._source) if self._source is not None else 0
+    
+    def set_source(self, source: RowSource, preloaded: Optional[Dict[int, List[Row]]] = None,
+                   keep_position: bool = False):
+        """데이터 소스 교체
+        
+        preloaded: 미리 읽어 둔 페이지 {페이지 번호: 행 목록}
+        keep_position: 스크롤 위치와 선택 유지 (편집 후 새로고침)
+        """
+        for page in self._loading_pages:
+            self.executor.cancel(self._page_key(page))
+        self._loading_pages.clear()
+        
+        self._source = source
+        self._pages = dict(preloaded or {})
+        for page, rows in self._pages.items():
+            start = page * self.PAGE_SIZE
+            source.page_loaded(start, start + self.PAGE_SIZE, rows)
+        if not keep_position:
+            self._top = 0
+            self._selected_iid = None
+        self._render()
+    
+    def top_index(self) -> int:
+        """표시 구간의 첫 행 위치"""
+        return self._top
+    
+    def source(self) -> Optional[RowSource]:
+        """현재 데이터 소스"""
+        return self._source
+    
+    def selected_index(self) -> Optional[int]:
+        """선택한 행의 위치 (표시 구간 밖이면 None)"""
+        children = self.tree.get_children()
+        if self._selected_iid in children:
+            return self._top + children.index(self._selected_iid)
+        return None
+    
+    def selected_iid(self) -> Optional[str]:
+        """선택한 행의 iid (스크롤로 화면 밖에 있어도 유지)"""
+        return self._selected_iid
+    
+    def row_data(self, iid: str) -> Any:
+        """메모리에 있는 행의 원본 데이터 (없으면 None)"""
+        for rows in self._pages.values():
+            for row_iid, _, data in rows:
+                if row_iid == iid:
+                    return data
+        return None
+    
+    def scroll(self, delta: int):
+        """delta 행만큼 스크롤"""
+        self.scroll_to(self._top + delta)
+    
+    def scroll_to(self, top: int):
+        """표시 구간 시작 위치 이동"""
+        top = max(0, min(top, len(self) - self._visible_rows))
+        if top != self._top:
+            self._top = top
+            self._render()
+    
+    def _render(self):
+        """표시 구간의 행만 Treeview에 반영"""
+        total = len(self)
+        self._top = max(0, min(self._top, total - self._visible_rows))
+        stop = min(self._top + self._visible_rows, total)
+        
+        rows = [self._row_at(index) for index in range(self._top, stop)]
+        sync_tree(self.tree, [(iid, values) for iid, values, _ in rows])
+        
+        if (self._selected_iid is not None and self.tree.exists(self._selected_iid)
+                and self.tree.selection() != (self._selected_iid,)):
+            self.tree.selection_set(self._selected_iid)
+        
+        if total:
+            self.scrollbar.set(self._top / total, stop / total)
+        else:
+            self.scrollbar.set(0, 1)
+        
+        self._trim_cache()
+    
+    def _row_at(self, index: int) -> Row:
+        """index번째 행 (아직 읽지 않았으면 자리 표시 행을 반환하고 페이지 요청)"""
+        page, offset = divmod(index, self.PAGE_SIZE)
+        rows = self._pages.get(page)
+        if rows is None:
+            self._request_page(page)
+            return (f"__loading_{index}", ("…",) + ("",) * (len(self.columns) - 1), None)
+        if offset >= len(rows):
+            return (f"__missing_{index}", ("",) * len(self.columns), None)
+        return rows[offset]
+    
+    def _page_key(self, page: int) -> str:
+        """페이지 조회 요청 키"""
+        return f"page:{page}"
+    
+    def _request_page(self, page: int):
+        """페이지 백그라운드 조회"""
+        if page in self._loading_pages:
+            return
+        self._loading_pages.add(page)
+        
+        source = self._source
+        start = page * self.PAGE_SIZE
+        self.executor.submit(
+            self._page_key(page), source.load, start, start + self.PAGE_SIZE,
+            on_done=lambda rows: self._on_page_loaded(source, page, rows),
+            on_error=lambda error: self._on_page_failed(source, page, error)
+        )
+    
+    def _on_page_loaded(self, source: RowSource, page: int, rows: List[Row]):
+        """페이지 조회 결과 반영 (그 사이 소스가 바뀌었으면 무시)"""
+        if source is not self._source:
+            return
+        self._loading_pages.discard(page)
+        start = page * self.PAGE_SIZE
+        source.page_loaded(start, start + self.PAGE_SIZE, rows)
+        self._pages[page] = rows
+        
+        first, last = self._top // self.PAGE_SIZE, (self._top + self._visible_rows) // self.PAGE_SIZE
+        if first <= page <= last:
+            self._render()
+    
+    def _on_page_failed(self, source: RowSource, page: int, error: Exception):
+        """페이지 조회 실패 (요청 표시를 지워 다음 렌더링에서 다시 요청)"""
+        if source is not self._source:
+            return
+        self._loading_pages.discard(page)
+        messagebox.showerror("오류", f"목록을 불러오지 못했습니다.\n{error}")
+    
+    def _trim_cache(self):
+        """표시 구간에서 먼 페이지부터 캐시에서 제거"""
+        if len(self._pages) <= self.CACHE_PAGES:
+            return
+        current = self._top // self.PAGE_SIZE
+        for page in sorted(self._pages, key=lambda p: abs(p - current))[self.CACHE_PAGES:]:
+            del self._pages[page]
+    
+    def _on_resize(self, event):
+        """보이는 행 수 재계산"""
+        rowheight = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        # 헤더 한 줄을 제외한 높이
+        visible_rows = max(1, event.height // rowheight - 1)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._render()
+    
+    def _on_tree_select(self, event):
+        """선택 행 기억 (스크롤로 위젯에서 사라져도 유지)"""
+        selection = self.tree.selection()
+        if selection and not selection[0].startswith("__"):
+            self._selected_iid = selection[0]
+    
+    def _on_scrollbar(self, *args):
+        """스크롤바 이동"""
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self)))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= self._visible_rows
+            self.scroll(amount)
+    
+    def _on_mouse_wheel(self, event):
+        """마우스 휠 스크롤 (Windows/macOS)"""
+        steps = -event.delta // 120 if abs(event.delta) >= 120 else -event.delta
+        self.scroll(steps * self.WHEEL_ROWS)
+        return 'break'
+    
+    def _move_selection(self, delta: int):
+        """방향키 선택 이동 (표시 구간 밖이면 스크롤)"""
+        total = len(self)
+        if not total:
+            return 'break'
+        
+        selection = self.tree.selection()
+        children = self.tree.get_children()
+        if selection and selection[0] in children:
+            index = self._top + children.index(selection[0])
+        else:
+            index = self._top - 1 if delta > 0 else self._top + self._visible_rows
+        index = max(0, min(index + delta, total - 1))
+        
+        if index < self._top:
+            self.scroll_to(index)
+        elif index >= self._top + self._visible_rows:
+            self.scroll_to(index - self._visible_rows + 1)
+        
+        children = self.tree.get_children()
+        position = index - self._top
+        if 0 <= position < len(children) and not children[position].startswith("__"):
+            self.tree.selection_set(children[position])
+            self.tree.focus(children[position])
+        return 'break'